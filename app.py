@@ -4,18 +4,79 @@ Housing Compliance Web Application
 Flask app with Planning and Validation modes
 """
 
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, Response, render_template, request, jsonify, session, g, stream_with_context
+import gc
+import hashlib
 import json
 import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from reverse_compliance_validator import ReverseComplianceValidator
+from json_patch import apply_patch, PatchError
+from validation_trace import ValidationReporter, SpanRecorder
+from result_cache import ResultCache, DEFAULT_CACHE_PATH, canonical_hash
+from validation_result import result_dicts
+from rule_reload import LiveRuleset
+from rule_shards import ShardedValidator, DEFAULT_JURISDICTION
+from rule_store import open_rule_store
+from session_store import ServerSessionInterface, HandleStore, make_session_backend, DEFAULT_HANDLE_PATHS
+from response_layer import install_response_layer, DEFAULT_MIN_SIZE
 
 app = Flask(__name__)
 app.secret_key = 'housing_compliance_secret_key_2025'
 
-# Initialize validator
-validator = ReverseComplianceValidator()
+# orjson encoding, gzip/brotli for bodies of COMPRESS_MIN_BYTES and up, and pre-compressed
+# static files; installed first so its after_request hook runs last
+install_response_layer(app, min_size=int(os.environ.get('COMPRESS_MIN_BYTES', DEFAULT_MIN_SIZE)))
+
+# Per-validator timing spans are opt-in via VALIDATION_TRACE
+trace_recorder = SpanRecorder() if os.environ.get('VALIDATION_TRACE', 'false').lower() == 'true' else None
+# Validator families run serially unless VALIDATOR_THREADS asks for a thread pool
+validator_threads = int(os.environ.get('VALIDATOR_THREADS', 0))
+# Zone shards kept resident per process; 0 loads every rule into one validator
+rule_shards = int(os.environ.get('RULE_SHARDS', 0))
+
+# Seconds between checks for a new or changed rule corpus; 0 disables hot reload
+rules_watch_interval = float(os.environ.get('RULES_WATCH_INTERVAL', 0))
+
+# Validations kept for incremental revalidation, keyed by opaque handle. They live in a
+# backend every worker shares (same kinds as sessions, at VALIDATION_HANDLE_PATH), so a
+# handle issued by one worker resolves in any other; each worker caches recent ones
+validation_handles = HandleStore(
+    make_session_backend(os.environ.get('SESSION_BACKEND', 'sqlite'), os.environ.get('VALIDATION_HANDLE_PATH'),
+                         defaults=DEFAULT_HANDLE_PATHS),
+    ttl_seconds=float(os.environ.get('VALIDATION_HANDLE_TTL', 3600)),
+    max_cached=int(os.environ.get('VALIDATION_HANDLE_CACHE_SIZE', 256))
+)
+
+# Modules whose code shapes cached validation and planning results; their digest is part
+# of every result cache key, so a deploy never reads results computed by older code
+RESULT_SOURCES = ('app.py', 'reverse_compliance_validator.py', 'rule_compiler.py', 'rule_constants.py',
+                  'validation_result.py', 'keyword_classifier.py')
+CACHE_VERSION = hashlib.sha256(
+    b''.join((Path(__file__).parent / name).read_bytes() for name in RESULT_SOURCES)
+).hexdigest()[:16]
+
+# Content-hash result cache shared by every worker process on this host
+result_cache = ResultCache(
+    path=os.environ.get('RESULT_CACHE_PATH', DEFAULT_CACHE_PATH),
+    max_entries=int(os.environ.get('RESULT_CACHE_SIZE', 4096)),
+    ttl_seconds=float(os.environ.get('RESULT_CACHE_TTL', 3600)),
+    code_version=CACHE_VERSION
+)
+
+# Longest project line /api/validate-batch accepts; longer lines are skipped with an error
+MAX_BATCH_LINE_BYTES = int(os.environ.get('MAX_BATCH_LINE_BYTES', 1024 * 1024))
+
+# Session data stays on the server (SESSION_BACKEND=sqlite|filesystem at SESSION_PATH);
+# the cookie carries only the session ID
+app.session_interface = ServerSessionInterface(
+    make_session_backend(os.environ.get('SESSION_BACKEND', 'sqlite'), os.environ.get('SESSION_PATH')),
+    ttl_seconds=float(os.environ.get('SESSION_TTL', 86400))
+)
 
 # Zone configuration
 ZONE_CONFIG = {
@@ -26,6 +87,191 @@ ZONE_CONFIG = {
     'R-1(20000)': {'min_area': 20000, 'max_area': 39999, 'min_width': 60, 'min_depth': 100, 'max_height': 30, 'max_far': 0.45}
 }
 
+# Planning guidance is derived from ZONE_CONFIG and the compiled setbacks, so cached
+# plans are versioned by this hash plus the ruleset fingerprint
+PLANNING_VERSION = canonical_hash(ZONE_CONFIG)[:16]
+
+# Sections validation and planning require; every section a project carries must be an object
+PROJECT_SECTIONS = ('site_data', 'building_data', 'parking_data')
+PLANNING_SECTIONS = ('site_data', 'project_info')
+OBJECT_SECTIONS = ('project_info',) + PROJECT_SECTIONS
+
+SETBACK_CHECKS = ('front_setback', 'rear_setback', 'side_setback_left', 'side_setback_right')
+
+def build_rules_validator(rules_directory, rules=None):
+    """Load, index and compile the rules, or just the given ones"""
+    executor = ThreadPoolExecutor(max_workers=validator_threads) if validator_threads > 0 else None
+    return ReverseComplianceValidator(rules_directory, reporter=trace_recorder or ValidationReporter(),
+                                      executor=executor, rules=rules)
+
+def build_validator(rules_directory):
+    """One validator over every rule, or with RULE_SHARDS set, one per zone shard loaded on demand"""
+    if rule_shards > 0:
+        return ShardedValidator({DEFAULT_JURISDICTION: rules_directory}, max_shards=rule_shards,
+                                factory=build_rules_validator)
+    return build_rules_validator(rules_directory)
+
+# Live rules: preloaded by create_app(preload=True) in a pre-fork master, else built on
+# first use, and rebuilt in the background when RULES_WATCH_INTERVAL is set
+live_rules = LiveRuleset({'validator': build_validator, 'rule_store': open_rule_store},
+                         base_directory=str(Path(__file__).parent), rules_directory=os.environ.get('RULES_DIRECTORY'))
+
+def get_validator():
+    """The live validator, pinned for the rest of the request
+
+    A hot reload swaps in a new ruleset for later requests; this request keeps the
+    one it started with, and its version is reported in the X-Ruleset-Version header.
+    """
+    return get_ruleset()['validator']
+
+def zone_validator(validator, zone):
+    """The validator that enforces zone's rules: its shard's when sharded, else the one validator"""
+    if isinstance(validator, ShardedValidator):
+        return validator.zone_validator(zone)
+    return validator
+
+def get_project_validator(project_data):
+    """The pinned validator for project_data's zone"""
+    return zone_validator(get_validator(), project_data.get('site_data', {}).get('zone_district', ''))
+
+def loaded_validators():
+    """Every validator the live ruleset holds: the one validator, or each resident zone shard's"""
+    validator = live_rules.current['validator']
+    return validator.validators() if isinstance(validator, ShardedValidator) else [validator]
+
+def get_rule_store():
+    """The live rule search index, from the same ruleset as the validator"""
+    return get_ruleset()['rule_store']
+
+def zone_setbacks(compiled_rules, zone):
+    """Minimum setbacks for a zone, from the same compiled thresholds validation enforces"""
+    return {check: compiled_rules.threshold(zone, check) for check in SETBACK_CHECKS}
+
+def get_ruleset():
+    if 'ruleset' not in g:
+        g.ruleset = live_rules.current
+    return g.ruleset
+
+def reinit_after_fork():
+    """Give a forked worker its own locks, thread pool and per-process state
+    
+    Locks may have been held by another thread at fork time, and an inherited
+    thread pool believes it still has worker threads that do not exist in the child.
+    The rule index itself is left alone so it stays shared copy-on-write.
+    """
+    validation_handles.reset_after_fork()
+    if trace_recorder is not None:
+        trace_recorder.reset_after_fork()
+    result_cache.reset_after_fork()
+    app.session_interface.reset_after_fork()
+    live_rules.reset_after_fork()
+    if live_rules.loaded and isinstance(live_rules.current['validator'], ShardedValidator):
+        live_rules.current['validator'].reset_after_fork()
+    for validator in (loaded_validators() if live_rules.loaded else []):
+        validator.validator_stats.reset_after_fork()
+        if validator.executor is not None:
+            validator.executor = ThreadPoolExecutor(max_workers=validator_threads)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reinit_after_fork)
+
+def create_app(preload: bool = False) -> Flask:
+    """Return the configured app
+    
+    preload=True builds the validator immediately. Call it in a pre-forking server's
+    master (e.g. gunicorn --preload 'app:create_app(preload=True)') so workers share the
+    loaded rules copy-on-write. Without it the first request builds the validator.
+    With RULES_WATCH_INTERVAL set, each process also starts watching for new rules;
+    forked workers restart their own watcher.
+    """
+    if preload:
+        warm_up()
+        # Move preloaded objects out of the collector's generations so GC passes in
+        # workers do not write to (and un-share) the pages that hold them
+        gc.freeze()
+    if rules_watch_interval > 0 and live_rules.watcher is None:
+        live_rules.start_watching(rules_watch_interval)
+    return app
+
+def precompute_json(payload, version=''):
+    """Response body exactly as jsonify would write it, with a strong ETag over version and those bytes"""
+    body = app.json.response(payload).get_data()
+    return body, hashlib.sha256(version.encode() + body).hexdigest()[:32]
+
+def precomputed_response(body, etag, cache_control):
+    """Serve precomputed JSON; a matching If-None-Match gets an empty 304 instead
+    
+    Headers are written as plain strings: going through set_etag, cache_control and
+    make_conditional costs more than the jsonify call the precomputation saves.
+    """
+    headers = {'ETag': f'"{etag}"', 'Cache-Control': cache_control}
+    if request.if_none_match.contains_weak(etag):
+        return Response(status=304, headers=headers)
+    return Response(body, mimetype='application/json', headers=headers)
+
+# Zone requirements change only with a deploy; an hour bounds how long a client skips revalidating
+ZONE_REQUIREMENTS_CACHE_CONTROL = 'public, max-age=3600'
+# Template setbacks come from the live ruleset, which a hot reload can replace at any
+# time, so clients revalidate on every use and get a 304 while the ETag still matches
+PROJECT_TEMPLATE_CACHE_CONTROL = 'public, no-cache'
+
+# Zone requirements depend only on ZONE_CONFIG, so every body is serialized once here
+zone_requirement_responses = {zone: precompute_json(config) for zone, config in ZONE_CONFIG.items()}
+
+# Templates carry today's date as submission_date and the ruleset's setbacks: all zones
+# are rebuilt together on the first request of each day or under a new ruleset, and
+# their ETags cover the ruleset version
+project_template_responses = {'date': None, 'version': None, 'zones': {}}
+project_template_lock = threading.Lock()
+
+def project_template_response(zone, ruleset):
+    """(body, etag) of today's template for zone under ruleset"""
+    global project_template_responses
+    today = datetime.now().strftime("%Y-%m-%d")
+    cached = project_template_responses
+    if cached['date'] != today or cached['version'] != ruleset.version:
+        with project_template_lock:
+            cached = project_template_responses
+            if cached['date'] != today or cached['version'] != ruleset.version:
+                validator = ruleset['validator']
+                cached = {
+                    'date': today,
+                    'version': ruleset.version,
+                    'zones': {name: precompute_json(build_project_template(
+                                  name, today, zone_setbacks(zone_validator(validator, name).compiled_rules, name)),
+                                  ruleset.version)
+                              for name in ZONE_CONFIG}
+                }
+                # Swapped whole, so a reader never pairs one generation's date with another's bodies
+                project_template_responses = cached
+    return cached['zones'][zone]
+
+def warm_up():
+    """Load the rules and compile every template, so the first request pays for neither
+    
+    Run by create_app(preload=True) in the master, and again by each worker before it
+    accepts connections (a no-op when the master already did the work).
+    """
+    project_template_response(next(iter(ZONE_CONFIG)), live_rules.current)
+    for template_name in app.jinja_env.list_templates():
+        app.jinja_env.get_template(template_name)
+
+def shutdown():
+    """Stop background work and flush buffered state before the process exits"""
+    live_rules.stop_watching()
+    result_cache.flush_counts()
+    for validator in (loaded_validators() if live_rules.loaded else []):
+        if validator.executor is not None:
+            validator.executor.shutdown(wait=True)
+
+@app.after_request
+def add_ruleset_version(response):
+    """Tag responses with the ruleset version that served them"""
+    ruleset = g.get('ruleset') or live_rules.ruleset
+    if ruleset is not None:
+        response.headers['X-Ruleset-Version'] = ruleset.version
+    return response
+
 @app.route('/')
 def index():
     """Main page with mode selection"""
@@ -45,23 +291,30 @@ def validation_mode():
 def get_zone_requirements(zone):
     """Get requirements for a specific zone"""
     if zone in ZONE_CONFIG:
-        return jsonify(ZONE_CONFIG[zone])
+        body, etag = zone_requirement_responses[zone]
+        return precomputed_response(body, etag, ZONE_REQUIREMENTS_CACHE_CONTROL)
     return jsonify({'error': 'Invalid zone'}), 400
 
 @app.route('/api/plan-project', methods=['POST'])
 def plan_project():
     """Forward planning API endpoint"""
     try:
-        project_data = request.json
+        project_data = request.get_json(silent=True)
         
         # Validate required fields
-        required_fields = ['site_data', 'project_info']
-        for field in required_fields:
-            if field not in project_data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
+        project_error = find_project_error(project_data, PLANNING_SECTIONS)
+        if project_error:
+            return jsonify({'error': project_error}), 400
         
-        # Generate planning guidance
-        planning_result = generate_planning_guidance(project_data)
+        # Generate planning guidance, reusing the result for an identical resubmit
+        compiled_rules = get_project_validator(project_data).compiled_rules
+        planning_version = f"{PLANNING_VERSION}:{compiled_rules.fingerprint[:16]}"
+        planning_result = result_cache.get('plan', planning_version, project_data)
+        if planning_result is None:
+            planning_result = generate_planning_guidance(project_data, compiled_rules)
+            result_cache.put('plan', planning_version, project_data, planning_result)
+        # Stamped per response, never cached
+        planning_result['planning_timestamp'] = datetime.now().isoformat()
         
         # Store in session for later use
         session['current_project'] = project_data
@@ -76,19 +329,23 @@ def plan_project():
 def validate_project():
     """Reverse validation API endpoint"""
     try:
-        project_data = request.json
+        project_data = request.get_json(silent=True)
         
         # Validate required fields
-        required_fields = ['site_data', 'building_data', 'parking_data']
-        for field in required_fields:
-            if field not in project_data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
+        project_error = find_project_error(project_data)
+        if project_error:
+            return jsonify({'error': project_error}), 400
         
-        # Perform validation
-        validation_results = validator.perform_comprehensive_validation(project_data)
+        # Triage screens can stop at the first critical violation (?fail_fast=true)
+        fail_fast = request.args.get('fail_fast', 'false').lower() == 'true'
+        validation_results = run_validation(project_data, fail_fast)
         
         # Format for web response
         web_response = format_validation_response(validation_results)
+        web_response['validation_handle'] = store_validation_handle(project_data, validation_results)
+        web_response['ruleset_version'] = g.ruleset.version
+        if fail_fast:
+            web_response['fail_fast'] = validation_results['fail_fast']
         
         # Store in session
         session['current_project'] = project_data
@@ -99,19 +356,151 @@ def validate_project():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/validate-batch', methods=['POST'])
+def validate_batch():
+    """Streaming batch validation: one project JSON per request line in, one result per line out
+    
+    Each line is read, validated and written before the next is read, so neither
+    the upload nor the results are ever held whole. A bad line gets an error record
+    and the stream carries on. Every result is tagged with its 1-based line number.
+    """
+    fail_fast = request.args.get('fail_fast', 'false').lower() == 'true'
+    stream = request.stream
+    # Pin the ruleset up front, so one upload is validated against one set of rules
+    get_validator()
+    
+    def generate():
+        line_number = 0
+        while True:
+            line = stream.readline(MAX_BATCH_LINE_BYTES + 1)
+            if not line:
+                return
+            line_number += 1
+            if len(line) > MAX_BATCH_LINE_BYTES and not line.endswith(b'\n'):
+                # Drain the rest of the oversized line without keeping it
+                while line and not line.endswith(b'\n'):
+                    line = stream.readline(MAX_BATCH_LINE_BYTES)
+                yield json.dumps({'line': line_number, 'error': f'Line exceeds {MAX_BATCH_LINE_BYTES} bytes'}) + '\n'
+                continue
+            if not line.strip():
+                continue
+            yield json.dumps(validate_batch_line(line, line_number, fail_fast)) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def validate_batch_line(line, line_number, fail_fast):
+    """Result record for one line of a batch upload"""
+    try:
+        project_data = json.loads(line)
+    except ValueError as e:
+        return {'line': line_number, 'error': f'Invalid JSON: {e}'}
+    project_error = find_project_error(project_data)
+    if project_error:
+        return {'line': line_number, 'error': project_error}
+    try:
+        validation_results = run_validation(project_data, fail_fast)
+    except Exception as e:
+        return {'line': line_number, 'error': str(e)}
+    
+    record = {'line': line_number, **format_validation_response(validation_results)}
+    record['ruleset_version'] = g.ruleset.version
+    if fail_fast:
+        record['fail_fast'] = validation_results['fail_fast']
+    return record
+
+@app.route('/api/revalidate-project', methods=['POST'])
+def revalidate_project():
+    """Incremental validation API endpoint: previous handle plus a JSON patch"""
+    try:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict):
+            return jsonify({'error': 'Request body must be a JSON object'}), 400
+        handle = payload.get('validation_handle')
+        patch = payload.get('patch', [])
+        
+        previous = get_validation_handle(handle)
+        if previous is None:
+            return jsonify({'error': 'Unknown or expired validation handle'}), 404
+        previous_project, previous_results, previous_version = previous
+        
+        try:
+            project_data, changed_fields = apply_patch(previous_project, patch)
+        except PatchError as e:
+            return jsonify({'error': f'Invalid patch: {e}'}), 400
+        project_error = find_project_error(project_data)
+        if project_error:
+            return jsonify({'error': f'Invalid patch: {project_error}'}), 400
+        
+        # Re-run only the validators that read a changed field; results from an
+        # older ruleset cannot be reused, so a reload forces a full validation
+        validator = get_project_validator(project_data)
+        if previous_version == g.ruleset.version:
+            validation_results = validator.revalidate(previous_results, project_data, changed_fields)
+        else:
+            validation_results = validator.perform_comprehensive_validation(project_data)
+            validation_results['revalidated'] = list(validation_results['results_by_validator'])
+        
+        web_response = format_validation_response(validation_results)
+        web_response['validation_handle'] = store_validation_handle(project_data, validation_results)
+        web_response['ruleset_version'] = g.ruleset.version
+        web_response['revalidated_validators'] = validation_results['revalidated']
+        
+        # Store in session
+        session['current_project'] = project_data
+        session['validation_result'] = web_response
+        
+        return jsonify(web_response)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/validation-trace')
+def get_validation_trace():
+    """Timing summary per validator family (requires VALIDATION_TRACE=true)"""
+    if trace_recorder is None:
+        return jsonify({'error': 'Validation tracing is disabled'}), 404
+    return jsonify(trace_recorder.summary())
+
+@app.route('/api/cache-stats')
+def get_cache_stats():
+    """Result cache hit/miss counters across all workers"""
+    return jsonify(result_cache.stats())
+
+@app.route('/api/rules/search')
+def search_rules():
+    """Ranked full-text rule search: ?q=<text>&page=<n>&per_page=<n>&source=<file>"""
+    query = request.args.get('q', '')
+    try:
+        page = int(request.args.get('page', 1))
+        per_page = int(request.args.get('per_page', 20))
+        return jsonify(get_rule_store().search(query, page, per_page, request.args.get('source')))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/ruleset')
+def get_ruleset_status():
+    """Active ruleset version, when it was loaded and the last reload error, if any"""
+    get_validator()
+    return jsonify(live_rules.status())
+
 @app.route('/api/project-template/<zone>')
 def get_project_template(zone):
     """Get a project template for the specified zone"""
     if zone not in ZONE_CONFIG:
         return jsonify({'error': 'Invalid zone'}), 400
     
+    body, etag = project_template_response(zone, get_ruleset())
+    return precomputed_response(body, etag, PROJECT_TEMPLATE_CACHE_CONTROL)
+
+def build_project_template(zone, submission_date, setbacks):
+    """Blank project for a zone, pre-filled with its minimum lot, minimum setbacks and typical building values"""
     template = {
         "project_info": {
             "project_name": "",
             "project_id": "",
             "applicant_name": "",
             "architect": "",
-            "submission_date": datetime.now().strftime("%Y-%m-%d")
+            "submission_date": submission_date
         },
         "site_data": {
             "zone_district": zone,
@@ -131,12 +520,7 @@ def get_project_template(zone):
                 "basement_area": 0,
                 "attic_area": 0
             },
-            "setbacks": {
-                "front_setback": 20,
-                "rear_setback": 25,
-                "side_setback_left": 6,
-                "side_setback_right": 6
-            },
+            "setbacks": dict(setbacks),
             "architectural_features": {
                 "porches": [],
                 "bay_windows": []
@@ -163,10 +547,54 @@ def get_project_template(zone):
         }
     }
     
-    return jsonify(template)
+    return template
+
+def find_project_error(project_data, required=PROJECT_SECTIONS):
+    """Why a decoded request body is not a usable project, or None if it is"""
+    if not isinstance(project_data, dict):
+        return 'Project must be a JSON object'
+    for field in required:
+        if field not in project_data:
+            return f'Missing required field: {field}'
+    for field in OBJECT_SECTIONS:
+        if field in project_data and not isinstance(project_data[field], dict):
+            return f'Field must be a JSON object: {field}'
+    return None
+
+def run_validation(project_data, fail_fast=False):
+    """Validate against the pinned ruleset; identical resubmits reuse the cached per-validator results"""
+    validator = get_project_validator(project_data)
+    if fail_fast:
+        return validator.perform_comprehensive_validation(project_data, fail_fast=True)
+    ruleset_version = validator.compiled_rules.fingerprint
+    cached_results = result_cache.get('validate', ruleset_version, project_data)
+    if cached_results is not None:
+        return validator.summarize_validation(project_data, cached_results)
+    validation_results = validator.perform_comprehensive_validation(project_data)
+    result_cache.put('validate', ruleset_version, project_data, {
+        name: result_dicts(results) for name, results in validation_results['results_by_validator'].items()
+    })
+    return validation_results
+
+def store_validation_handle(project_data, validation_results):
+    """Remember a validation so later patches can revalidate incrementally, from any worker"""
+    return validation_handles.put({
+        'project': project_data,
+        'results_by_validator': {
+            name: result_dicts(results) for name, results in validation_results['results_by_validator'].items()
+        },
+        'ruleset_version': g.ruleset.version
+    })
+
+def get_validation_handle(handle):
+    """(project, previous results, ruleset version) of a stored validation, or None"""
+    record = validation_handles.get(handle)
+    if record is None:
+        return None
+    return record['project'], {'results_by_validator': record['results_by_validator']}, record['ruleset_version']
 
-def generate_planning_guidance(project_data):
-    """Generate forward planning guidance"""
+def generate_planning_guidance(project_data, compiled_rules):
+    """Generate forward planning guidance; setbacks come from compiled_rules, as validation's do"""
     site_data = project_data.get('site_data', {})
     zone = site_data.get('zone_district', 'R-1')
     
@@ -174,10 +602,14 @@ def generate_planning_guidance(project_data):
         return {'error': 'Invalid zone district'}
     
     zone_req = ZONE_CONFIG[zone]
+    setbacks = zone_setbacks(compiled_rules, zone)
+    if setbacks['side_setback_left'] == setbacks['side_setback_right']:
+        side_text = f"Side {setbacks['side_setback_left']}' each"
+    else:
+        side_text = f"Side {setbacks['side_setback_left']}' left, {setbacks['side_setback_right']}' right"
     guidance = {
         'project_id': project_data.get('project_info', {}).get('project_id', 'UNKNOWN'),
         'project_name': project_data.get('project_info', {}).get('project_name', 'Unnamed Project'),
-        'planning_timestamp': datetime.now().isoformat(),
         'workflow_phase': 'Phase 1 - Site Analysis',
         'zone_district': zone,
         'status': 'IN_PROGRESS',
@@ -203,9 +635,9 @@ def generate_planning_guidance(project_data):
                     'requirements': [
                         f"Maximum building height: {zone_req['max_height']} ft",
                         f"Maximum FAR: {zone_req['max_far']} ({zone_req['max_far']*100}%)",
-                        "Minimum setbacks: Front 20', Rear 25', Side 6' each"
+                        f"Minimum setbacks: Front {setbacks['front_setback']}', Rear {setbacks['rear_setback']}', {side_text}"
                     ],
-                    'buildable_area': calculate_buildable_area(site_data),
+                    'buildable_area': calculate_buildable_area(site_data, setbacks),
                     'max_floor_area': int(site_data.get('lot_area', 0) * zone_req['max_far'])
                 },
                 {
@@ -224,16 +656,16 @@ def generate_planning_guidance(project_data):
                     }
                 }
             ],
-            'next_steps': generate_next_steps(site_data, zone_req),
+            'next_steps': generate_next_steps(site_data, zone_req, setbacks),
             'design_constraints': {
                 'zone_requirements': zone_req,
                 'critical_dimensions': {
-                    'max_footprint': calculate_max_footprint(site_data),
+                    'max_footprint': calculate_max_footprint(site_data, setbacks),
                     'max_gfa': int(site_data.get('lot_area', 0) * zone_req['max_far'])
                 }
             }
         },
-        'recommendations': generate_recommendations(site_data, zone_req)
+        'recommendations': generate_recommendations(site_data, zone_req, setbacks)
     }
     
     return guidance
@@ -259,15 +691,14 @@ def check_site_compliance(site_data, zone_req):
         'issues': issues
     }
 
-def calculate_buildable_area(site_data):
-    """Calculate buildable area based on setbacks"""
+def calculate_buildable_area(site_data, setbacks):
+    """Calculate buildable area inside the zone's minimum setbacks"""
     lot_width = site_data.get('lot_width', 0)
     lot_depth = site_data.get('lot_depth', 0)
     
-    # Standard setbacks
-    front_setback = 20
-    rear_setback = 25
-    side_setbacks = 6 * 2  # Both sides
+    front_setback = setbacks['front_setback']
+    rear_setback = setbacks['rear_setback']
+    side_setbacks = setbacks['side_setback_left'] + setbacks['side_setback_right']
     
     buildable_width = max(0, lot_width - side_setbacks)
     buildable_depth = max(0, lot_depth - front_setback - rear_setback)
@@ -279,12 +710,12 @@ def calculate_buildable_area(site_data):
         'area': buildable_area
     }
 
-def calculate_max_footprint(site_data):
+def calculate_max_footprint(site_data, setbacks):
     """Calculate maximum building footprint"""
-    buildable = calculate_buildable_area(site_data)
+    buildable = calculate_buildable_area(site_data, setbacks)
     return buildable['area']
 
-def generate_next_steps(site_data, zone_req):
+def generate_next_steps(site_data, zone_req, setbacks):
     """Generate next steps based on current project state"""
     compliance = check_site_compliance(site_data, zone_req)
     
@@ -310,13 +741,13 @@ def generate_next_steps(site_data, zone_req):
         {
             'step': 2,
             'action': 'Design within buildable envelope',
-            'description': f"Maximum footprint: {calculate_max_footprint(site_data):,} sf",
+            'description': f"Maximum footprint: {calculate_max_footprint(site_data, setbacks):,} sf",
             'required': True,
             'phase': 'Phase 2 - Building Design'
         }
     ]
 
-def generate_recommendations(site_data, zone_req):
+def generate_recommendations(site_data, zone_req, setbacks):
     """Generate design recommendations"""
     recommendations = []
     
@@ -329,7 +760,7 @@ def generate_recommendations(site_data, zone_req):
         'priority': 'HIGH'
     })
     
-    buildable = calculate_buildable_area(site_data)
+    buildable = calculate_buildable_area(site_data, setbacks)
     recommendations.append({
         'category': 'Building Footprint',
         'message': f"Maximum ground floor footprint: {buildable['area']:,} sf",
@@ -348,7 +779,7 @@ def generate_recommendations(site_data, zone_req):
 def format_validation_response(validation_results):
     """Format validation results for web display"""
     summary = validation_results['summary']
-    all_results = validation_results['all_results']
+    all_results = result_dicts(validation_results['all_results'])
     
     # Categorize results
     violations = [r for r in all_results if r['status'] == 'VIOLATION']
@@ -395,11 +826,14 @@ if __name__ == '__main__':
     
     # Get port from environment (for deployment) or default to 5001
     port = int(os.environ.get('PORT', 5001))
-    debug = os.environ.get('FLASK_DEBUG', 'true').lower() == 'true'
+    debug = os.environ.get('FLASK_DEBUG', 'false').lower() == 'true'
     
     print("🌐 Starting Housing Compliance Web Application...")
     print("📁 Templates directory: templates/")
     print("📁 Static files directory: static/")
     print(f"🚀 Access the application at: http://localhost:{port}")
     
+    # Single-process dev server for local work; production runs gunicorn -c gunicorn.conf.py.
+    # Rules load on the first request unless PRELOAD_RULES=true
+    create_app(preload=os.environ.get('PRELOAD_RULES', 'false').lower() == 'true')
     app.run(debug=debug, host='0.0.0.0', port=port)
@@ -0,0 +1,1122 @@
+#!/usr/bin/env python3
+"""
+Validator Benchmarks
+Measures per-request validation cost as the rule corpus and traffic grow
+"""
+
+import contextlib
+import copy
+import http.client
+import importlib.util
+import io
+import json
+import os
+import re
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from reverse_compliance_validator import ReverseComplianceValidator, RULE_CATEGORY_KEYWORDS, VALIDATOR_ORDER, make_process_executor
+from json_patch import apply_patch
+from validation_trace import ConsoleReporter, SpanRecorder
+from result_cache import ResultCache
+from validation_result import result_dicts
+from rule_bundle import build_rule_bundle, BUNDLE_FILENAME
+from rule_store import open_rule_store, search_records, CURATED_RULE_FILES
+from rule_consolidation import build_unified_corpus, default_sources
+from rule_constants import scan_rule, find_constant, SCANNED_SECTIONS
+from rule_compiler import compile_ruleset, discard_compiled
+
+RULES_DIR = "rules_extraction_v3_20250916_161035"
+
+SAMPLE_PROJECT = {
+    'project_info': {'project_name': 'Benchmark Project', 'project_id': 'BENCH-001'},
+    'site_data': {'zone_district': 'R-1', 'lot_area': 7500, 'lot_width': 75, 'lot_depth': 120},
+    'building_data': {
+        'building_height': 28,
+        'gross_floor_area': 3200,
+        'setbacks': {'front_setback': 25, 'rear_setback': 30, 'side_setback_left': 8, 'side_setback_right': 10},
+        'architectural_features': {'porches': [{'type': 'front_porch', 'height': 10, 'area': 120}]}
+    },
+    'parking_data': {'parking_spaces': 2}
+}
+
+# Title filler for synthetic rules; none of these words hit a validator keyword
+SYNTHETIC_TITLES = [
+    'Tree Protection Zone', 'Fence Material Standards', 'Noise Equipment Screening',
+    'Retaining Wall Finish', 'Pool Enclosure', 'Solar Panel Placement'
+]
+
+def quiet(func, *args, **kwargs):
+    """Call func with stdout suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+def write_synthetic_corpus(target_dir: Path, multiplier: int) -> int:
+    """Copy the real corpus and pad it with synthetic rules to multiplier x its size"""
+    real_rules = []
+    for rule_file in sorted(Path(RULES_DIR).glob("*_rules.json")):
+        with open(rule_file, 'r') as f:
+            data = json.load(f)
+        if data.get('success'):
+            real_rules.extend(data['analysis'].get('extracted_rules') or [])
+
+    rules = [copy.deepcopy(rule) for rule in real_rules]
+    for i in range(len(real_rules) * (multiplier - 1)):
+        rules.append({
+            'rule': f"{SYNTHETIC_TITLES[i % len(SYNTHETIC_TITLES)]} {i}",
+            'Qualifiers': {'Scope': 'Synthetic benchmark rule', 'Applicability': 'R-1'},
+            'Constants': {'value': f'{i % 50} feet'},
+            'Conditions': {'mandatory': 'Synthetic condition.'}
+        })
+
+    with open(target_dir / "Synthetic_rules.json", 'w') as f:
+        json.dump({'success': True, 'analysis': {'extracted_rules': rules}}, f)
+
+    return len(rules)
+
+def time_requests(validator: ReverseComplianceValidator, project: Dict[str, Any], iterations: int) -> float:
+    """Average milliseconds per comprehensive validation"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        validator.perform_comprehensive_validation(project)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+def benchmark_rule_index(multipliers: tuple = (1, 10, 100), iterations: int = 200):
+    """Per-request latency as the corpus grows, with and without the category index"""
+    print("📈 RULE INDEX BENCHMARK")
+    print("=" * 60)
+    print(f"{'corpus':>10} {'rules':>8} {'indexed ms':>12} {'linear scan ms':>15}")
+
+    for multiplier in multipliers:
+        with tempfile.TemporaryDirectory() as tmp:
+            rule_count = write_synthetic_corpus(Path(tmp), multiplier)
+            validator = ReverseComplianceValidator(tmp)
+            indexed_ms = time_requests(validator, SAMPLE_PROJECT, iterations)
+
+            # Emulate the pre-index path: every lookup rescans the full corpus
+            def linear_get_rules(category, _validator=validator):
+                keywords = RULE_CATEGORY_KEYWORDS.get(category, [])
+                return [rule for rule in _validator.all_rules
+                        if any(keyword in rule.get('rule', '').lower() for keyword in keywords)]
+            validator.get_rules = linear_get_rules
+            linear_ms = time_requests(validator, SAMPLE_PROJECT, iterations)
+
+        print(f"{str(multiplier) + 'x':>10} {rule_count:>8} {indexed_ms:>12.3f} {linear_ms:>15.3f}")
+
+def synthetic_projects(count: int) -> List[Dict[str, Any]]:
+    """Generate a mixed portfolio of compliant and non-compliant projects"""
+    zones = ['R-1', 'R-1(7000)', 'R-1(8000)', 'R-1(10000)', 'R-1(20000)']
+    projects = []
+    for i in range(count):
+        project = copy.deepcopy(SAMPLE_PROJECT)
+        project['project_info']['project_name'] = f'Parcel {i}'
+        project['site_data']['zone_district'] = zones[i % len(zones)]
+        project['site_data']['lot_area'] = 5000 + (i * 37) % 20000
+        project['site_data']['lot_width'] = 50 + i % 30
+        project['building_data']['building_height'] = 24 + i % 10
+        project['building_data']['gross_floor_area'] = 2000 + (i * 13) % 3000
+        project['building_data']['setbacks']['front_setback'] = 15 + i % 12
+        project['parking_data']['parking_spaces'] = i % 4
+        projects.append(project)
+    return projects
+
+def benchmark_batch(sizes: tuple = (1000, 10000, 100000)):
+    """Throughput of validate_batch against looping the single-project path"""
+    print("📦 BATCH VALIDATION BENCHMARK")
+    print("=" * 60)
+    print(f"{'projects':>10} {'batch s':>10} {'batch proj/s':>14} {'loop s':>10} {'loop proj/s':>14}")
+
+    validator = ReverseComplianceValidator()
+    for size in sizes:
+        projects = synthetic_projects(size)
+
+        start = time.perf_counter()
+        validator.validate_batch(projects)
+        batch_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for project in projects:
+            validator.perform_comprehensive_validation(project)
+        loop_s = time.perf_counter() - start
+
+        print(f"{size:>10} {batch_s:>10.3f} {size / batch_s:>14,.0f} {loop_s:>10.3f} {size / loop_s:>14,.0f}")
+
+def benchmark_incremental(iterations: int = 2000):
+    """Full revalidation versus patch-driven incremental revalidation"""
+    print("🩹 INCREMENTAL REVALIDATION BENCHMARK")
+    print("=" * 60)
+
+    validator = ReverseComplianceValidator()
+    previous_results = validator.perform_comprehensive_validation(SAMPLE_PROJECT)
+    patches = {
+        'one setback': [{'op': 'replace', 'path': '/building_data/setbacks/front_setback', 'value': 18}],
+        'height': [{'op': 'replace', 'path': '/building_data/building_height', 'value': 31}],
+        'lot area': [{'op': 'replace', 'path': '/site_data/lot_area', 'value': 6500}],
+        'project name': [{'op': 'replace', 'path': '/project_info/project_name', 'value': 'Renamed'}],
+        'zone': [{'op': 'replace', 'path': '/site_data/zone_district', 'value': 'R-1(7000)'}]
+    }
+
+    print(f"{'patch':>14} {'validators run':>15} {'full ms':>9} {'incremental ms':>15} {'saved':>7}")
+    for label, patch in patches.items():
+        project, changed_fields = apply_patch(SAMPLE_PROJECT, patch)
+        validators_run = len(validator.affected_validators(changed_fields))
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            validator.perform_comprehensive_validation(project)
+        full_ms = (time.perf_counter() - start) * 1000 / iterations
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            validator.revalidate(previous_results, project, changed_fields)
+        incremental_ms = (time.perf_counter() - start) * 1000 / iterations
+
+        saved = (1 - incremental_ms / full_ms) * 100 if full_ms else 0
+        print(f"{label:>14} {f'{validators_run}/{len(VALIDATOR_ORDER)}':>15} {full_ms:>9.3f} {incremental_ms:>15.3f} {saved:>6.1f}%")
+
+def benchmark_trace(iterations: int = 5000):
+    """Per-request cost of each reporter, plus the spans SpanRecorder collects"""
+    print("⏱️  VALIDATION TRACE BENCHMARK")
+    print("=" * 60)
+
+    recorder = SpanRecorder()
+    reporters = {
+        'no-op (default)': None,
+        'span recorder': recorder,
+        'console (stdout)': ConsoleReporter()
+    }
+
+    print(f"{'reporter':>18} {'ms/request':>12}")
+    for label, reporter in reporters.items():
+        validator = quiet(ReverseComplianceValidator, reporter=reporter)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            quiet(validator.perform_comprehensive_validation, SAMPLE_PROJECT)
+        print(f"{label:>18} {(time.perf_counter() - start) * 1000 / iterations:>12.4f}")
+
+    print(f"\n{'validator family':>34} {'count':>7} {'mean ms':>9} {'max ms':>9}")
+    for name, stats in recorder.summary().items():
+        print(f"{name:>34} {stats['count']:>7} {stats['mean_ms']:>9.4f} {stats['max_ms']:>9.4f}")
+
+def benchmark_cache(iterations: int = 2000):
+    """Uncached validation versus result cache hits, including a second worker's cache handle"""
+    print("🗄️  RESULT CACHE BENCHMARK")
+    print("=" * 60)
+
+    validator = ReverseComplianceValidator()
+    version = validator.compiled_rules.fingerprint
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = str(Path(tmp) / "results.sqlite")
+        cache = ResultCache(cache_path)
+        other_worker = ResultCache(cache_path)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            validator.perform_comprehensive_validation(SAMPLE_PROJECT)
+        uncached_ms = (time.perf_counter() - start) * 1000 / iterations
+
+        # Mirrors /api/validate-project: only per-validator results are cached
+        def cached_validate(cache_handle: ResultCache):
+            cached_results = cache_handle.get('validate', version, SAMPLE_PROJECT)
+            if cached_results is None:
+                results = validator.perform_comprehensive_validation(SAMPLE_PROJECT)
+                cache_handle.put('validate', version, SAMPLE_PROJECT, results['results_by_validator'])
+                return results
+            return validator.summarize_validation(SAMPLE_PROJECT, cached_results)
+
+        start = time.perf_counter()
+        cached_validate(cache)
+        miss_ms = (time.perf_counter() - start) * 1000
+
+        timings = {}
+        for label, cache_handle in (('same worker', cache), ('other worker', other_worker)):
+            start = time.perf_counter()
+            for _ in range(iterations):
+                cached_validate(cache_handle)
+            timings[label] = (time.perf_counter() - start) * 1000 / iterations
+
+        print(f"{'path':>22} {'ms/request':>12}")
+        print(f"{'uncached':>22} {uncached_ms:>12.4f}")
+        print(f"{'cache miss + store':>22} {miss_ms:>12.4f}")
+        for label, hit_ms in timings.items():
+            print(f"{'hit (' + label + ')':>22} {hit_ms:>12.4f}")
+
+        other_worker.flush_counts()
+        stats = cache.stats()['namespaces']['validate']
+        print(f"\nShared counters: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.1%} hit rate)")
+
+def benchmark_fail_fast(size: int = 5000):
+    """Full validation versus fail-fast triage over a mixed portfolio, with the learned order"""
+    print("🚦 FAIL-FAST BENCHMARK")
+    print("=" * 60)
+
+    validator = ReverseComplianceValidator()
+    projects = synthetic_projects(size)
+
+    start = time.perf_counter()
+    full_results = [validator.perform_comprehensive_validation(project) for project in projects]
+    full_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    triage_results = [validator.perform_comprehensive_validation(project, fail_fast=True) for project in projects]
+    fail_fast_s = time.perf_counter() - start
+
+    agree = sum(full['summary']['can_proceed'] == triage['summary']['can_proceed']
+                for full, triage in zip(full_results, triage_results))
+    stopped = sum(1 for triage in triage_results if triage['fail_fast']['stopped_at'])
+    validators_run = sum(len(triage['results_by_validator']) for triage in triage_results) / size
+
+    print(f"{'mode':>10} {'ms/project':>12} {'validators/project':>20}")
+    print(f"{'full':>10} {full_s * 1000 / size:>12.4f} {len(VALIDATOR_ORDER):>20.2f}")
+    print(f"{'fail-fast':>10} {fail_fast_s * 1000 / size:>12.4f} {validators_run:>20.2f}")
+    print(f"\ncan_proceed agreement: {agree}/{size}; stopped early on {stopped} projects")
+
+    print(f"\n{'learned order':>34} {'runs':>7} {'mean ms':>9} {'critical rate':>14}")
+    for name, stats in validator.validator_stats.summary().items():
+        print(f"{name:>34} {stats['runs']:>7} {stats['mean_ms']:>9.4f} {stats['critical_rate']:>14.3f}")
+
+def benchmark_result_memory(result_count: int = 100000):
+    """Retained memory of slotted CheckResult records versus eagerly formatted result dicts"""
+    print("🧮 RESULT RECORD MEMORY BENCHMARK")
+    print("=" * 60)
+
+    validator = ReverseComplianceValidator()
+    results_per_project = len(validator.perform_comprehensive_validation(SAMPLE_PROJECT)['all_results'])
+    projects = synthetic_projects(result_count // results_per_project + 1)
+
+    def collect(as_dicts: bool):
+        results = []
+        for project in projects:
+            for name in VALIDATOR_ORDER:
+                records = getattr(validator, name)(project)
+                results.extend(result_dicts(records) if as_dicts else records)
+                if len(results) >= result_count:
+                    return results[:result_count]
+        return results
+
+    print(f"{'representation':>22} {'results':>9} {'retained MB':>12} {'bytes/result':>13} {'build s':>9}")
+    for label, as_dicts in (('dicts (eager format)', True), ('CheckResult records', False)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = collect(as_dicts)
+        build_s = time.perf_counter() - start
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:>22} {len(results):>9} {retained / 1e6:>12.2f} {retained / len(results):>13.0f} {build_s:>9.3f}")
+        del results
+
+# Simulated cost of a heavy check (geometry, daylight planes, coverage itemization)
+HEAVY_CHECK_MS = 20
+
+def heavy_validator(method, release_gil: bool):
+    """Wrap a validate_* method with extra work: a GIL-releasing wait or a CPU-bound loop"""
+    def validate(self, project_data):
+        deadline = time.perf_counter() + HEAVY_CHECK_MS / 1000
+        if release_gil:
+            time.sleep(HEAVY_CHECK_MS / 1000)
+        else:
+            while time.perf_counter() < deadline:
+                pass
+        return method(self, project_data)
+    validate.input_fields = method.input_fields
+    return validate
+
+class IOHeavyValidator(ReverseComplianceValidator):
+    """Validators that wait on native code or I/O (release the GIL)"""
+
+class CPUHeavyValidator(ReverseComplianceValidator):
+    """Validators that spin in pure Python (hold the GIL)"""
+
+for _name in VALIDATOR_ORDER:
+    setattr(IOHeavyValidator, _name, heavy_validator(getattr(ReverseComplianceValidator, _name), True))
+    setattr(CPUHeavyValidator, _name, heavy_validator(getattr(ReverseComplianceValidator, _name), False))
+
+def benchmark_parallel(iterations: int = 20, workers: int = 6):
+    """Per-request latency with expensive validators: serial, thread pool and process pool"""
+    print("🧵 PARALLEL VALIDATOR BENCHMARK")
+    print("=" * 60)
+    print(f"Each of {len(VALIDATOR_ORDER)} validators adds {HEAVY_CHECK_MS} ms of simulated work\n")
+
+    def time_validator(validator) -> float:
+        validator.perform_comprehensive_validation(SAMPLE_PROJECT)  # warm the pool
+        start = time.perf_counter()
+        for _ in range(iterations):
+            validator.perform_comprehensive_validation(SAMPLE_PROJECT)
+        return (time.perf_counter() - start) * 1000 / iterations
+
+    print(f"{'workload':>10} {'serial ms':>10} {'threads ms':>11} {'processes ms':>13} {'same output':>12}")
+    for label, validator_class in (('io-bound', IOHeavyValidator), ('cpu-bound', CPUHeavyValidator)):
+        serial = validator_class()
+        expected = result_dicts(serial.perform_comprehensive_validation(SAMPLE_PROJECT)['all_results'])
+        serial_ms = time_validator(serial)
+
+        timings = []
+        same_output = True
+        for executor in (ThreadPoolExecutor(max_workers=workers),
+                         make_process_executor(RULES_DIR, max_workers=workers, validator_class=validator_class)):
+            with executor:
+                parallel = validator_class(executor=executor)
+                timings.append(time_validator(parallel))
+                actual = result_dicts(parallel.perform_comprehensive_validation(SAMPLE_PROJECT)['all_results'])
+                same_output = same_output and actual == expected
+
+        print(f"{label:>10} {serial_ms:>10.1f} {timings[0]:>11.1f} {timings[1]:>13.1f} {str(same_output):>12}")
+
+# Runs in a fresh interpreter: validator construction time and resident memory it adds
+COLD_START_SCRIPT = """
+import sys, time
+from reverse_compliance_validator import ReverseComplianceValidator
+
+def rss_kb():
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith('VmRSS:'))
+
+before = rss_kb()
+start = time.perf_counter()
+validator = ReverseComplianceValidator(sys.argv[1])
+print((time.perf_counter() - start) * 1000, rss_kb() - before, len(validator.all_rules))
+"""
+
+def write_page_copies(target_dir: Path, multiplier: int):
+    """Copy every real page file multiplier times, raw_response and all"""
+    for rule_file in sorted(Path(RULES_DIR).glob("*_rules.json")):
+        for copy_number in range(multiplier):
+            shutil.copy(rule_file, target_dir / rule_file.name.replace('_rules.json', f'_c{copy_number}_rules.json'))
+
+def benchmark_startup(multipliers: tuple = (1, 10, 50), runs: int = 3):
+    """Cold-start time and resident memory loading page JSON files versus the rule bundle"""
+    print("🚀 STARTUP BENCHMARK")
+    print("=" * 60)
+    print(f"{'corpus':>8} {'rules':>7} {'json ms':>9} {'json MB':>9} {'bundle ms':>10} {'bundle MB':>10}")
+
+    def cold_start(rules_dir: str) -> tuple:
+        samples = []
+        for _ in range(runs):
+            output = subprocess.run([sys.executable, '-c', COLD_START_SCRIPT, rules_dir],
+                                    capture_output=True, text=True, check=True).stdout.split()
+            samples.append((float(output[0]), int(output[1]) / 1024, int(output[2])))
+        return min(samples)
+
+    for multiplier in multipliers:
+        with tempfile.TemporaryDirectory() as tmp:
+            write_page_copies(Path(tmp), multiplier)
+            json_ms, json_mb, rule_count = cold_start(tmp)
+            build_rule_bundle(tmp)
+            bundle_ms, bundle_mb, _ = cold_start(tmp)
+            (Path(tmp) / BUNDLE_FILENAME).unlink()
+
+        print(f"{str(multiplier) + 'x':>8} {rule_count:>7} {json_ms:>9.1f} {json_mb:>9.1f} {bundle_ms:>10.1f} {bundle_mb:>10.1f}")
+
+STREAM_LOAD_SCRIPT = """
+import json, sys, time
+from pathlib import Path
+from collections import deque
+from reverse_compliance_validator import RULE_FIELDS
+from rule_catalog import stable_rule_id
+from rule_stream import stream_rules
+from rule_bundle import read_rule_files
+from rule_catalog import build_rule_catalog
+
+def status_kb(field):
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field))
+
+mode, rule_files = sys.argv[1], sorted(Path(sys.argv[2]).glob('*_rules.json'))
+before = status_kb('VmRSS:')
+start = time.perf_counter()
+if mode == 'json':
+    rules = []
+    for rule_file in rule_files:
+        with open(rule_file) as f:
+            data = json.load(f)
+        for rule in data['analysis']['extracted_rules'] if data.get('success') else []:
+            rule['source_file'] = rule_file.name
+            rule['rule_id'] = stable_rule_id(rule)
+            rules.append(rule)
+    count = len(rules)
+elif mode == 'stream':
+    count = len(list(stream_rules(rule_files, RULE_FIELDS)))
+elif mode == 'catalog':
+    # A consumer that keeps only what it derives from each rule
+    count = build_rule_catalog(read_rule_files(rule_files))['rule_count']
+else:
+    # Consume without keeping anything: the reader's own footprint
+    count = sum(1 for _ in stream_rules(rule_files, RULE_FIELDS))
+print((time.perf_counter() - start) * 1000, status_kb('VmHWM:') - before, count)
+"""
+
+def benchmark_streaming(multipliers: tuple = (1, 10, 50)):
+    """Peak resident memory loading page files with json.load versus the streaming loader"""
+    print("🌊 STREAMING LOADER BENCHMARK")
+    print("=" * 60)
+    print(f"{'corpus':>8} {'rules':>7} {'json ms':>9} {'json MB':>9} {'stream ms':>10} {'stream MB':>10} "
+          f"{'catalog MB':>11} {'pass MB':>8}")
+
+    def peak(mode: str, rules_dir: str) -> tuple:
+        output = subprocess.run([sys.executable, '-c', STREAM_LOAD_SCRIPT, mode, rules_dir],
+                                capture_output=True, text=True, check=True).stdout.split()
+        return float(output[0]), int(output[1]) / 1024, int(output[2])
+
+    for multiplier in multipliers:
+        with tempfile.TemporaryDirectory() as tmp:
+            write_page_copies(Path(tmp), multiplier)
+            json_ms, json_mb, rule_count = peak('json', tmp)
+            stream_ms, stream_mb, _ = peak('stream', tmp)
+            _, catalog_mb, _ = peak('catalog', tmp)
+            _, pass_mb, _ = peak('pass', tmp)
+
+        print(f"{str(multiplier) + 'x':>8} {rule_count:>7} {json_ms:>9.1f} {json_mb:>9.1f} "
+              f"{stream_ms:>10.1f} {stream_mb:>10.1f} {catalog_mb:>11.1f} {pass_mb:>8.1f}")
+    print("   MB columns are peak RSS growth while loading. 'stream' keeps every trimmed rule, as the")
+    print("   validator does, so it still grows with the corpus; 'catalog' builds the rule catalog and")
+    print("   'pass' keeps nothing, which is where streaming bounds memory")
+
+def memory_rollup_kb() -> Dict[str, int]:
+    """Rss, Pss and private memory of this process from /proc/self/smaps_rollup"""
+    fields = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return {'rss': fields['Rss'], 'pss': fields['Pss'],
+            'private': fields['Private_Clean'] + fields['Private_Dirty']}
+
+def benchmark_workers(workers: int = 4):
+    """Worker spawn-to-ready time and per-worker memory, lazy init versus pre-fork preload"""
+    print("🍴 PRE-FORK WORKER BENCHMARK")
+    print("=" * 60)
+
+    def spawn_workers(preload: bool) -> List[Dict[str, float]]:
+        # Each measurement gets a fresh master so the two modes cannot share state
+        read_fd, write_fd = os.pipe()
+        master = os.fork()
+        if master == 0:
+            os.close(read_fd)
+            import app as webapp
+            webapp.create_app(preload=preload)
+
+            children = []
+            for _ in range(workers):
+                forked_at = time.perf_counter()
+                pid = os.fork()
+                if pid == 0:
+                    # Worker: ready once it can answer a validation request
+                    client = webapp.app.test_client()
+                    client.post('/api/validate-project?fail_fast=true', json=SAMPLE_PROJECT)
+                    ready_ms = (time.perf_counter() - forked_at) * 1000
+                    sample = {'ready_ms': ready_ms, **memory_rollup_kb()}
+                    os.write(write_fd, (json.dumps(sample) + "\n").encode('utf-8'))
+                    # Stay alive until every sibling has measured, so shared pages are counted fairly
+                    time.sleep(1.0)
+                    os._exit(0)
+                children.append(pid)
+            for pid in children:
+                os.waitpid(pid, 0)
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as reader:
+            samples = [json.loads(line) for line in reader]
+        os.waitpid(master, 0)
+        return samples
+
+    print(f"{'mode':>10} {'workers':>8} {'ready ms':>10} {'RSS MB':>8} {'PSS MB':>8} {'private MB':>11}")
+    for label, preload in (('lazy', False), ('preload', True)):
+        samples = spawn_workers(preload)
+        mean = {key: sum(sample[key] for sample in samples) / len(samples) for key in samples[0]}
+        print(f"{label:>10} {len(samples):>8} {mean['ready_ms']:>10.1f} {mean['rss'] / 1024:>8.1f} "
+              f"{mean['pss'] / 1024:>8.1f} {mean['private'] / 1024:>11.1f}")
+
+SEARCH_QUERIES = ['front setback', 'porch', 'parking space', 'building height', 'accessory dwelling unit', 'basement floor area']
+
+def benchmark_rule_search(multipliers: tuple = (1, 10, 100), iterations: int = 200):
+    """Rule lookup latency: FTS5 store versus scanning the loaded rule list"""
+    print("🔎 RULE SEARCH BENCHMARK")
+    print("=" * 60)
+    print(f"{'corpus':>8} {'rules':>8} {'fts5 ms':>9} {'title scan ms':>14} {'full scan ms':>13}")
+
+    def mean_ms(search) -> float:
+        start = time.perf_counter()
+        for i in range(iterations):
+            search(SEARCH_QUERIES[i % len(SEARCH_QUERIES)])
+        return (time.perf_counter() - start) * 1000 / iterations
+
+    curated_files = [Path(name) for name in CURATED_RULE_FILES]
+    for multiplier in multipliers:
+        with tempfile.TemporaryDirectory() as tmp:
+            write_synthetic_corpus(Path(tmp), multiplier)
+            store = open_rule_store(tmp, curated_files)
+            records = list(search_records(tmp, curated_files))
+            fts_ms = mean_ms(lambda query: store.search(query))
+
+            # The pre-store lookup: substring match on titles over the in-memory list
+            title_ms = mean_ms(lambda query: [record for record in records if query in record['title'].lower()])
+
+            # Same fields as the FTS index, every word required
+            texts = [' '.join((record['title'], record['category'], record['qualifiers'],
+                               record['conditions'], record['exceptions'])).lower() for record in records]
+            full_ms = mean_ms(lambda query: [record for record, text in zip(records, texts)
+                                             if all(word in text for word in query.split())])
+
+        print(f"{str(multiplier) + 'x':>8} {len(records):>8} {fts_ms:>9.3f} {title_ms:>14.3f} {full_ms:>13.3f}")
+
+def benchmark_consolidation(multipliers: tuple = (1, 5, 20)):
+    """Consolidation run time as repeated extraction runs pile up duplicate pages"""
+    print("🧬 CONSOLIDATION BENCHMARK")
+    print("=" * 60)
+    print(f"{'runs':>6} {'input rules':>12} {'canonical':>10} {'ms':>9}")
+
+    sources = default_sources()
+    for multiplier in multipliers:
+        with tempfile.TemporaryDirectory() as tmp:
+            # Stand-in for multiplier extraction runs of the same manual
+            write_page_copies(Path(tmp), multiplier)
+            start = time.perf_counter()
+            corpus = build_unified_corpus([('extraction', Path(tmp))] + sources[1:])
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{multiplier:>6} {corpus['input_rules']:>12} {corpus['rule_count']:>10} {elapsed_ms:>9.1f}")
+
+def benchmark_numeric_scan(iterations: int = 50):
+    """Numeric constant extraction over the full corpus: per-call regexes versus one load-time scan"""
+    print("🔢 NUMERIC SCAN BENCHMARK")
+    print("=" * 60)
+
+    validator = quiet(ReverseComplianceValidator, RULES_DIR)
+    rules = validator.all_rules
+    texts = [text for rule in rules for section in SCANNED_SECTIONS
+             if isinstance(rule.get(section), dict) for text in rule[section].values() if isinstance(text, str)]
+    patterns = [r'≥\s*([0-9,]+)', r'>=\s*([0-9,]+)', r'minimum\s+([0-9,]+)', r'min\s+([0-9,]+)',
+                r'([0-9,]+)\s*sf', r'([0-9,]+)\s*ft', r'([0-9,]+)']
+
+    # The per-call parser as it was: up to seven findall passes, units discarded
+    def legacy_extract_numeric_value(text: str) -> Optional[float]:
+        for pattern in patterns:
+            matches = re.findall(pattern, text.lower())
+            if matches:
+                try:
+                    return float(matches[0].replace(',', ''))
+                except ValueError:
+                    continue
+        return None
+
+    def mean_ms(func) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) * 1000 / iterations
+
+    defaults = validator.threshold_defaults()
+
+    def compile_fresh():
+        discard_compiled(validator.compiled_rules.fingerprint)
+        compile_ruleset(rules, defaults)
+
+    legacy_ms = mean_ms(lambda: [legacy_extract_numeric_value(text) for text in texts])
+    scan_ms = mean_ms(lambda: [scan_rule(rule) for rule in rules])
+    lookup_ms = mean_ms(lambda: [find_constant(rule['numeric_constants'], unit='ft', comparator='min') for rule in rules])
+    compile_ms = mean_ms(compile_fresh)
+
+    legacy_values = sum(1 for text in texts if legacy_extract_numeric_value(text) is not None)
+    constants = [constant for rule in rules for constant in rule['numeric_constants']]
+    typed = sum(1 for constant in constants if constant.unit or constant.comparator)
+
+    print(f"Corpus: {len(rules)} rules, {len(texts)} text fields")
+    print(f"{'path':>28} {'ms/corpus':>10} {'values':>7} {'typed':>6}")
+    print(f"{'legacy per-call regexes':>28} {legacy_ms:>10.3f} {legacy_values:>7} {0:>6}")
+    print(f"{'scan_rule (load time)':>28} {scan_ms:>10.3f} {len(constants):>7} {typed:>6}")
+    print(f"{'find_constant':>28} {lookup_ms:>10.3f} {'-':>7} {'-':>6}")
+    print(f"{'compile_ruleset':>28} {compile_ms:>10.3f} {'-':>7} {'-':>6}")
+
+SHARD_ZONES = ['R-1', 'R-1(7000)', 'R-1(8000)', 'R-1(10000)', 'R-1(20000)', 'R-2', 'RM-20', 'RM-30', 'RM-40', 'RE-1']
+
+def write_zoned_corpus(target_dir: Path, copies_per_zone: int) -> int:
+    """The real pages plus, per zone, copies of every real rule that name only that zone"""
+    write_page_copies(target_dir, 1)
+    real_rules = [rule for rule_file in sorted(Path(RULES_DIR).glob("*_rules.json"))
+                  for rule in (json.load(open(rule_file))['analysis'].get('extracted_rules') or [])]
+    for zone_number, zone in enumerate(SHARD_ZONES):
+        rules = []
+        for copy_number in range(copies_per_zone):
+            for rule in real_rules:
+                rule = copy.deepcopy(rule)
+                rule['rule'] = f"{rule.get('rule', '')} [{zone} #{copy_number}]"
+                rule['Qualifiers'] = {'Applicability': f"{zone} district only"}
+                rules.append(rule)
+        with open(target_dir / f"Zone_{zone_number:02d}_rules.json", 'w') as f:
+            json.dump({'success': True, 'analysis': {'extracted_rules': rules}}, f)
+    return len(real_rules) * (1 + copies_per_zone * len(SHARD_ZONES))
+
+def benchmark_shards(capacities: tuple = (1, 4, 8, 20), requests: int = 1000, copies_per_zone: int = 2):
+    """Mixed-zone traffic over two jurisdictions: memory held by resident shards versus request latency"""
+    from rule_shards import ShardedValidator, build_rule_shards
+    import random
+
+    print("🧩 ZONE SHARD BENCHMARK")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jurisdictions = {}
+        for name in ('north', 'south'):
+            rules_dir = Path(tmp) / name
+            rules_dir.mkdir()
+            rule_count = write_zoned_corpus(rules_dir, copies_per_zone)
+            build_rule_shards(str(rules_dir))
+            jurisdictions[name] = str(rules_dir)
+
+        # Skewed traffic: a few zones in one jurisdiction take most requests
+        rng = random.Random(7)
+        keys = [(name, zone) for name in jurisdictions for zone in SHARD_ZONES]
+        weights = [1 / (rank + 1) for rank in range(len(keys))]
+        traffic = []
+        for name, zone in rng.choices(keys, weights, k=requests):
+            project = copy.deepcopy(SAMPLE_PROJECT)
+            project['project_info']['jurisdiction'] = name
+            project['site_data']['zone_district'] = zone
+            traffic.append(project)
+
+        resident_projects = list({(project['project_info']['jurisdiction'], project['site_data']['zone_district']): project
+                                  for project in traffic}.values())
+
+        print(f"{len(jurisdictions)} jurisdictions x {len(SHARD_ZONES)} zones, {rule_count} rules each, {requests} requests")
+        print(f"{'shards':>8} {'held MB':>8} {'hit rate':>9} {'hit ms':>8} {'miss ms':>8} {'mean ms':>8}")
+
+        def run(sharded: ShardedValidator) -> List[tuple]:
+            timings = []
+            for project in traffic:
+                misses = sharded.stats['misses']
+                start = time.perf_counter()
+                sharded.perform_comprehensive_validation(project)
+                timings.append(((time.perf_counter() - start) * 1000, sharded.stats['misses'] > misses))
+            return timings
+
+        for capacity in capacities:
+            timings = run(ShardedValidator(jurisdictions, max_shards=capacity))
+            hits = [ms for ms, missed in timings if not missed]
+            misses = [ms for ms, missed in timings if missed]
+
+            # Memory of a full set of resident shards, measured apart from the timed run
+            tracemalloc.start()
+            sharded = ShardedValidator(jurisdictions, max_shards=capacity)
+            for project in resident_projects[:capacity]:
+                sharded.validator_for(project)
+            held_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+            tracemalloc.stop()
+            del sharded
+
+            print(f"{capacity:>8} {held_mb:>8.1f} {len(hits) / len(timings):>9.1%} "
+                  f"{sum(hits) / max(len(hits), 1):>8.3f} {sum(misses) / max(len(misses), 1):>8.1f} "
+                  f"{sum(ms for ms, _ in timings) / len(timings):>8.3f}")
+
+        tracemalloc.start()
+        unsharded = {name: quiet(ReverseComplianceValidator, rules_dir) for name, rules_dir in jurisdictions.items()}
+        held_mb = tracemalloc.get_traced_memory()[0] / 1024 / 1024
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for project in traffic:
+            unsharded[project['project_info']['jurisdiction']].perform_comprehensive_validation(project)
+        mean_ms = (time.perf_counter() - start) * 1000 / len(traffic)
+        print(f"{'all':>8} {held_mb:>8.1f} {'-':>9} {mean_ms:>8.3f} {'-':>8} {mean_ms:>8.3f}")
+
+def legacy_zone_checklist(generator, zone: str) -> Dict[str, List[Dict]]:
+    """Zone checklist as generated before precomputation: every rule re-categorized per phase per zone"""
+    from compliance_checklist_generator import PHASE_MAPPING
+
+    zone_rules = [rule for rule in generator.all_rules
+                  if zone.lower() in rule.get('Qualifiers', {}).get('Applicability', '').lower()
+                  or 'r-1' in rule.get('Qualifiers', {}).get('Applicability', '').lower()]
+    checklist = {}
+    for phase, categories in PHASE_MAPPING.items():
+        checklist[phase] = []
+        for rule in zone_rules:
+            category = generator.categorize_rule(rule)
+            if category in categories:
+                checklist[phase].append({
+                    'rule_title': rule.get('rule', 'Unknown'),
+                    'category': category,
+                    'scope': rule.get('Qualifiers', {}).get('Scope', ''),
+                    'applicability': rule.get('Qualifiers', {}).get('Applicability', ''),
+                    'requirements': generator.extract_requirements(rule),
+                    'source_file': rule.get('source_file', ''),
+                    'status': 'pending'
+                })
+    return checklist
+
+def benchmark_checklists(multipliers: tuple = (1, 10, 50)):
+    """Generating and writing all five zone checklist files: per-zone rescans versus load-time bitmaps"""
+    from compliance_checklist_generator import ComplianceChecklistGenerator, CHECKLIST_ZONES, zone_checklist_filename
+
+    print("🏘️ ZONE CHECKLIST BENCHMARK")
+    print("=" * 60)
+    print(f"{os.cpu_count()} CPUs; 'parallel' writes each zone's file in its own process")
+    print(f"{'corpus':>8} {'rules':>7} {'prepare ms':>11} {'legacy ms':>10} {'bitmap ms':>10} {'parallel ms':>12}")
+
+    for multiplier in multipliers:
+        with tempfile.TemporaryDirectory() as tmp:
+            rule_count = write_synthetic_corpus(Path(tmp), multiplier)
+            generator = quiet(ComplianceChecklistGenerator, tmp)
+            start = time.perf_counter()
+            generator.prepare_rules()
+            prepare_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            for zone in CHECKLIST_ZONES:
+                generator.write_checklist(legacy_zone_checklist(generator, zone), f"{tmp}/{zone_checklist_filename(zone)}")
+            legacy_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            for zone in CHECKLIST_ZONES:
+                generator.write_checklist(generator.generate_zone_specific_checklist(zone), f"{tmp}/{zone_checklist_filename(zone)}")
+            bitmap_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            generator.save_zone_checklists(CHECKLIST_ZONES, output_dir=tmp, max_workers=len(CHECKLIST_ZONES))
+            parallel_ms = (time.perf_counter() - start) * 1000
+
+        print(f"{str(multiplier) + 'x':>8} {rule_count:>7} {prepare_ms:>11.1f} {legacy_ms:>10.1f} {bitmap_ms:>10.1f} {parallel_ms:>12.1f}")
+
+def benchmark_classifier(multiplier: int = 100, runs: int = 3):
+    """Rule categorization and critical-path scanning: keyword-by-keyword `in` tests versus one automaton pass"""
+    from compliance_checklist_generator import (ComplianceChecklistGenerator, CATEGORY_KEYWORDS, CRITICAL_KEYWORDS,
+                                                CATEGORY_CLASSIFIER, CRITICAL_CLASSIFIER)
+
+    print("🔤 KEYWORD CLASSIFIER BENCHMARK")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_synthetic_corpus(Path(tmp), multiplier)
+        rules = quiet(ComplianceChecklistGenerator, tmp).all_rules
+    titles = [rule.get('rule', '').lower() for rule in rules]
+    texts = [f"{rule.get('rule', '')} {rule.get('Conditions', {}).get('Mandatory', '')}".lower() for rule in rules]
+
+    def legacy_category(title: str) -> str:
+        for category, keywords in CATEGORY_KEYWORDS.items():
+            if any(keyword in title for keyword in keywords):
+                return category
+        return 'other'
+
+    def rules_per_second(func, items: List[str]) -> tuple:
+        best = float('inf')
+        for _ in range(runs):
+            start = time.perf_counter()
+            results = [func(item) for item in items]
+            best = min(best, time.perf_counter() - start)
+        return len(items) / best, results
+
+    paths = [
+        ('categorize: in loops', legacy_category, titles),
+        ('categorize: automaton', lambda title: CATEGORY_CLASSIFIER.category(title, 'other'), titles),
+        ('all categories: in loops', lambda title: [category for category, keywords in CATEGORY_KEYWORDS.items()
+                                                    if any(keyword in title for keyword in keywords)], titles),
+        ('all categories: automaton', lambda title: CATEGORY_CLASSIFIER.classify(title).categories, titles),
+        ('critical: in loops', lambda text: any(keyword in text for keyword in CRITICAL_KEYWORDS), texts),
+        ('critical: classifier', CRITICAL_CLASSIFIER.contains_any, texts),
+    ]
+    print(f"Corpus: {len(rules)} rules ({multiplier}x)")
+    print(f"{'path':>28} {'rules/s':>12}")
+    outputs = {}
+    for name, func, items in paths:
+        rate, outputs[name] = rules_per_second(func, items)
+        print(f"{name:>28} {rate:>12,.0f}")
+
+    assert outputs['categorize: in loops'] == outputs['categorize: automaton']
+    assert outputs['critical: in loops'] == outputs['critical: classifier']
+    collisions = sum(1 for title in titles if CATEGORY_CLASSIFIER.classify(title).collides)
+    print(f"Titles hitting several categories: {collisions} ({collisions / len(titles):.1%})")
+    for conflict in CATEGORY_CLASSIFIER.keyword_conflicts():
+        print(f"   '{conflict['keyword']}' ({conflict['category']}) always loses to "
+              f"'{conflict['shadowed_by']}' ({conflict['winner']})")
+
+# How the app has been launched (Procfile before the gunicorn entry point) versus now
+SERVING_LAUNCHES = [
+    ('dev debug', [sys.executable, 'app.py'], {'FLASK_DEBUG': 'true'}),
+    ('dev', [sys.executable, 'app.py'], {'FLASK_DEBUG': 'false'}),
+    ('gunicorn', [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'], {}),
+]
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def wait_until_serving(port: int, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            conn.request('GET', '/api/zone-requirements/R-1')
+            if conn.getresponse().status == 200:
+                conn.close()
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server on port {port} did not come up")
+
+def drive_load(port: int, clients: int, duration: float, projects: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Keep-alive clients alternating zone lookups and validations for duration seconds"""
+    bodies = [json.dumps(project) for project in projects]
+    headers = {'Content-Type': 'application/json'}
+
+    def client(offset: int) -> List[float]:
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        latencies = []
+        deadline = time.perf_counter() + duration
+        i = offset
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            if i % 2:
+                conn.request('POST', '/api/validate-project', body=bodies[i % len(bodies)], headers=headers)
+            else:
+                conn.request('GET', '/api/zone-requirements/R-1')
+            response = conn.getresponse()
+            response.read()
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status} from port {port}")
+            latencies.append((time.perf_counter() - start) * 1000)
+            i += clients
+        conn.close()
+        return latencies
+
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        latencies = sorted(ms for result in pool.map(client, range(clients)) for ms in result)
+    return {'rps': len(latencies) / duration, 'p50': latencies[len(latencies) // 2],
+            'p99': latencies[int(len(latencies) * 0.99)]}
+
+def benchmark_serving(clients: int = 8, duration: float = 10.0, workers: int = 0, threads: int = 4):
+    """Requests per second from the dev server launch versus the gunicorn entry point"""
+    print("🌐 SERVING BENCHMARK")
+    print("=" * 60)
+    workers = workers or (os.cpu_count() or 1) * 2 + 1
+    projects = synthetic_projects(500)
+    print(f"{clients} keep-alive clients for {duration:.0f}s, half zone lookups and half validations; "
+          f"gunicorn: {workers} workers x {threads} threads on {os.cpu_count()} CPUs")
+    print(f"{'launch':>10} {'ready s':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+
+    for label, command, launch_env in SERVING_LAUNCHES:
+        if command[1:3] == ['-m', 'gunicorn'] and importlib.util.find_spec('gunicorn') is None:
+            print(f"{label:>10}   skipped: gunicorn is not installed")
+            continue
+        port = free_port()
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {**os.environ, **launch_env, 'PORT': str(port), 'WEB_CONCURRENCY': str(workers),
+                   'WEB_THREADS': str(threads), 'RESULT_CACHE_PATH': str(Path(tmp) / 'results.sqlite')}
+            # Own process group, so the dev reloader's child is stopped along with it
+            server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                      start_new_session=True)
+            try:
+                start = time.perf_counter()
+                wait_until_serving(port)
+                ready_s = time.perf_counter() - start
+                stats = drive_load(port, clients, duration, projects)
+            finally:
+                os.killpg(server.pid, signal.SIGTERM)
+                server.wait()
+
+        print(f"{label:>10} {ready_s:>8.1f} {stats['rps']:>8.0f} {stats['p50']:>8.1f} {stats['p99']:>8.1f}")
+
+def status_kb_of(pid: int, field: str) -> int:
+    with open(f'/proc/{pid}/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field))
+
+def benchmark_batch_stream(sizes: tuple = (1000, 5000, 20000)):
+    """Server peak memory and throughput streaming NDJSON batches of growing size through /api/validate-batch"""
+    print("📨 NDJSON BATCH STREAM BENCHMARK")
+    print("=" * 60)
+    projects = synthetic_projects(500)
+    port = free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, 'PORT': str(port), 'PRELOAD_RULES': 'true',
+               'RESULT_CACHE_PATH': str(Path(tmp) / 'results.sqlite')}
+        server = subprocess.Popen([sys.executable, 'app.py'], env=env, stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.DEVNULL, start_new_session=True)
+        try:
+            wait_until_serving(port)
+
+            def upload(count: int) -> tuple:
+                """Chunked upload generated on the fly while results are read as they arrive
+
+                Sending and reading run concurrently, as any real client must: a client
+                that sends the whole body first deadlocks once both socket buffers fill.
+                """
+                sent = [0]
+                sock = socket.create_connection(('127.0.0.1', port), timeout=60)
+
+                def send():
+                    sock.sendall(b"POST /api/validate-batch HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+                                 b"Content-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\n\r\n")
+                    for i in range(count):
+                        line = (json.dumps(projects[i % len(projects)]) + "\n").encode('utf-8')
+                        sent[0] += len(line)
+                        sock.sendall(b"%x\r\n%s\r\n" % (len(line), line))
+                    sock.sendall(b"0\r\n\r\n")
+
+                sender = threading.Thread(target=send)
+                sender.start()
+                response = http.client.HTTPResponse(sock)
+                response.begin()
+                results = sum(1 for line in response if json.loads(line).get('overall_status'))
+                sender.join()
+                sock.close()
+                return results, sent[0]
+
+            upload(20)
+            baseline_kb = status_kb_of(server.pid, 'VmHWM:')
+            print(f"{'projects':>9} {'upload MB':>10} {'results':>8} {'proj/s':>8} {'peak RSS +MB':>13}")
+            for count in sizes:
+                start = time.perf_counter()
+                results, sent_bytes = upload(count)
+                elapsed = time.perf_counter() - start
+                growth_kb = status_kb_of(server.pid, 'VmHWM:') - baseline_kb
+                print(f"{count:>9} {sent_bytes / 1e6:>10.1f} {results:>8} {count / elapsed:>8.0f} {growth_kb / 1024:>13.1f}")
+        finally:
+            os.killpg(server.pid, signal.SIGTERM)
+            server.wait()
+    print("   Peak RSS growth is the dev server's high-water mark above its state after a 20-project warm-up")
+
+def benchmark_zone_endpoints(iterations: int = 5000):
+    """Requests per second for the zone endpoints: rebuilt per call, precomputed, and conditional 304s"""
+    print("🏷️  ZONE ENDPOINT BENCHMARK")
+    print("=" * 60)
+    import app as webapp
+    from datetime import datetime
+    from flask import jsonify
+    from werkzeug.test import EnvironBuilder
+
+    # The handlers as they were: build and serialize the payload on every call
+    def legacy_zone_requirements(zone):
+        return jsonify(webapp.ZONE_CONFIG[zone])
+
+    def legacy_project_template(zone):
+        setbacks = webapp.zone_setbacks(webapp.get_validator().compiled_rules, zone)
+        return jsonify(webapp.build_project_template(zone, datetime.now().strftime("%Y-%m-%d"), setbacks))
+
+    def start_response(status, headers, exc_info=None):
+        pass
+
+    def call(environ: Dict[str, Any]) -> bytes:
+        environ = dict(environ, **{'wsgi.input': io.BytesIO()})
+        body = webapp.app(environ, start_response)
+        data = b''.join(body)
+        getattr(body, 'close', lambda: None)()
+        return data
+
+    def requests_per_second(endpoint: str, revalidate: bool = False) -> tuple:
+        """Straight WSGI calls, so the test client's own request building is not timed"""
+        environs = []
+        for zone in webapp.ZONE_CONFIG:
+            path = f"/api/{endpoint}/{zone}"
+            headers = None
+            if revalidate:
+                headers = {'If-None-Match': webapp.app.test_client().get(path).headers['ETag']}
+            environs.append(EnvironBuilder(path=path, headers=headers).get_environ())
+        wire_bytes = sum(len(call(environ)) for environ in environs) / len(environs)
+        start = time.perf_counter()
+        for i in range(iterations):
+            call(environs[i % len(environs)])
+        return iterations / (time.perf_counter() - start), wire_bytes
+
+    print(f"{'endpoint':>18} {'rebuilt req/s':>14} {'precomputed':>12} {'304 req/s':>10} {'body B':>7} {'304 B':>6}")
+    for endpoint, view_name, legacy in (('zone-requirements', 'get_zone_requirements', legacy_zone_requirements),
+                                        ('project-template', 'get_project_template', legacy_project_template)):
+        current = webapp.app.view_functions[view_name]
+        webapp.app.view_functions[view_name] = legacy
+        try:
+            rebuilt, _ = requests_per_second(endpoint)
+        finally:
+            webapp.app.view_functions[view_name] = current
+        precomputed, body_bytes = requests_per_second(endpoint)
+        not_modified, not_modified_bytes = requests_per_second(endpoint, revalidate=True)
+        print(f"{endpoint:>18} {rebuilt:>14.0f} {precomputed:>12.0f} {not_modified:>10.0f} "
+              f"{body_bytes:>7.0f} {not_modified_bytes:>6.0f}")
+    print("   Requirements also carry Cache-Control max-age, so clients skip most of those requests entirely;")
+    print("   templates are no-cache and revalidate, so their 304 rate is what a returning client sees")
+
+def benchmark_serialization(iterations: int = 500):
+    """Encode time and bytes on the wire for a non-compliant validation response, per encoder and encoding"""
+    print("🗜️  RESPONSE SERIALIZATION BENCHMARK")
+    print("=" * 60)
+    import app as webapp
+    from flask.json.provider import DefaultJSONProvider
+    from response_layer import OrjsonProvider, compress, available_encodings, orjson
+
+    # Undersized lot, tall building, thin setbacks and no parking
+    project = copy.deepcopy(SAMPLE_PROJECT)
+    project['site_data'].update({'lot_area': 4000, 'lot_width': 40, 'lot_depth': 80})
+    project['building_data'].update({'building_height': 42, 'gross_floor_area': 5200})
+    project['building_data']['setbacks'] = {'front_setback': 5, 'rear_setback': 8, 'side_setback_left': 2, 'side_setback_right': 2}
+    project['parking_data']['parking_spaces'] = 0
+
+    validator = quiet(ReverseComplianceValidator, RULES_DIR)
+    payload = webapp.format_validation_response(validator.perform_comprehensive_validation(project))
+    print(f"Response: {payload['summary_stats']['violations']} violations, "
+          f"{sum(len(results) for results in payload['results_by_category'].values())} categorized results")
+
+    def time_us(func) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - start) / iterations * 1e6
+
+    providers = [('json', DefaultJSONProvider(webapp.app))]
+    if orjson is not None:
+        providers.append(('orjson', OrjsonProvider(webapp.app)))
+    print(f"{'encoder':>8} {'encode us':>10}")
+    with webapp.app.app_context():
+        for label, provider in providers:
+            print(f"{label:>8} {time_us(lambda: provider.response(payload)):>10.1f}")
+        body = providers[-1][1].response(payload).get_data()
+
+    print(f"{'encoding':>8} {'bytes':>8} {'ratio':>6} {'compress us':>12}")
+    print(f"{'identity':>8} {len(body):>8} {1:>6.1f} {0:>12.1f}")
+    for encoding in available_encodings():
+        compressed = compress(body, encoding)
+        print(f"{encoding:>8} {len(compressed):>8} {len(body) / len(compressed):>6.1f} "
+              f"{time_us(lambda: compress(body, encoding)):>12.1f}")
+
+BENCHMARKS = {
+    'rule_index': benchmark_rule_index,
+    'batch': benchmark_batch,
+    'incremental': benchmark_incremental,
+    'trace': benchmark_trace,
+    'cache': benchmark_cache,
+    'fail_fast': benchmark_fail_fast,
+    'result_memory': benchmark_result_memory,
+    'parallel': benchmark_parallel,
+    'startup': benchmark_startup,
+    'workers': benchmark_workers,
+    'rule_search': benchmark_rule_search,
+    'consolidation': benchmark_consolidation,
+    'numeric_scan': benchmark_numeric_scan,
+    'streaming': benchmark_streaming,
+    'shards': benchmark_shards,
+    'checklists': benchmark_checklists,
+    'classifier': benchmark_classifier,
+    'serving': benchmark_serving,
+    'batch_stream': benchmark_batch_stream,
+    'zone_endpoints': benchmark_zone_endpoints,
+    'serialization': benchmark_serialization,
+}
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"❌ Unknown benchmark: {name} (choose from {', '.join(BENCHMARKS)})")
+            continue
+        BENCHMARKS[name]()
+        print()
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,94 @@ Based on extracted Palo Alto zoning rules
 """
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Optional, Tuple
 from datetime import datetime
+from rule_bundle import load_bundled_rules, BUNDLE_FILENAME
+from keyword_classifier import KeywordClassifier
+
+# Project phases and the rule categories reviewed in each
+PHASE_MAPPING = {
+    'Phase 1 - Site Analysis': ['lot_requirements'],
+    'Phase 2 - Building Design': ['setbacks', 'building_height', 'floor_area', 'architectural'],
+    'Phase 3 - Parking & Access': ['parking_access'],
+    'Phase 4 - Special Features': ['accessory', 'dwelling_units', 'site_features', 'utilities'],
+    'Phase 5 - Final Review': ['other']
+}
+
+# Title keywords per rule category; when a title hits several categories the first listed wins
+CATEGORY_KEYWORDS = {
+    'lot_requirements': ['lot', 'size', 'area', 'width', 'depth', 'dimension'],
+    'setbacks': ['setback', 'distance', 'yard', 'rear', 'side', 'front'],
+    'building_height': ['height', 'floor', 'story', 'daylight', 'plane'],
+    'floor_area': ['floor area', 'gfa', 'far', 'coverage', 'equivalency'],
+    'parking_access': ['parking', 'driveway', 'garage', 'access', 'vehicle'],
+    'architectural': ['porch', 'entry', 'bay', 'window', 'balcony', 'deck'],
+    'accessory': ['accessory', 'structure', 'shed', 'outbuilding'],
+    'dwelling_units': ['dwelling', 'unit', 'adu', 'second'],
+    'site_features': ['patio', 'excavation', 'retaining', 'wall', 'fence'],
+    'utilities': ['noise', 'equipment', 'hvac', 'mechanical']
+}
+
+# Words in a rule's title or mandatory conditions that put it on the critical path
+CRITICAL_KEYWORDS = [
+    'minimum', 'maximum', 'required', 'shall', 'must',
+    'setback', 'height', 'area', 'parking', 'access'
+]
+
+CATEGORY_CLASSIFIER = KeywordClassifier(CATEGORY_KEYWORDS)
+CRITICAL_CLASSIFIER = KeywordClassifier({'critical': CRITICAL_KEYWORDS})
+
+# Zone districts that get their own checklist file
+CHECKLIST_ZONES = ['R-1', 'R-1(7000)', 'R-1(8000)', 'R-1(10000)', 'R-1(20000)']
+
+def bitmap(indices: Iterable[int], size: int) -> int:
+    """Rule bitmap: bit i is set when rule i is in the set"""
+    bits = bytearray((size + 7) // 8)
+    for index in indices:
+        bits[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(bits, 'little')
+
+def bitmap_indices(mask: int) -> List[int]:
+    """Rule indexes set in a bitmap, in load order"""
+    bits = bin(mask)[:1:-1]
+    return [index for index, bit in enumerate(bits) if bit == '1']
+
+def zone_checklist_filename(zone: str) -> str:
+    return f"housing_project_checklist_{zone.replace('(', '_').replace(')', '')}.json"
+
+_worker_generator = None
+
+def init_worker_generator(generator: 'ComplianceChecklistGenerator'):
+    """Process pool initializer; with fork the generator is inherited rather than pickled"""
+    global _worker_generator
+    _worker_generator = generator
+
+def write_zone_checklist(zone: str, output_dir: str = '.') -> Tuple[str, str, int]:
+    return _worker_generator.write_zone_checklist(zone, output_dir)
 
 class ComplianceChecklistGenerator:
     def __init__(self, rules_directory: str):
         self.rules_directory = Path(rules_directory)
         self.all_rules = []
         self.load_rules()
+        self.prepare_rules()
     
     def load_rules(self):
-        """Load all extracted rules from JSON files"""
+        """Load all extracted rules, from the precompiled bundle when it is current, else from JSON files"""
+        try:
+            bundled_rules = load_bundled_rules(self.rules_directory)
+        except (ValueError, OSError) as e:
+            bundled_rules = None
+            print(f"Error loading {BUNDLE_FILENAME}: {e}")
+        
+        if bundled_rules is not None:
+            self.all_rules = bundled_rules
+            print(f"Loaded {len(self.all_rules)} rules from {BUNDLE_FILENAME}")
+            return
+        
         rule_files = list(self.rules_directory.glob("*_rules.json"))
         
         for rule_file in rule_files:
@@ -39,27 +115,7 @@ class ComplianceChecklistGenerator:
     
     def categorize_rule(self, rule: Dict[str, Any]) -> str:
         """Categorize a rule based on its title and content"""
-        rule_title = rule.get('rule', '').lower()
-        
-        # Define category keywords
-        categories = {
-            'lot_requirements': ['lot', 'size', 'area', 'width', 'depth', 'dimension'],
-            'setbacks': ['setback', 'distance', 'yard', 'rear', 'side', 'front'],
-            'building_height': ['height', 'floor', 'story', 'daylight', 'plane'],
-            'floor_area': ['floor area', 'gfa', 'far', 'coverage', 'equivalency'],
-            'parking_access': ['parking', 'driveway', 'garage', 'access', 'vehicle'],
-            'architectural': ['porch', 'entry', 'bay', 'window', 'balcony', 'deck'],
-            'accessory': ['accessory', 'structure', 'shed', 'outbuilding'],
-            'dwelling_units': ['dwelling', 'unit', 'adu', 'second'],
-            'site_features': ['patio', 'excavation', 'retaining', 'wall', 'fence'],
-            'utilities': ['noise', 'equipment', 'hvac', 'mechanical']
-        }
-        
-        for category, keywords in categories.items():
-            if any(keyword in rule_title for keyword in keywords):
-                return category
-        
-        return 'other'
+        return CATEGORY_CLASSIFIER.category(rule.get('rule', '').lower(), 'other')
     
     def extract_requirements(self, rule: Dict[str, Any]) -> List[str]:
         """Extract specific requirements from a rule"""
@@ -88,81 +144,119 @@ class ComplianceChecklistGenerator:
         
         return requirements
     
-    def generate_checklist_by_phase(self) -> Dict[str, List[Dict]]:
-        """Generate checklist organized by project phases"""
+    def prepare_rules(self):
+        """Categorize every rule, extract its requirements and build category, phase and zone bitmaps once"""
+        self.rule_items = []
+        self.rule_applicability = []
+        self.category_collisions = []
+        category_indices = {}
+        general_indices = []
         
-        phase_mapping = {
-            'Phase 1 - Site Analysis': ['lot_requirements'],
-            'Phase 2 - Building Design': ['setbacks', 'building_height', 'floor_area', 'architectural'],
-            'Phase 3 - Parking & Access': ['parking_access'],
-            'Phase 4 - Special Features': ['accessory', 'dwelling_units', 'site_features', 'utilities'],
-            'Phase 5 - Final Review': ['other']
-        }
-        
-        checklist = {}
-        
-        for phase, categories in phase_mapping.items():
-            checklist[phase] = []
+        for index, rule in enumerate(self.all_rules):
+            classification = CATEGORY_CLASSIFIER.classify(rule.get('rule', '').lower())
+            category = classification.category or 'other'
+            if classification.collides:
+                self.category_collisions.append({
+                    'rule_title': rule.get('rule', 'Unknown'),
+                    'category': category,
+                    'candidates': list(classification.categories),
+                    'keywords': list(classification.keywords)
+                })
+            qualifiers = rule.get('Qualifiers', {})
+            self.rule_items.append({
+                'rule_title': rule.get('rule', 'Unknown'),
+                'category': category,
+                'scope': qualifiers.get('Scope', ''),
+                'applicability': qualifiers.get('Applicability', ''),
+                'requirements': self.extract_requirements(rule),
+                'source_file': rule.get('source_file', ''),
+                'status': 'pending'  # For tracking compliance
+            })
+            category_indices.setdefault(category, []).append(index)
             
-            for rule in self.all_rules:
-                rule_category = self.categorize_rule(rule)
-                
-                if rule_category in categories:
-                    requirements = self.extract_requirements(rule)
-                    
-                    checklist_item = {
-                        'rule_title': rule.get('rule', 'Unknown'),
-                        'category': rule_category,
-                        'scope': rule.get('Qualifiers', {}).get('Scope', ''),
-                        'applicability': rule.get('Qualifiers', {}).get('Applicability', ''),
-                        'requirements': requirements,
-                        'source_file': rule.get('source_file', ''),
-                        'status': 'pending'  # For tracking compliance
-                    }
-                    
-                    checklist[phase].append(checklist_item)
+            applicability = qualifiers.get('Applicability', '').lower()
+            self.rule_applicability.append(applicability)
+            # Rules for the R-1 family apply in every R-1 zone
+            if 'r-1' in applicability:
+                general_indices.append(index)
         
+        size = len(self.all_rules)
+        self.category_masks = {category: bitmap(indices, size) for category, indices in category_indices.items()}
+        self.phase_masks = {}
+        for phase, categories in PHASE_MAPPING.items():
+            mask = 0
+            for category in categories:
+                mask |= self.category_masks.get(category, 0)
+            self.phase_masks[phase] = mask
+        self.all_rules_mask = (1 << size) - 1
+        self.general_mask = bitmap(general_indices, size)
+        self.zone_masks = {}
+        for zone in CHECKLIST_ZONES:
+            self.zone_mask(zone)
+    
+    def zone_mask(self, zone_district: str) -> int:
+        """Bitmap of the rules that apply in a zone district, computed once per zone"""
+        mask = self.zone_masks.get(zone_district)
+        if mask is None:
+            zone = zone_district.lower()
+            mask = self.general_mask | bitmap(
+                (index for index, applicability in enumerate(self.rule_applicability) if zone in applicability),
+                len(self.all_rules)
+            )
+            self.zone_masks[zone_district] = mask
+        return mask
+    
+    def checklist_for(self, rule_mask: int, phases: Optional[List[str]] = None) -> Dict[str, List[Dict]]:
+        """Checklist items for the rules in rule_mask, by phase; each item is a fresh copy"""
+        checklist = {}
+        for phase in phases or PHASE_MAPPING:
+            checklist[phase] = [dict(self.rule_items[index])
+                                for index in bitmap_indices(rule_mask & self.phase_masks[phase])]
         return checklist
     
+    def generate_checklist_by_phase(self) -> Dict[str, List[Dict]]:
+        """Generate checklist organized by project phases"""
+        return self.checklist_for(self.all_rules_mask)
+    
     def generate_zone_specific_checklist(self, zone_district: str) -> Dict[str, List[Dict]]:
         """Generate checklist specific to a zone district"""
-        zone_rules = []
-        
-        for rule in self.all_rules:
-            # Check if rule applies to the specified zone
-            applicability = rule.get('Qualifiers', {}).get('Applicability', '').lower()
-            if zone_district.lower() in applicability or 'r-1' in applicability:
-                zone_rules.append(rule)
-        
-        # Use the filtered rules to generate checklist
-        original_rules = self.all_rules
-        self.all_rules = zone_rules
-        checklist = self.generate_checklist_by_phase()
-        self.all_rules = original_rules  # Restore original
-        
-        return checklist
+        return self.checklist_for(self.zone_mask(zone_district))
+    
+    def write_zone_checklist(self, zone: str, output_dir: str = '.') -> Tuple[str, str, int]:
+        """Build and write one zone's checklist file; returns (zone, file, item count)"""
+        checklist = self.generate_zone_specific_checklist(zone)
+        filename = str(Path(output_dir) / zone_checklist_filename(zone))
+        self.write_checklist(checklist, filename)
+        return zone, filename, sum(len(phase_items) for phase_items in checklist.values())
+    
+    def save_zone_checklists(self, zones: List[str] = CHECKLIST_ZONES, output_dir: str = '.',
+                             max_workers: Optional[int] = None) -> List[Tuple[str, str, int]]:
+        """Write every zone's checklist file, one worker process per zone up to the CPU count
+
+        JSON encoding with indent is pure Python, so files are written in processes
+        rather than threads; on a single CPU they are written in-process.
+        """
+        workers = max_workers or min(len(zones), os.cpu_count() or 1)
+        if workers <= 1:
+            return [self.write_zone_checklist(zone, output_dir) for zone in zones]
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker_generator,
+                                 initargs=(self,)) as executor:
+            return list(executor.map(write_zone_checklist, zones, [output_dir] * len(zones)))
     
     def generate_critical_path_checklist(self) -> List[Dict]:
         """Generate checklist of critical path items that could stop project"""
-        critical_keywords = [
-            'minimum', 'maximum', 'required', 'shall', 'must',
-            'setback', 'height', 'area', 'parking', 'access'
-        ]
-        
         critical_rules = []
         
-        for rule in self.all_rules:
+        for rule, item in zip(self.all_rules, self.rule_items):
             rule_text = f"{rule.get('rule', '')} {rule.get('Conditions', {}).get('Mandatory', '')}".lower()
             
-            if any(keyword in rule_text for keyword in critical_keywords):
-                requirements = self.extract_requirements(rule)
-                
+            if CRITICAL_CLASSIFIER.contains_any(rule_text):
                 critical_item = {
-                    'rule_title': rule.get('rule', 'Unknown'),
-                    'category': self.categorize_rule(rule),
+                    'rule_title': item['rule_title'],
+                    'category': item['category'],
                     'criticality': 'HIGH',
                     'stop_condition': True,
-                    'requirements': requirements,
+                    'requirements': list(item['requirements']),
                     'exceptions': rule.get('Exceptions', {}).get('Explicit Deviations', ''),
                     'source_file': rule.get('source_file', '')
                 }
@@ -171,8 +265,8 @@ class ComplianceChecklistGenerator:
         
         return critical_rules
     
-    def save_checklist(self, checklist: Dict, filename: str):
-        """Save checklist to JSON file"""
+    def write_checklist(self, checklist: Dict, filename: str):
+        """Write checklist to a JSON file"""
         output_data = {
             'generated_date': datetime.now().isoformat(),
             'total_rules_analyzed': len(self.all_rules),
@@ -182,7 +276,10 @@ class ComplianceChecklistGenerator:
         
         with open(filename, 'w') as f:
             json.dump(output_data, f, indent=2)
-        
+    
+    def save_checklist(self, checklist: Dict, filename: str):
+        """Save checklist to JSON file"""
+        self.write_checklist(checklist, filename)
         print(f"Checklist saved to: {filename}")
     
     def generate_summary_report(self) -> Dict[str, Any]:
@@ -190,18 +287,17 @@ class ComplianceChecklistGenerator:
         categories = {}
         total_requirements = 0
         
-        for rule in self.all_rules:
-            category = self.categorize_rule(rule)
+        for item in self.rule_items:
+            category = item['category']
             categories[category] = categories.get(category, 0) + 1
-            
-            requirements = self.extract_requirements(rule)
-            total_requirements += len(requirements)
+            total_requirements += len(item['requirements'])
         
         return {
             'total_rules': len(self.all_rules),
             'total_requirements': total_requirements,
             'categories': categories,
-            'average_requirements_per_rule': total_requirements / len(self.all_rules) if self.all_rules else 0
+            'average_requirements_per_rule': total_requirements / len(self.all_rules) if self.all_rules else 0,
+            'category_collisions': len(self.category_collisions)
         }
 
 def main():
@@ -223,6 +319,10 @@ def main():
     print(f"   Total Requirements: {summary['total_requirements']}")
     print(f"   Avg Requirements/Rule: {summary['average_requirements_per_rule']:.1f}")
     print(f"   Categories: {len(summary['categories'])}")
+    print(f"   Category Collisions: {summary['category_collisions']} rules match several categories (first listed wins)")
+    for conflict in CATEGORY_CLASSIFIER.keyword_conflicts():
+        print(f"   ⚠️ '{conflict['keyword']}' ({conflict['category']}) always loses to "
+              f"'{conflict['shadowed_by']}' ({conflict['winner']})")
     
     print(f"\n📋 Category Breakdown:")
     for category, count in sorted(summary['categories'].items()):
@@ -249,16 +349,10 @@ def main():
     print(f"Critical path checklist saved: housing_project_critical_path.json")
     print(f"   Critical Items: {len(critical_checklist)}")
     
-    # Generate zone-specific checklists
-    zones = ['R-1', 'R-1(7000)', 'R-1(8000)', 'R-1(10000)', 'R-1(20000)']
-    
+    # Generate zone-specific checklists, one worker process per zone
     print(f"\n🏘️ Generating Zone-Specific Checklists...")
-    for zone in zones:
-        zone_checklist = generator.generate_zone_specific_checklist(zone)
-        zone_filename = f"housing_project_checklist_{zone.replace('(', '_').replace(')', '')}.json"
-        generator.save_checklist(zone_checklist, zone_filename)
-        
-        total_items = sum(len(phase_items) for phase_items in zone_checklist.values())
+    for zone, zone_filename, total_items in generator.save_zone_checklists(CHECKLIST_ZONES):
+        print(f"Checklist saved to: {zone_filename}")
         print(f"   {zone}: {total_items} applicable rules")
     
     print(f"\n✅ All checklists generated successfully!")
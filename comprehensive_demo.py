@@ -6,6 +6,7 @@ Demonstrates both methodologies using the extracted zoning rules
 
 import json
 from reverse_compliance_validator import ReverseComplianceValidator
+from validation_trace import ConsoleReporter
 from datetime import datetime
 
 def demonstrate_forward_planning():
@@ -93,7 +94,7 @@ def demonstrate_reverse_validation():
     }
     
     # Initialize reverse validator
-    validator = ReverseComplianceValidator()
+    validator = ReverseComplianceValidator(reporter=ConsoleReporter())
     
     # Perform validation
     validation_results = validator.perform_comprehensive_validation(sample_project)
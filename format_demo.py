@@ -7,6 +7,8 @@ Shows how Forward Planning and Reverse Validation use identical input formats
 import json
 from datetime import datetime
 from reverse_compliance_validator import ReverseComplianceValidator
+from validation_trace import ConsoleReporter
+from validation_result import result_dicts
 
 def create_sample_project_data():
     """Create sample project data in unified format"""
@@ -207,7 +209,7 @@ def demonstrate_format_usage():
     print("-" * 32)
     print("🎯 Purpose: Validate existing design")
     
-    validator = ReverseComplianceValidator()
+    validator = ReverseComplianceValidator(reporter=ConsoleReporter())
     validation_results = validator.perform_comprehensive_validation(project_data)
     
     print("📊 Key Information:")
@@ -277,7 +279,7 @@ def demonstrate_format_usage():
             "overall_status": validation_results['summary']['overall_status'],
             "can_proceed": validation_results['summary']['can_proceed'],
             "summary": validation_results['summary'],
-            "detailed_results": validation_results['all_results'][:5]  # Sample results
+            "detailed_results": result_dicts(validation_results['all_results'][:5])  # Sample results
         }
     }
     
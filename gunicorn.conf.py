@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Gunicorn Configuration
+Production serving: pre-forked workers that share the rules loaded once in the master and warm up before taking traffic
+"""
+
+import multiprocessing
+import os
+
+# The app factory; with preload_app the master builds the validator once and workers
+# inherit it copy-on-write
+wsgi_app = 'app:create_app(preload=True)'
+preload_app = True
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+
+# Validation is CPU bound, so processes give the parallelism; a few threads per worker
+# keep slow clients and uploads from idling a whole process
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('WEB_THREADS', 4))
+worker_class = 'gthread'
+
+# Seconds a silent worker may run before it is killed, and that in-flight requests get
+# to finish after SIGTERM
+timeout = int(os.environ.get('WEB_TIMEOUT', 60))
+graceful_timeout = int(os.environ.get('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.environ.get('WEB_KEEPALIVE', 5))
+
+# Recycle workers after this many requests (0 = never), jittered so they do not all restart at once
+max_requests = int(os.environ.get('WEB_MAX_REQUESTS', 0))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.environ.get('WEB_ACCESS_LOG') or None
+errorlog = '-'
+
+def post_worker_init(worker):
+    """Warm the worker before its accept loop starts; until then its siblings take the connections"""
+    from app import warm_up
+    warm_up()
+
+def worker_exit(server, worker):
+    """Graceful stop: in-flight requests have drained, so stop the watcher and flush counters"""
+    from app import shutdown
+    shutdown()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+JSON Patch
+Minimal RFC 6902 patch application for project data diffs
+"""
+
+import copy
+from typing import Dict, List, Any, Tuple
+
+class PatchError(ValueError):
+    """A patch that is malformed or does not apply to the document"""
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Split a JSON pointer such as /building_data/setbacks/front_setback into tokens"""
+    if pointer == '':
+        return []
+    if not pointer.startswith('/'):
+        raise PatchError(f"Invalid JSON pointer: {pointer}")
+    return [token.replace('~1', '/').replace('~0', '~') for token in pointer[1:].split('/')]
+
+def resolve_parent(document: Any, tokens: List[str], pointer: str) -> Tuple[Any, str]:
+    """Walk to the container holding the last token of a pointer"""
+    if not tokens:
+        raise PatchError(f"Cannot patch the document root: {pointer}")
+
+    container = document
+    for token in tokens[:-1]:
+        try:
+            container = container[int(token)] if isinstance(container, list) else container[token]
+        except (KeyError, IndexError, ValueError, TypeError):
+            raise PatchError(f"Path not found: {pointer}")
+    if not isinstance(container, (dict, list)):
+        raise PatchError(f"Path not found: {pointer}")
+    return container, tokens[-1]
+
+def list_index(container: List[Any], token: str, pointer: str, allow_end: bool = False) -> int:
+    """Convert a pointer token into a list index"""
+    if token == '-' and allow_end:
+        return len(container)
+    try:
+        index = int(token)
+    except ValueError:
+        raise PatchError(f"Invalid list index in {pointer}")
+    limit = len(container) if allow_end else len(container) - 1
+    if index < 0 or index > limit:
+        raise PatchError(f"List index out of range in {pointer}")
+    return index
+
+def pointer_to_field(pointer: str) -> str:
+    """Convert a JSON pointer into the dotted field path validators declare"""
+    return '.'.join(parse_pointer(pointer))
+
+def apply_patch(document: Dict[str, Any], patch: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[str]]:
+    """Apply add/remove/replace/test operations to a copy of document
+
+    Returns the patched document and the dotted field paths that changed.
+    """
+    if not isinstance(patch, list):
+        raise PatchError("Patch must be a list of operations")
+
+    patched = copy.deepcopy(document)
+    changed_fields = []
+
+    for position, operation in enumerate(patch):
+        if not isinstance(operation, dict):
+            raise PatchError(f"Operation {position} must be an object")
+        op = operation.get('op')
+        pointer = operation.get('path')
+        if not isinstance(op, str) or not isinstance(pointer, str):
+            raise PatchError(f"Operation {position} needs string 'op' and 'path' members")
+        if op in ('add', 'replace', 'test') and 'value' not in operation:
+            raise PatchError(f"Operation {position} ({op}) needs a 'value' member")
+        tokens = parse_pointer(pointer)
+        container, token = resolve_parent(patched, tokens, pointer)
+
+        if op == 'test':
+            if isinstance(container, list):
+                current = container[list_index(container, token, pointer)]
+            elif token in container:
+                current = container[token]
+            else:
+                raise PatchError(f"Path not found: {pointer}")
+            if current != operation['value']:
+                raise PatchError(f"Test failed at {pointer}")
+            continue
+
+        if op == 'add':
+            if isinstance(container, list):
+                container.insert(list_index(container, token, pointer, allow_end=True), operation['value'])
+            else:
+                container[token] = operation['value']
+        elif op == 'replace':
+            if isinstance(container, list):
+                container[list_index(container, token, pointer)] = operation['value']
+            elif token in container:
+                container[token] = operation['value']
+            else:
+                raise PatchError(f"Path not found: {pointer}")
+        elif op == 'remove':
+            if isinstance(container, list):
+                del container[list_index(container, token, pointer)]
+            elif token in container:
+                del container[token]
+            else:
+                raise PatchError(f"Path not found: {pointer}")
+        else:
+            raise PatchError(f"Unsupported patch operation: {op}")
+
+        changed_fields.append(pointer_to_field(pointer))
+
+    return patched, changed_fields
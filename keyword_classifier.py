@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Keyword Classifier
+Aho–Corasick automaton that finds every category keyword in a text in one pass, and reports keyword collisions
+"""
+
+import re
+from typing import Dict, List, Set, NamedTuple, Optional, Tuple
+
+class Classification(NamedTuple):
+    """Every category a text hit, in priority order; category is the winner, None if nothing hit"""
+    category: Optional[str]
+    categories: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+
+    @property
+    def collides(self) -> bool:
+        return len(self.categories) > 1
+
+class KeywordClassifier:
+    """Matches keyword lists per category as plain substrings, like `keyword in text`
+
+    categories is ordered: when a text hits keywords of several categories the first
+    one wins, which is what the nested `for category ... if any(keyword in text)`
+    loops it replaces did. Callers pass lowercase text; keywords are lowercased here.
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self.category_order = list(categories)
+        self.keyword_categories = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                self.keyword_categories.setdefault(keyword.lower(), []).append(category)
+        self.delta, self.outputs = self.build(list(self.keyword_categories))
+        # Any-hit checks only need the leftmost match, which re finds in one C-level pass
+        self.any_keyword = re.compile('|'.join(map(re.escape, self.keyword_categories)))
+
+    @staticmethod
+    def build(keywords: List[str]) -> Tuple[List[Dict[str, int]], List[Tuple[str, ...]]]:
+        """Trie plus failure links, flattened into a full transition table
+
+        A character with no entry in delta[state] leads back to the root, so matching
+        is one dict lookup per character with no failure-link walking.
+        """
+        goto = [{}]
+        outputs = [()]
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    outputs.append(())
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            outputs[state] += (keyword,)
+
+        # Breadth first, so a state's failure target is complete before the state itself;
+        # children of the root fail to the root
+        delta = [dict(goto[0])] + [None] * (len(goto) - 1)
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            delta[state] = dict(delta[fail[state]])
+            delta[state].update(goto[state])
+            outputs[state] += outputs[fail[state]]
+            for char, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(char, 0)
+                queue.append(child)
+        return delta, outputs
+
+    def find(self, text: str) -> Set[str]:
+        """Every keyword that occurs in text, overlapping hits included"""
+        delta, outputs = self.delta, self.outputs
+        found = set()
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+    def contains_any(self, text: str) -> bool:
+        """True if any keyword occurs in text; stops at the first hit"""
+        return self.any_keyword.search(text) is not None
+
+    def classify(self, text: str) -> Classification:
+        """All categories text hits, ordered by priority, with the keywords that hit"""
+        keywords = self.find(text)
+        if not keywords:
+            return Classification(None, (), ())
+        hit = {category for keyword in keywords for category in self.keyword_categories[keyword]}
+        categories = tuple(category for category in self.category_order if category in hit)
+        return Classification(categories[0], categories, tuple(sorted(keywords)))
+
+    def category(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """The winning category, or default if no keyword occurs"""
+        return self.classify(text).category or default
+
+    def keyword_conflicts(self) -> List[Dict[str, str]]:
+        """Keyword pairs where order decides the category regardless of the text
+
+        A keyword listed under two categories always goes to the first. A keyword that
+        contains an earlier category's keyword ('floor area' contains 'area') can never
+        win, since every text that hits it also hits the earlier one.
+        """
+        conflicts = []
+        rank = {category: position for position, category in enumerate(self.category_order)}
+        for keyword, categories in self.keyword_categories.items():
+            for category in categories[1:]:
+                conflicts.append({'keyword': keyword, 'category': category,
+                                  'shadowed_by': keyword, 'winner': categories[0]})
+            for other, other_categories in self.keyword_categories.items():
+                if other != keyword and other in keyword and rank[other_categories[0]] < rank[categories[0]]:
+                    conflicts.append({'keyword': keyword, 'category': categories[0],
+                                      'shadowed_by': other, 'winner': other_categories[0]})
+        return conflicts
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Response Layer
+Fast JSON encoding, gzip/brotli negotiation by payload size, and pre-compressed static assets for the web app
+"""
+
+import gzip
+import mimetypes
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from flask import Flask, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Responses below this many bytes go out as they are; compressing them saves less than it costs
+DEFAULT_MIN_SIZE = 1024
+
+# Per-request compression favours speed; static assets are compressed once, as hard as possible
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+
+COMPRESSIBLE_TYPES = {
+    'application/json', 'application/javascript', 'text/javascript', 'text/css',
+    'text/html', 'text/plain', 'image/svg+xml'
+}
+
+# Preferred first; brotli only when the module is installed
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+def available_encodings() -> List[str]:
+    return [encoding for encoding in ENCODING_SUFFIXES if encoding != 'br' or brotli is not None]
+
+def compress(data: bytes, encoding: str, static: bool = False) -> bytes:
+    if encoding == 'br':
+        return brotli.compress(data, quality=STATIC_BROTLI_QUALITY if static else BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=STATIC_GZIP_LEVEL if static else GZIP_LEVEL, mtime=0)
+
+def negotiate_encoding(offered: List[str]) -> Optional[str]:
+    """The encoding the client rates highest among offered, ties going to the earlier one; None for identity"""
+    best, best_quality = None, 0
+    for encoding in offered:
+        quality = request.accept_encodings[encoding]
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider whose response bodies are written by orjson
+
+    Keys are sorted as the default provider sorts them. Datetimes, which Flask writes as
+    HTTP dates, and types orjson does not know are passed to the default provider's
+    fallback. The bytes are not always the default provider's: non-ASCII text is written
+    as UTF-8 rather than \\u escapes, and NaN and Infinity as null. Payloads orjson
+    cannot encode at all, such as integers wider than 64 bits, are written by the default
+    provider instead. dumps (and the templates' tojson) and decoding stay with the
+    standard library.
+    """
+
+    option = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+    def response(self, *args, **kwargs):
+        # Pretty-printed debug output stays with the default provider
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self.option | orjson.OPT_APPEND_NEWLINE)
+        except (orjson.JSONEncodeError, TypeError):
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+class ResponseCompressor:
+    """after_request hook compressing buffered responses of compressible types when the client accepts it
+
+    Streamed and pass-through (file) responses are left alone; the NDJSON batch stream
+    and static files are handled elsewhere. A strong ETag becomes weak once the body is
+    compressed, since the bytes no longer match the identity representation; If-None-Match
+    uses weak comparison, so revalidation keeps working.
+    """
+
+    def __init__(self, min_size: int = DEFAULT_MIN_SIZE):
+        self.min_size = min_size
+        self.encodings = available_encodings()
+
+    def __call__(self, response):
+        if (response.direct_passthrough or response.is_streamed or response.status_code in (204, 304)
+                or response.status_code < 200 or 'Content-Encoding' in response.headers
+                or response.mimetype not in COMPRESSIBLE_TYPES):
+            return response
+
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+        # The body depends on Accept-Encoding from here on, whatever this client gets
+        response.vary.add('Accept-Encoding')
+        encoding = negotiate_encoding(self.encodings)
+        if encoding is None:
+            return response
+
+        response.set_data(compress(data, encoding))
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+def precompress_static(static_folder: str, min_size: int = DEFAULT_MIN_SIZE) -> List[Dict[str, int]]:
+    """Write .br and .gz siblings for every compressible static file; files already current are skipped"""
+    written = []
+    for path in sorted(Path(static_folder).rglob('*')):
+        if not path.is_file() or path.suffix in ENCODING_SUFFIXES.values():
+            continue
+        if mimetypes.guess_type(path.name)[0] not in COMPRESSIBLE_TYPES or path.stat().st_size < min_size:
+            continue
+        data = None
+        entry = {'file': str(path.relative_to(static_folder)), 'identity': path.stat().st_size}
+        for encoding in available_encodings():
+            target = path.with_name(path.name + ENCODING_SUFFIXES[encoding])
+            if not target.exists() or target.stat().st_mtime < path.stat().st_mtime:
+                data = data if data is not None else path.read_bytes()
+                target.write_bytes(compress(data, encoding, static=True))
+            entry[encoding] = target.stat().st_size
+        written.append(entry)
+    return written
+
+def precompressed_variants(static_folder: str) -> Dict[str, Set[str]]:
+    """Static files (as URL paths) mapped to the encodings with a sibling at least as new as the file"""
+    variants = {}
+    root = Path(static_folder)
+    if not root.is_dir():
+        return variants
+    for path in root.rglob('*'):
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            if path.suffix != suffix or encoding not in available_encodings():
+                continue
+            original = path.with_name(path.name[:-len(suffix)])
+            if original.is_file() and path.stat().st_mtime >= original.stat().st_mtime:
+                variants.setdefault(original.relative_to(root).as_posix(), set()).add(encoding)
+    return variants
+
+def install_response_layer(app: Flask, min_size: int = DEFAULT_MIN_SIZE):
+    """Switch app to orjson (when installed), compress its responses and serve pre-compressed static files
+
+    Call before registering other after_request hooks: Flask runs them in reverse, so
+    compression then sees the final body. Pre-compressed files are found once, here;
+    run `python response_layer.py` before starting the app after changing static/.
+    """
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    app.after_request(ResponseCompressor(min_size))
+
+    variants = precompressed_variants(app.static_folder)
+    serve_static_file = app.view_functions['static']
+
+    def static(filename):
+        encodings = variants.get(filename)
+        if not encodings:
+            return serve_static_file(filename=filename)
+        encoding = negotiate_encoding([encoding for encoding in ENCODING_SUFFIXES if encoding in encodings])
+        if encoding is None:
+            response = serve_static_file(filename=filename)
+        else:
+            response = send_from_directory(app.static_folder, filename + ENCODING_SUFFIXES[encoding],
+                                           mimetype=mimetypes.guess_type(filename)[0],
+                                           max_age=app.get_send_file_max_age(filename))
+            response.headers['Content-Encoding'] = encoding
+        response.vary.add('Accept-Encoding')
+        return response
+
+    app.view_functions['static'] = static
+
+def main():
+    """Pre-compress the static assets"""
+    static_folder = sys.argv[1] if len(sys.argv) > 1 else str(Path(__file__).parent / 'static')
+    written = precompress_static(static_folder)
+
+    print(f"🗜️  Pre-compressed static assets in {static_folder} ({', '.join(available_encodings())})")
+    for entry in written:
+        sizes = ', '.join(f"{encoding} {entry[encoding]:,}" for encoding in available_encodings())
+        print(f"   {entry['file']}: {entry['identity']:,} bytes -> {sizes}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Result Cache
+SQLite-backed LRU/TTL cache for validation and planning results, shared by every worker on a host
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, Any, Optional
+
+DEFAULT_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'housing_compliance_results.sqlite')
+
+def canonical_hash(payload: Any) -> str:
+    """SHA-256 of a payload serialized with sorted keys and no insignificant whitespace"""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class ResultCache:
+    """Content-addressed result cache; keys combine namespace, code version, ruleset version and project hash
+
+    code_version names the code that produces the cached results, so results written by
+    an older deploy sharing the same cache file are never read back.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_entries: int = 4096, ttl_seconds: float = 3600,
+                 touch_interval: float = 30.0, flush_interval: float = 1.0, code_version: str = ''):
+        self.path = path
+        self.code_version = code_version
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Hits stay read-only: recency is refreshed at most every touch_interval seconds
+        # and counters are buffered in-process, flushed every flush_interval seconds
+        self.touch_interval = touch_interval
+        self.flush_interval = flush_interval
+        self.local = threading.local()
+        self.pending_counts = {}
+        self.pending_lock = threading.Lock()
+        self.last_flush = time.time()
+
+        with self.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    accessed REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+            conn.execute("CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+
+    def connection(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets worker processes read while another writes"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or getattr(self.local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def make_key(self, namespace: str, version: str, payload: Any) -> str:
+        """Cache key for a payload under a namespace and ruleset version"""
+        return f"{namespace}:{self.code_version}:{version}:{canonical_hash(payload)}"
+
+    def count(self, name: str):
+        """Buffer a counter increment, flushing to the shared table periodically"""
+        with self.pending_lock:
+            self.pending_counts[name] = self.pending_counts.get(name, 0) + 1
+        if time.time() - self.last_flush >= self.flush_interval:
+            self.flush_counts()
+
+    def flush_counts(self):
+        """Write buffered counter increments to the shared counters table"""
+        with self.pending_lock:
+            pending, self.pending_counts = self.pending_counts, {}
+            self.last_flush = time.time()
+        if not pending:
+            return
+        with self.connection() as conn:
+            conn.executemany("INSERT INTO counters (name, value) VALUES (?, ?) "
+                             "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                             list(pending.items()))
+
+    def get(self, namespace: str, version: str, payload: Any) -> Optional[Any]:
+        """Cached result for payload, or None on a miss or expired entry"""
+        key = self.make_key(namespace, version, payload)
+        now = time.time()
+
+        conn = self.connection()
+        row = conn.execute("SELECT value, created, accessed FROM results WHERE key = ?", (key,)).fetchone()
+        if row is not None and now - row[1] > self.ttl_seconds:
+            with conn:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            row = None
+
+        if row is None:
+            self.count(f"{namespace}.misses")
+            return None
+
+        if now - row[2] > self.touch_interval:
+            with conn:
+                conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        self.count(f"{namespace}.hits")
+        return json.loads(row[0])
+
+    def put(self, namespace: str, version: str, payload: Any, result: Any):
+        """Store a result, evicting the least recently used entries beyond max_entries"""
+        key = self.make_key(namespace, version, payload)
+        now = time.time()
+        value = json.dumps(result, default=str)
+
+        with self.connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO results (key, namespace, value, created, accessed) "
+                         "VALUES (?, ?, ?, ?, ?)", (key, namespace, value, now, now))
+            conn.execute("DELETE FROM results WHERE created < ?", (now - self.ttl_seconds,))
+            conn.execute("""
+                DELETE FROM results WHERE key IN (
+                    SELECT key FROM results ORDER BY accessed DESC LIMIT -1 OFFSET ?
+                )
+            """, (self.max_entries,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per namespace (summed over all workers) and current size"""
+        self.flush_counts()
+        conn = self.connection()
+        counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+        entries = conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+        namespaces = {}
+        for name, value in counters.items():
+            namespace, kind = name.rsplit('.', 1)
+            namespaces.setdefault(namespace, {'hits': 0, 'misses': 0})[kind] = value
+        for entry in namespaces.values():
+            total = entry['hits'] + entry['misses']
+            entry['hit_rate'] = entry['hits'] / total if total else 0.0
+
+        return {
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'namespaces': namespaces
+        }
+
+    def reset_after_fork(self):
+        """Fresh lock, connections and counter buffer in a forked child"""
+        self.local = threading.local()
+        self.pending_lock = threading.Lock()
+        self.pending_counts = {}
+        self.last_flush = time.time()
+
+    def clear(self):
+        """Drop every cached result and reset the counters"""
+        with self.pending_lock:
+            self.pending_counts = {}
+        with self.connection() as conn:
+            conn.execute("DELETE FROM results")
+            conn.execute("DELETE FROM counters")
@@ -5,15 +5,182 @@ Takes existing project data and validates against all extracted zoning rules
 """
 
 import json
-import re
+import threading
+import time
+import numpy as np
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Tuple, Optional
 from datetime import datetime
+from rule_compiler import compile_ruleset, DEFAULT_ZONE, ZONE_SCOPED_CHECKS
+from validation_trace import ValidationReporter, ConsoleReporter
+from rule_catalog import stable_rule_id, catalog_version
+from rule_bundle import load_bundled_rules, BUNDLE_FILENAME
+from rule_stream import stream_rules, slim_rule
+from rule_constants import scan_rule
+from keyword_classifier import KeywordClassifier
+from validation_result import CheckResult, MessageTemplate, Status, Criticality, result_dicts
+
+# Keywords that route a rule title into each validator's candidate bucket
+RULE_CATEGORY_KEYWORDS = {
+    'lot': ['lot'],
+    'setback': ['setback'],
+    'height': ['height'],
+    'floor_area': ['floor area', 'far', 'coverage'],
+    'parking': ['parking'],
+    'architectural': ['porch', 'bay', 'entry', 'window', 'balcony'],
+}
+RULE_CLASSIFIER = KeywordClassifier(RULE_CATEGORY_KEYWORDS)
+
+# Rule fields validation reads; everything else on an extracted rule is dropped at load time
+RULE_FIELDS = ('rule', 'Constants', 'Conditions', 'Variables', 'source_file', 'rule_id')
+
+# Order in which validators run and their results are reported
+VALIDATOR_ORDER = [
+    'validate_lot_requirements',
+    'validate_setbacks',
+    'validate_building_height',
+    'validate_floor_area',
+    'validate_parking',
+    'validate_architectural_features'
+]
+
+# Message formats per check outcome; results keep raw values and format on read
+MESSAGES = {
+    'min_lot_area_violation': MessageTemplate(('actual', 'threshold', 'zone'),
+        'Lot area {actual:,} sf < minimum {threshold:,} sf for {zone}', '{threshold:,} sf minimum', '{actual:,} sf'),
+    'min_lot_area_compliant': MessageTemplate(('actual', 'threshold', 'zone'),
+        'Lot area {actual:,} sf meets minimum {threshold:,} sf for {zone}', '{threshold:,} sf minimum', '{actual:,} sf'),
+    'max_lot_area_violation': MessageTemplate(('actual', 'threshold', 'zone'),
+        'Lot area {actual:,} sf > maximum {threshold:,} sf for {zone}', '{threshold:,} sf maximum', '{actual:,} sf'),
+    'min_lot_width_violation': MessageTemplate(('actual', 'threshold'),
+        'Lot width {actual} ft < minimum {threshold} ft', '{threshold} ft minimum', '{actual} ft'),
+    'setback_violation': MessageTemplate(('label', 'actual', 'threshold'),
+        '{label} {actual} ft < minimum {threshold} ft', '{threshold} ft minimum', '{actual} ft'),
+    'setback_compliant': MessageTemplate(('label', 'actual', 'threshold'),
+        '{label} {actual} ft meets minimum {threshold} ft', '{threshold} ft minimum', '{actual} ft'),
+    'height_violation': MessageTemplate(('actual', 'threshold'),
+        'Building height {actual} ft > maximum {threshold} ft', '{threshold} ft maximum', '{actual} ft'),
+    'height_compliant': MessageTemplate(('actual', 'threshold'),
+        'Building height {actual} ft within maximum {threshold} ft', '{threshold} ft maximum', '{actual} ft'),
+    'far_violation': MessageTemplate(('actual', 'threshold', 'gross_floor_area', 'lot_area'),
+        'FAR {actual:.3f} ({gross_floor_area:,} sf / {lot_area:,} sf) > maximum {threshold}', '{threshold} maximum', '{actual:.3f}'),
+    'far_compliant': MessageTemplate(('actual', 'threshold'),
+        'FAR {actual:.3f} within maximum {threshold}', '{threshold} maximum', '{actual:.3f}'),
+    'parking_violation': MessageTemplate(('actual', 'threshold'),
+        'Provided {actual} parking spaces < required {threshold} spaces', '{threshold} spaces minimum', '{actual} spaces'),
+    'parking_compliant': MessageTemplate(('actual', 'threshold'),
+        'Provided {actual} spaces meets requirement of {threshold} spaces', '{threshold} spaces minimum', '{actual} spaces'),
+    'porch_height_warning': MessageTemplate(('number', 'actual', 'threshold'),
+        'Porch {number} height {actual} ft may require special review (>{threshold} ft)', '≤{threshold} ft typical', '{actual} ft'),
+}
+
+def depends_on(*fields: str):
+    """Declare the dotted project fields a validate_* method reads"""
+    def decorator(method):
+        method.input_fields = fields
+        return method
+    return decorator
+
+def fields_overlap(changed: str, declared: str) -> bool:
+    """True if a change at one dotted path can affect a field declared at another"""
+    return (changed == declared
+            or changed.startswith(declared + '.')
+            or declared.startswith(changed + '.'))
+
+def is_critical_violation(result: Dict[str, Any]) -> bool:
+    """A violation that blocks the project from proceeding"""
+    return result['status'] == 'VIOLATION' and result['criticality'] == 'CRITICAL'
+
+class ValidatorStats:
+    """Running cost and critical-violation rate per validator, used to order fail-fast runs
+    
+    Shared by every request thread; the counters are only read and written under lock.
+    """
+    
+    def __init__(self):
+        self.runs = {name: 0 for name in VALIDATOR_ORDER}
+        self.total_ms = {name: 0.0 for name in VALIDATOR_ORDER}
+        self.critical_runs = {name: 0 for name in VALIDATOR_ORDER}
+        self.lock = threading.Lock()
+    
+    def record(self, name: str, duration_ms: float, found_critical: bool):
+        with self.lock:
+            self.runs[name] += 1
+            self.total_ms[name] += duration_ms
+            if found_critical:
+                self.critical_runs[name] += 1
+    
+    def mean_ms(self, name: str) -> float:
+        return self.total_ms[name] / self.runs[name] if self.runs[name] else 0.0
+    
+    def critical_rate(self, name: str) -> float:
+        """Laplace-smoothed share of runs that found a critical violation"""
+        return (self.critical_runs[name] + 1) / (self.runs[name] + 2)
+    
+    def fail_fast_order(self) -> List[str]:
+        """Cheapest, most selective validators first: ascending expected cost per critical hit
+        
+        Validators that have never run cost 0, so they run first until measured.
+        Ties keep VALIDATOR_ORDER.
+        """
+        with self.lock:
+            return self.ordered()
+    
+    def ordered(self) -> List[str]:
+        # Caller holds the lock
+        return sorted(VALIDATOR_ORDER, key=lambda name: self.mean_ms(name) / self.critical_rate(name))
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self.lock:
+            return {
+                name: {
+                    'runs': self.runs[name],
+                    'mean_ms': self.mean_ms(name),
+                    'critical_rate': self.critical_rate(name)
+                }
+                for name in self.ordered()
+            }
+    
+    def reset_after_fork(self):
+        """Fresh lock in a forked child; the learned counters carry over"""
+        self.lock = threading.Lock()
+
+# Per-process validator used by process-pool workers (see make_process_executor)
+_worker_validator = None
+
+def init_worker_validator(validator_class: type, rules_directory: str):
+    """Process pool initializer: load and compile the rules once per worker"""
+    global _worker_validator
+    _worker_validator = validator_class(rules_directory)
+
+def run_worker_validator(name: str, project_data: Dict[str, Any]) -> Tuple[List[CheckResult], float]:
+    """Run one validator family in a pool worker, returning its results and duration"""
+    return _worker_validator.timed_validator(name, project_data)
+
+def make_process_executor(rules_directory: str = "rules_extraction_v3_20250916_161035", max_workers: Optional[int] = None,
+                          validator_class: Optional[type] = None) -> ProcessPoolExecutor:
+    """Process pool whose workers each hold a loaded validator, for ReverseComplianceValidator(executor=...)"""
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=init_worker_validator,
+                               initargs=(validator_class or ReverseComplianceValidator, rules_directory))
 
 class ReverseComplianceValidator:
-    def __init__(self, rules_directory: str = "rules_extraction_v3_20250916_161035"):
+    def __init__(self, rules_directory: str = "rules_extraction_v3_20250916_161035",
+                 reporter: Optional[ValidationReporter] = None, executor: Optional[Executor] = None,
+                 rules: Optional[List[Dict[str, Any]]] = None):
         self.rules_directory = Path(rules_directory)
+        # Silent by default; pass ConsoleReporter() for CLI output
+        self.reporter = reporter or ValidationReporter()
+        # Optional thread or process pool that runs validator families concurrently;
+        # a process pool must come from make_process_executor
+        self.executor = executor
         self.all_rules = []
+        self.load_errors = []
+        self.keyword_index = {}
+        self.category_index = {}
+        self.compiled_rules = None
+        self.catalog_version = None
+        self.validator_stats = ValidatorStats()
         self.zone_requirements = {
             'R-1': {'min_area': 6000, 'max_area': 9999, 'min_width': 60, 'min_depth': 100},
             'R-1(7000)': {'min_area': 7000, 'max_area': 13999, 'min_width': 60, 'min_depth': 100},
@@ -21,66 +188,124 @@ class ReverseComplianceValidator:
             'R-1(10000)': {'min_area': 10000, 'max_area': 19999, 'min_width': 60, 'min_depth': 100},
             'R-1(20000)': {'min_area': 20000, 'max_area': 39999, 'min_width': 60, 'min_depth': 100}
         }
-        self.load_rules()
-        print(f"🔍 Reverse Validator initialized with {len(self.all_rules)} rules")
+        # Fallback thresholds, used only where no rule constant compiles
+        self.setback_minimums = {
+            'front_setback': 20,
+            'rear_setback': 25,
+            'side_setback_left': 6,
+            'side_setback_right': 6
+        }
+        self.max_height = 30  # Standard single-family height limit
+        self.max_far = 0.45  # 45% typical FAR
+        self.required_parking_spaces = 2  # Standard for single-family
+        self.porch_review_height = 12  # Porches over 12' may have special rules
+        self.field_dependencies = self.build_field_dependencies()
+        self.load_rules(rules)
+        self.reporter.on_rules_loaded(len(self.all_rules))
     
-    def load_rules(self):
-        """Load all extracted rules from JSON files"""
-        rule_files = list(self.rules_directory.glob("*_rules.json"))
+    def load_rules(self, rules: Optional[List[Dict[str, Any]]] = None):
+        """Load all extracted rules, from the precompiled bundle when it is current, else streamed from JSON files
         
-        for rule_file in rule_files:
+        rules, when given (e.g. one zone shard), are used as-is instead of reading rules_directory.
+        """
+        if rules is None:
             try:
-                with open(rule_file, 'r') as f:
-                    data = json.load(f)
-                
-                if data.get('success') and 'extracted_rules' in data.get('analysis', {}):
-                    rules = data['analysis']['extracted_rules']
-                    
-                    if isinstance(rules, list):
-                        for rule in rules:
-                            if isinstance(rule, dict) and 'rule' in rule:
-                                rule['source_file'] = rule_file.name
-                                rule['rule_id'] = self.generate_rule_id(rule)
-                                self.all_rules.append(rule)
-            except Exception as e:
-                print(f"❌ Error loading {rule_file}: {e}")
+                bundled_rules = load_bundled_rules(self.rules_directory)
+            except (ValueError, OSError) as e:
+                bundled_rules = None
+                self.load_errors.append({'file': BUNDLE_FILENAME, 'error': str(e)})
+                self.reporter.on_load_error(BUNDLE_FILENAME, e)
+            
+            rules = (slim_rule(rule, RULE_FIELDS) for rule in bundled_rules) if bundled_rules is not None \
+                else self.stream_rule_files()
+        
+        self.reset_rule_index()
+        for rule in rules:
+            self.all_rules.append(rule)
+            self.index_rule(rule)
+        
+        self.catalog_version = catalog_version([rule['rule_id'] for rule in self.all_rules])
+        self.scan_numeric_constants()
+        self.compile_rules()
+    
+    def scan_numeric_constants(self):
+        """Attach typed (value, unit, comparator, label) constants to every rule; the compiler reads thresholds from them
+        
+        Rules shared between validators, such as a shard's common rules, are scanned once.
+        """
+        for rule in self.all_rules:
+            if 'numeric_constants' not in rule:
+                rule['numeric_constants'] = scan_rule(rule)
+    
+    def on_rule_file_error(self, file_name: str, error: Exception):
+        self.load_errors.append({'file': file_name, 'error': str(error)})
+        self.reporter.on_load_error(file_name, error)
+    
+    def stream_rule_files(self):
+        """Rules from every page file, read incrementally and trimmed to RULE_FIELDS as they arrive
+
+        all_rules keeps every trimmed rule, so load memory still grows with the corpus;
+        streaming bounds the parse, not the rules held.
+        """
+        rule_files = sorted(self.rules_directory.glob("*_rules.json"))
+        return stream_rules(rule_files, RULE_FIELDS, on_error=self.on_rule_file_error)
+    
+    def reset_rule_index(self):
+        self.keyword_index = {}
+        self.category_index = {category: [] for category in RULE_CATEGORY_KEYWORDS}
+    
+    def index_rule(self, rule: Dict[str, Any]):
+        """Add one rule to the keyword and category inverted indexes over rule titles"""
+        hits = RULE_CLASSIFIER.find(rule.get('rule', '').lower())
+        if not hits:
+            return
+        for category, keywords in RULE_CATEGORY_KEYWORDS.items():
+            matched = False
+            for keyword in keywords:
+                if keyword in hits:
+                    self.keyword_index.setdefault(keyword, []).append(rule)
+                    matched = True
+            if matched:
+                self.category_index[category].append(rule)
+    
+    def build_field_dependencies(self) -> Dict[str, List[str]]:
+        """Map each declared input field to the validators that read it"""
+        dependencies = {}
+        for name in VALIDATOR_ORDER:
+            for field in getattr(type(self), name).input_fields:
+                dependencies.setdefault(field, []).append(name)
+        return dependencies
+    
+    def threshold_defaults(self) -> Dict[str, Dict[str, float]]:
+        """Per-zone fallback thresholds for checks whose rules do not compile"""
+        defaults = {}
+        for zone, requirements in self.zone_requirements.items():
+            defaults[zone] = {
+                'min_lot_area': requirements['min_area'],
+                'max_lot_area': requirements['max_area'],
+                'min_lot_width': requirements['min_width'],
+                **self.setback_minimums,
+                'max_height': self.max_height,
+                'max_far': self.max_far,
+                'required_parking_spaces': self.required_parking_spaces
+            }
+        return defaults
+    
+    def compile_rules(self):
+        """Compile rule Constants into per-zone predicates, reporting anything that fails to compile"""
+        self.compiled_rules = compile_ruleset(self.all_rules, self.threshold_defaults())
+        self.reporter.on_rules_compiled(self.compiled_rules)
+    
+    def get_rules(self, category: str) -> List[Dict[str, Any]]:
+        """Get candidate rules for a validator category in load order"""
+        return self.category_index.get(category, [])
     
     def generate_rule_id(self, rule: Dict[str, Any]) -> str:
-        """Generate a unique rule ID based on title and category"""
-        title = rule.get('rule', 'Unknown').replace(' ', '_').replace('&', 'and')
-        # Clean up title for ID
-        clean_title = re.sub(r'[^a-zA-Z0-9_]', '', title)
-        return f"RULE_{clean_title[:20]}_{hash(rule.get('rule', '')) % 1000:03d}"
-    
-    def extract_numeric_value(self, text: str, units: str = None) -> Optional[float]:
-        """Extract numeric values from rule text"""
-        if not text:
-            return None
-        
-        # Look for patterns like "≥ 60", ">= 60", "minimum 60", "6,000", etc.
-        patterns = [
-            r'≥\s*([0-9,]+)',
-            r'>=\s*([0-9,]+)', 
-            r'minimum\s+([0-9,]+)',
-            r'min\s+([0-9,]+)',
-            r'([0-9,]+)\s*sf',
-            r'([0-9,]+)\s*ft',
-            r'([0-9,]+)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
-            if matches:
-                try:
-                    # Remove commas and convert to float
-                    value = float(matches[0].replace(',', ''))
-                    return value
-                except ValueError:
-                    continue
-        
-        return None
-    
-    def validate_lot_requirements(self, project_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Generate a content-addressed rule ID that is stable across processes and restarts"""
+        return stable_rule_id(rule)
+    
+    @depends_on('site_data.zone_district', 'site_data.lot_area', 'site_data.lot_width', 'site_data.lot_depth')
+    def validate_lot_requirements(self, project_data: Dict[str, Any]) -> List[CheckResult]:
         """Validate lot-related rules"""
         results = []
         site_data = project_data.get('site_data', {})
@@ -90,8 +315,11 @@ class ReverseComplianceValidator:
         lot_width = site_data.get('lot_width', 0)
         lot_depth = site_data.get('lot_depth', 0)
         
+        # Lot predicates only apply when the zone is known
+        predicates = self.compiled_rules.predicates.get(zone)
+        
         # Find lot-related rules
-        lot_rules = [rule for rule in self.all_rules if 'lot' in rule.get('rule', '').lower()]
+        lot_rules = self.get_rules('lot')
         
         for rule in lot_rules:
             rule_title = rule.get('rule', '')
@@ -100,98 +328,73 @@ class ReverseComplianceValidator:
             
             # Check minimum lot area
             if 'minimum' in rule_title.lower() and 'area' in rule_title.lower():
-                if zone in self.zone_requirements:
-                    min_area = self.zone_requirements[zone]['min_area']
-                    if lot_area < min_area:
-                        results.append({
-                            'rule_id': rule['rule_id'],
-                            'rule_title': rule_title,
-                            'status': 'VIOLATION',
-                            'criticality': 'CRITICAL',
-                            'message': f'Lot area {lot_area:,} sf < minimum {min_area:,} sf for {zone}',
-                            'expected': f'{min_area:,} sf minimum',
-                            'actual': f'{lot_area:,} sf',
-                            'violation_type': 'dimensional',
-                            'source_rule': rule.get('source_file', ''),
-                            'stop_condition': True
-                        })
+                if predicates:
+                    passed, _ = predicates['min_lot_area'](project_data)
+                    min_area = predicates['min_lot_area'].threshold
+                    if not passed:
+                        results.append(CheckResult(
+                            rule['rule_id'], rule_title, Status.VIOLATION, Criticality.CRITICAL,
+                            MESSAGES['min_lot_area_violation'], (lot_area, min_area, zone),
+                            rule.get('source_file', ''), violation_type='dimensional', stop_condition=True
+                        ))
                     else:
-                        results.append({
-                            'rule_id': rule['rule_id'],
-                            'rule_title': rule_title,
-                            'status': 'COMPLIANT',
-                            'criticality': 'HIGH',
-                            'message': f'Lot area {lot_area:,} sf meets minimum {min_area:,} sf for {zone}',
-                            'expected': f'{min_area:,} sf minimum',
-                            'actual': f'{lot_area:,} sf',
-                            'source_rule': rule.get('source_file', '')
-                        })
+                        results.append(CheckResult(
+                            rule['rule_id'], rule_title, Status.COMPLIANT, Criticality.HIGH,
+                            MESSAGES['min_lot_area_compliant'], (lot_area, min_area, zone),
+                            rule.get('source_file', '')
+                        ))
             
             # Check maximum lot area
             elif 'maximum' in rule_title.lower() and 'area' in rule_title.lower():
-                if zone in self.zone_requirements:
-                    max_area = self.zone_requirements[zone]['max_area']
-                    if lot_area > max_area:
-                        results.append({
-                            'rule_id': rule['rule_id'],
-                            'rule_title': rule_title,
-                            'status': 'VIOLATION',
-                            'criticality': 'HIGH',
-                            'message': f'Lot area {lot_area:,} sf > maximum {max_area:,} sf for {zone}',
-                            'expected': f'{max_area:,} sf maximum',
-                            'actual': f'{lot_area:,} sf',
-                            'violation_type': 'dimensional',
-                            'source_rule': rule.get('source_file', ''),
-                            'stop_condition': True
-                        })
+                if predicates:
+                    passed, _ = predicates['max_lot_area'](project_data)
+                    max_area = predicates['max_lot_area'].threshold
+                    if not passed:
+                        results.append(CheckResult(
+                            rule['rule_id'], rule_title, Status.VIOLATION, Criticality.HIGH,
+                            MESSAGES['max_lot_area_violation'], (lot_area, max_area, zone),
+                            rule.get('source_file', ''), violation_type='dimensional', stop_condition=True
+                        ))
             
             # Check lot width
             elif 'width' in rule_title.lower():
-                if zone in self.zone_requirements:
-                    min_width = self.zone_requirements[zone]['min_width']
-                    if lot_width < min_width:
-                        results.append({
-                            'rule_id': rule['rule_id'],
-                            'rule_title': rule_title,
-                            'status': 'VIOLATION',
-                            'criticality': 'CRITICAL',
-                            'message': f'Lot width {lot_width} ft < minimum {min_width} ft',
-                            'expected': f'{min_width} ft minimum',
-                            'actual': f'{lot_width} ft',
-                            'violation_type': 'dimensional',
-                            'source_rule': rule.get('source_file', ''),
-                            'stop_condition': True
-                        })
+                if predicates:
+                    passed, _ = predicates['min_lot_width'](project_data)
+                    min_width = predicates['min_lot_width'].threshold
+                    if not passed:
+                        results.append(CheckResult(
+                            rule['rule_id'], rule_title, Status.VIOLATION, Criticality.CRITICAL,
+                            MESSAGES['min_lot_width_violation'], (lot_width, min_width),
+                            rule.get('source_file', ''), violation_type='dimensional', stop_condition=True
+                        ))
         
         return results
     
-    def validate_setbacks(self, project_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @depends_on('site_data.zone_district', 'building_data.setbacks')
+    def validate_setbacks(self, project_data: Dict[str, Any]) -> List[CheckResult]:
         """Validate setback requirements"""
         results = []
-        building_data = project_data.get('building_data', {})
-        setbacks = building_data.get('setbacks', {})
-        
-        # Standard setback minimums (extracted from rules analysis)
-        setback_minimums = {
-            'front_setback': 20,
-            'rear_setback': 25,
-            'side_setback_left': 6,
-            'side_setback_right': 6
-        }
+        zone = project_data.get('site_data', {}).get('zone_district', '')
+        predicates = self.compiled_rules.for_zone(zone)
         
         # Find setback-related rules
-        setback_rules = [rule for rule in self.all_rules if 'setback' in rule.get('rule', '').lower()]
+        setback_rules = self.get_rules('setback')
+        
+        setback_labels = {setback_type: setback_type.replace('_', ' ').title() for setback_type in self.setback_minimums}
         
-        for setback_type, min_required in setback_minimums.items():
-            actual_setback = setbacks.get(setback_type, 0)
+        for setback_type in self.setback_minimums:
+            check = predicates[setback_type]
+            passed, actual_setback = check(project_data)
+            min_required = check.threshold
             
-            # Find specific rule for this setback type
-            relevant_rule = None
-            for rule in setback_rules:
-                rule_title = rule.get('rule', '').lower()
-                if setback_type.replace('_', ' ') in rule_title:
-                    relevant_rule = rule
-                    break
+            # Prefer the rule the threshold was compiled from, then a title match
+            relevant_rule = check.rule
+            if not relevant_rule:
+                for rule in setback_rules:
+                    rule_title = rule.get('rule', '').lower()
+                    if setback_type.replace('_', ' ') in rule_title:
+                        relevant_rule = rule
+                        break
             
             if not relevant_rule:
                 # Create generic setback rule
@@ -201,43 +404,33 @@ class ReverseComplianceValidator:
                     'source_file': 'derived_from_analysis'
                 }
             
-            if actual_setback < min_required:
-                results.append({
-                    'rule_id': relevant_rule['rule_id'],
-                    'rule_title': relevant_rule['rule'],
-                    'status': 'VIOLATION',
-                    'criticality': 'CRITICAL',
-                    'message': f'{setback_type.replace("_", " ").title()} {actual_setback} ft < minimum {min_required} ft',
-                    'expected': f'{min_required} ft minimum',
-                    'actual': f'{actual_setback} ft',
-                    'violation_type': 'setback',
-                    'source_rule': relevant_rule.get('source_file', ''),
-                    'stop_condition': True
-                })
+            label = setback_labels[setback_type]
+            if not passed:
+                results.append(CheckResult(
+                    relevant_rule['rule_id'], relevant_rule['rule'], Status.VIOLATION, Criticality.CRITICAL,
+                    MESSAGES['setback_violation'], (label, actual_setback, min_required),
+                    relevant_rule.get('source_file', ''), violation_type='setback', stop_condition=True
+                ))
             else:
-                results.append({
-                    'rule_id': relevant_rule['rule_id'],
-                    'rule_title': relevant_rule['rule'],
-                    'status': 'COMPLIANT',
-                    'criticality': 'HIGH',
-                    'message': f'{setback_type.replace("_", " ").title()} {actual_setback} ft meets minimum {min_required} ft',
-                    'expected': f'{min_required} ft minimum',
-                    'actual': f'{actual_setback} ft',
-                    'source_rule': relevant_rule.get('source_file', '')
-                })
+                results.append(CheckResult(
+                    relevant_rule['rule_id'], relevant_rule['rule'], Status.COMPLIANT, Criticality.HIGH,
+                    MESSAGES['setback_compliant'], (label, actual_setback, min_required),
+                    relevant_rule.get('source_file', '')
+                ))
         
         return results
     
-    def validate_building_height(self, project_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @depends_on('site_data.zone_district', 'building_data.building_height')
+    def validate_building_height(self, project_data: Dict[str, Any]) -> List[CheckResult]:
         """Validate building height requirements"""
         results = []
-        building_data = project_data.get('building_data', {})
-        building_height = building_data.get('building_height', 0)
-        
-        max_height = 30  # Standard single-family height limit
+        zone = project_data.get('site_data', {}).get('zone_district', '')
+        check = self.compiled_rules.for_zone(zone)['max_height']
+        passed, building_height = check(project_data)
+        max_height = check.threshold
         
         # Find height-related rules
-        height_rules = [rule for rule in self.all_rules if 'height' in rule.get('rule', '').lower()]
+        height_rules = self.get_rules('height')
         
         height_rule = {
             'rule_id': 'HEIGHT_MAX',
@@ -245,37 +438,28 @@ class ReverseComplianceValidator:
             'source_file': 'derived_from_analysis'
         }
         
-        if height_rules:
+        if check.rule:
+            height_rule = check.rule
+        elif height_rules:
             height_rule = height_rules[0]
         
-        if building_height > max_height:
-            results.append({
-                'rule_id': height_rule['rule_id'],
-                'rule_title': height_rule['rule'],
-                'status': 'VIOLATION',
-                'criticality': 'CRITICAL',
-                'message': f'Building height {building_height} ft > maximum {max_height} ft',
-                'expected': f'{max_height} ft maximum',
-                'actual': f'{building_height} ft',
-                'violation_type': 'height',
-                'source_rule': height_rule.get('source_file', ''),
-                'stop_condition': True
-            })
+        if not passed:
+            results.append(CheckResult(
+                height_rule['rule_id'], height_rule['rule'], Status.VIOLATION, Criticality.CRITICAL,
+                MESSAGES['height_violation'], (building_height, max_height),
+                height_rule.get('source_file', ''), violation_type='height', stop_condition=True
+            ))
         else:
-            results.append({
-                'rule_id': height_rule['rule_id'],
-                'rule_title': height_rule['rule'],
-                'status': 'COMPLIANT',
-                'criticality': 'HIGH',
-                'message': f'Building height {building_height} ft within maximum {max_height} ft',
-                'expected': f'{max_height} ft maximum',
-                'actual': f'{building_height} ft',
-                'source_rule': height_rule.get('source_file', '')
-            })
+            results.append(CheckResult(
+                height_rule['rule_id'], height_rule['rule'], Status.COMPLIANT, Criticality.HIGH,
+                MESSAGES['height_compliant'], (building_height, max_height),
+                height_rule.get('source_file', '')
+            ))
         
         return results
     
-    def validate_floor_area(self, project_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @depends_on('site_data.zone_district', 'site_data.lot_area', 'building_data.gross_floor_area')
+    def validate_floor_area(self, project_data: Dict[str, Any]) -> List[CheckResult]:
         """Validate floor area ratio requirements"""
         results = []
         site_data = project_data.get('site_data', {})
@@ -284,12 +468,12 @@ class ReverseComplianceValidator:
         lot_area = site_data.get('lot_area', 1)
         gross_floor_area = building_data.get('gross_floor_area', 0)
         
-        max_far = 0.45  # 45% typical FAR
-        actual_far = gross_floor_area / lot_area if lot_area > 0 else 0
+        check = self.compiled_rules.for_zone(site_data.get('zone_district', ''))['max_far']
+        passed, actual_far = check(project_data)
+        max_far = check.threshold
         
         # Find floor area related rules
-        far_rules = [rule for rule in self.all_rules if any(term in rule.get('rule', '').lower() 
-                                                          for term in ['floor area', 'far', 'coverage'])]
+        far_rules = self.get_rules('floor_area')
         
         far_rule = {
             'rule_id': 'FAR_MAX',
@@ -297,46 +481,37 @@ class ReverseComplianceValidator:
             'source_file': 'derived_from_analysis'
         }
         
-        if far_rules:
+        if check.rule:
+            far_rule = check.rule
+        elif far_rules:
             far_rule = far_rules[0]
         
-        if actual_far > max_far:
-            results.append({
-                'rule_id': far_rule['rule_id'],
-                'rule_title': far_rule['rule'],
-                'status': 'VIOLATION',
-                'criticality': 'CRITICAL',
-                'message': f'FAR {actual_far:.3f} ({gross_floor_area:,} sf / {lot_area:,} sf) > maximum {max_far}',
-                'expected': f'{max_far} maximum',
-                'actual': f'{actual_far:.3f}',
-                'violation_type': 'floor_area',
-                'source_rule': far_rule.get('source_file', ''),
-                'stop_condition': True
-            })
+        if not passed:
+            results.append(CheckResult(
+                far_rule['rule_id'], far_rule['rule'], Status.VIOLATION, Criticality.CRITICAL,
+                MESSAGES['far_violation'], (actual_far, max_far, gross_floor_area, lot_area),
+                far_rule.get('source_file', ''), violation_type='floor_area', stop_condition=True
+            ))
         else:
-            results.append({
-                'rule_id': far_rule['rule_id'],
-                'rule_title': far_rule['rule'],
-                'status': 'COMPLIANT',
-                'criticality': 'HIGH',
-                'message': f'FAR {actual_far:.3f} within maximum {max_far}',
-                'expected': f'{max_far} maximum',
-                'actual': f'{actual_far:.3f}',
-                'source_rule': far_rule.get('source_file', '')
-            })
+            results.append(CheckResult(
+                far_rule['rule_id'], far_rule['rule'], Status.COMPLIANT, Criticality.HIGH,
+                MESSAGES['far_compliant'], (actual_far, max_far),
+                far_rule.get('source_file', '')
+            ))
         
         return results
     
-    def validate_parking(self, project_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @depends_on('site_data.zone_district', 'parking_data.parking_spaces')
+    def validate_parking(self, project_data: Dict[str, Any]) -> List[CheckResult]:
         """Validate parking requirements"""
         results = []
-        parking_data = project_data.get('parking_data', {})
-        parking_spaces = parking_data.get('parking_spaces', 0)
-        
-        required_spaces = 2  # Standard for single-family
+        zone = project_data.get('site_data', {}).get('zone_district', '')
+        check = self.compiled_rules.for_zone(zone)['required_parking_spaces']
+        passed, parking_spaces = check(project_data)
+        required_spaces = check.threshold
         
         # Find parking-related rules
-        parking_rules = [rule for rule in self.all_rules if 'parking' in rule.get('rule', '').lower()]
+        parking_rules = self.get_rules('parking')
         
         parking_rule = {
             'rule_id': 'PARKING_MIN',
@@ -344,45 +519,35 @@ class ReverseComplianceValidator:
             'source_file': 'derived_from_analysis'
         }
         
-        if parking_rules:
+        if check.rule:
+            parking_rule = check.rule
+        elif parking_rules:
             parking_rule = parking_rules[0]
         
-        if parking_spaces < required_spaces:
-            results.append({
-                'rule_id': parking_rule['rule_id'],
-                'rule_title': parking_rule['rule'],
-                'status': 'VIOLATION',
-                'criticality': 'CRITICAL',
-                'message': f'Provided {parking_spaces} parking spaces < required {required_spaces} spaces',
-                'expected': f'{required_spaces} spaces minimum',
-                'actual': f'{parking_spaces} spaces',
-                'violation_type': 'parking',
-                'source_rule': parking_rule.get('source_file', ''),
-                'stop_condition': True
-            })
+        if not passed:
+            results.append(CheckResult(
+                parking_rule['rule_id'], parking_rule['rule'], Status.VIOLATION, Criticality.CRITICAL,
+                MESSAGES['parking_violation'], (parking_spaces, required_spaces),
+                parking_rule.get('source_file', ''), violation_type='parking', stop_condition=True
+            ))
         else:
-            results.append({
-                'rule_id': parking_rule['rule_id'],
-                'rule_title': parking_rule['rule'],
-                'status': 'COMPLIANT',
-                'criticality': 'HIGH',
-                'message': f'Provided {parking_spaces} spaces meets requirement of {required_spaces} spaces',
-                'expected': f'{required_spaces} spaces minimum',
-                'actual': f'{parking_spaces} spaces',
-                'source_rule': parking_rule.get('source_file', '')
-            })
+            results.append(CheckResult(
+                parking_rule['rule_id'], parking_rule['rule'], Status.COMPLIANT, Criticality.HIGH,
+                MESSAGES['parking_compliant'], (parking_spaces, required_spaces),
+                parking_rule.get('source_file', '')
+            ))
         
         return results
     
-    def validate_architectural_features(self, project_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @depends_on('building_data.architectural_features')
+    def validate_architectural_features(self, project_data: Dict[str, Any]) -> List[CheckResult]:
         """Validate architectural feature requirements"""
         results = []
         building_data = project_data.get('building_data', {})
         arch_features = building_data.get('architectural_features', {})
         
         # Find architectural feature rules
-        arch_rules = [rule for rule in self.all_rules if any(term in rule.get('rule', '').lower() 
-                                                           for term in ['porch', 'bay', 'entry', 'window', 'balcony'])]
+        arch_rules = self.get_rules('architectural')
         
         # Validate porches if present
         porches = arch_features.get('porches', [])
@@ -390,37 +555,58 @@ class ReverseComplianceValidator:
             porch_height = porch.get('height', 0)
             
             # Find porch height rules
-            porch_rules = [rule for rule in arch_rules if 'porch' in rule.get('rule', '').lower()]
+            porch_rules = self.keyword_index.get('porch', [])
             
-            if porch_rules and porch_height > 12:  # Example: porches over 12' may have special rules
-                results.append({
-                    'rule_id': f'PORCH_{i}_HEIGHT',
-                    'rule_title': 'Porch Height Limitation',
-                    'status': 'WARNING',
-                    'criticality': 'MEDIUM',
-                    'message': f'Porch {i+1} height {porch_height} ft may require special review (>12 ft)',
-                    'expected': '≤12 ft typical',
-                    'actual': f'{porch_height} ft',
-                    'violation_type': 'architectural',
-                    'source_rule': porch_rules[0].get('source_file', '')
-                })
+            if porch_rules and porch_height > self.porch_review_height:
+                results.append(CheckResult(
+                    f'PORCH_{i}_HEIGHT', 'Porch Height Limitation', Status.WARNING, Criticality.MEDIUM,
+                    MESSAGES['porch_height_warning'], (i + 1, porch_height, self.porch_review_height),
+                    porch_rules[0].get('source_file', ''), violation_type='architectural'
+                ))
         
         return results
     
-    def perform_comprehensive_validation(self, project_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Perform comprehensive validation against all applicable rules"""
-        print(f"🔍 REVERSE COMPLIANCE VALIDATION")
-        print(f"Project: {project_data.get('project_info', {}).get('project_name', 'Unnamed')}")
-        print("=" * 60)
-        
-        # Run all validation checks
+    def timed_validator(self, name: str, project_data: Dict[str, Any]) -> Tuple[List[CheckResult], float]:
+        """Run one validate_* method, returning its results and duration in milliseconds"""
+        start = time.perf_counter()
+        results = getattr(self, name)(project_data)
+        return results, (time.perf_counter() - start) * 1000
+    
+    def run_validators_parallel(self, project_data: Dict[str, Any], validator_names: List[str]) -> Dict[str, List[CheckResult]]:
+        """Submit every named validator to the executor and collect results in the requested order"""
+        if isinstance(self.executor, ProcessPoolExecutor):
+            futures = [self.executor.submit(run_worker_validator, name, project_data) for name in validator_names]
+        else:
+            futures = [self.executor.submit(self.timed_validator, name, project_data) for name in validator_names]
+        
+        # Merge in submission order, not completion order, so output is deterministic
+        results_by_validator = {}
+        for name, future in zip(validator_names, futures):
+            results, duration_ms = future.result()
+            results_by_validator[name] = results
+            if self.reporter.records_spans:
+                self.reporter.on_span(name, duration_ms)
+        return results_by_validator
+    
+    def run_validators(self, project_data: Dict[str, Any], validator_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run the named validate_* methods and keep their results apart"""
+        if self.executor is not None and len(validator_names) > 1:
+            return self.run_validators_parallel(project_data, validator_names)
+        
+        if not self.reporter.records_spans:
+            return {name: getattr(self, name)(project_data) for name in validator_names}
+        
+        results_by_validator = {}
+        for name in validator_names:
+            results_by_validator[name], duration_ms = self.timed_validator(name, project_data)
+            self.reporter.on_span(name, duration_ms)
+        return results_by_validator
+    
+    def summarize_validation(self, project_data: Dict[str, Any], results_by_validator: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Combine per-validator results into the comprehensive validation result"""
         all_results = []
-        all_results.extend(self.validate_lot_requirements(project_data))
-        all_results.extend(self.validate_setbacks(project_data))
-        all_results.extend(self.validate_building_height(project_data))
-        all_results.extend(self.validate_floor_area(project_data))
-        all_results.extend(self.validate_parking(project_data))
-        all_results.extend(self.validate_architectural_features(project_data))
+        for name in VALIDATOR_ORDER:
+            all_results.extend(results_by_validator.get(name, []))
         
         # Categorize results
         violations = [r for r in all_results if r['status'] == 'VIOLATION']
@@ -446,48 +632,213 @@ class ReverseComplianceValidator:
             'compliance_percentage': (len(compliant) / len(all_results) * 100) if all_results else 0
         }
         
-        # Print summary
-        print(f"📊 VALIDATION SUMMARY:")
-        print(f"   Overall Status: {'✅ COMPLIANT' if overall_status == 'COMPLIANT' else '❌ NON-COMPLIANT'}")
-        print(f"   Can Proceed: {'✅ YES' if can_proceed else '❌ NO'}")
-        print(f"   Rules Checked: {len(all_results)}")
-        print(f"   Compliant: {len(compliant)}")
-        print(f"   Violations: {len(violations)}")
-        print(f"   Warnings: {len(warnings)}")
-        print(f"   Critical Violations: {len(critical_violations)}")
-        print(f"   Compliance Rate: {summary['compliance_percentage']:.1f}%")
-        
-        # Print detailed results
-        if violations:
-            print(f"\n🚨 VIOLATIONS:")
-            for violation in violations:
-                critical_flag = " [CRITICAL]" if violation['criticality'] == 'CRITICAL' else ""
-                print(f"   ❌ {violation['rule_title']}: {violation['message']}{critical_flag}")
-        
-        if warnings:
-            print(f"\n⚠️  WARNINGS:")
-            for warning in warnings:
-                print(f"   ⚠️  {warning['rule_title']}: {warning['message']}")
-        
-        if compliant and len(compliant) <= 10:  # Show compliant items if not too many
-            print(f"\n✅ COMPLIANT ITEMS:")
-            for comp in compliant[:5]:  # Show first 5
-                print(f"   ✅ {comp['rule_title']}: {comp['message']}")
-            if len(compliant) > 5:
-                print(f"   ... and {len(compliant) - 5} more compliant items")
-        
         return {
             'summary': summary,
             'violations': violations,
             'warnings': warnings,
             'compliant': compliant,
-            'all_results': all_results
+            'all_results': all_results,
+            'results_by_validator': results_by_validator
         }
     
+    def run_validators_fail_fast(self, project_data: Dict[str, Any]) -> Tuple[Dict[str, List[Dict[str, Any]]], Optional[str]]:
+        """Run validators in learned order until one reports a critical violation
+        
+        Returns the results of the validators that ran and the one that stopped the run.
+        Every run updates validator_stats, which sets the order of the next one.
+        """
+        results_by_validator = {}
+        for name in self.validator_stats.fail_fast_order():
+            results, duration_ms = self.timed_validator(name, project_data)
+            found_critical = any(is_critical_violation(result) for result in results)
+            
+            self.validator_stats.record(name, duration_ms, found_critical)
+            self.reporter.on_span(name, duration_ms)
+            results_by_validator[name] = results
+            if found_critical:
+                return results_by_validator, name
+        return results_by_validator, None
+    
+    def perform_comprehensive_validation(self, project_data: Dict[str, Any], fail_fast: bool = False) -> Dict[str, Any]:
+        """Perform comprehensive validation against all applicable rules
+        
+        With fail_fast, stop at the first critical violation; the result then only
+        answers whether the project can proceed and lists the validators skipped.
+        """
+        if not fail_fast:
+            results_by_validator = self.run_validators(project_data, VALIDATOR_ORDER)
+            validation_results = self.summarize_validation(project_data, results_by_validator)
+        else:
+            results_by_validator, stopped_at = self.run_validators_fail_fast(project_data)
+            validation_results = self.summarize_validation(project_data, results_by_validator)
+            validation_results['fail_fast'] = {
+                'stopped_at': stopped_at,
+                'skipped': [name for name in VALIDATOR_ORDER if name not in results_by_validator]
+            }
+        self.reporter.on_validation_complete(validation_results)
+        return validation_results
+    
+    def affected_validators(self, changed_fields: List[str]) -> List[str]:
+        """Validators whose declared input fields overlap any changed field"""
+        affected = set()
+        for changed in changed_fields:
+            for field, validator_names in self.field_dependencies.items():
+                if fields_overlap(changed, field):
+                    affected.update(validator_names)
+        return [name for name in VALIDATOR_ORDER if name in affected]
+    
+    def revalidate(self, previous_results: Dict[str, Any], project_data: Dict[str, Any], changed_fields: List[str]) -> Dict[str, Any]:
+        """Re-run only the validators affected by changed_fields, reusing previous results for the rest
+        
+        project_data is the already-patched project; previous_results must come from
+        perform_comprehensive_validation or revalidate on the same ruleset.
+        """
+        # Validators a fail-fast run skipped have no previous results to reuse
+        affected = self.affected_validators(changed_fields)
+        previous_names = previous_results['results_by_validator']
+        stale = [name for name in VALIDATOR_ORDER if name in affected or name not in previous_names]
+        
+        results_by_validator = dict(previous_results['results_by_validator'])
+        results_by_validator.update(self.run_validators(project_data, stale))
+        
+        validation_results = self.summarize_validation(project_data, results_by_validator)
+        validation_results['revalidated'] = stale
+        self.reporter.on_validation_complete(validation_results)
+        return validation_results
+    
+    def build_batch_columns(self, projects: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Extract the fields the validators read into one NumPy column per field"""
+        zones = self.compiled_rules.zones
+        zone_codes = {zone: i for i, zone in enumerate(zones)}
+        
+        zone_column = []
+        lot_area = []
+        far_lot_area = []
+        lot_width = []
+        building_height = []
+        gross_floor_area = []
+        parking_spaces = []
+        high_porches = []
+        setback_columns = {setback_type: [] for setback_type in self.setback_minimums}
+        
+        for project in projects:
+            site_data = project.get('site_data', {})
+            building_data = project.get('building_data', {})
+            setbacks = building_data.get('setbacks', {})
+            porches = building_data.get('architectural_features', {}).get('porches', [])
+            
+            zone_column.append(zone_codes.get(site_data.get('zone_district', ''), -1))
+            lot_area.append(site_data.get('lot_area', 0))
+            far_lot_area.append(site_data.get('lot_area', 1))
+            lot_width.append(site_data.get('lot_width', 0))
+            building_height.append(building_data.get('building_height', 0))
+            gross_floor_area.append(building_data.get('gross_floor_area', 0))
+            parking_spaces.append(project.get('parking_data', {}).get('parking_spaces', 0))
+            high_porches.append(sum(1 for porch in porches if porch.get('height', 0) > self.porch_review_height))
+            for setback_type, values in setback_columns.items():
+                values.append(setbacks.get(setback_type, 0))
+        
+        columns = {
+            'zone': np.array(zone_column, dtype=np.int64),
+            'lot_area': np.array(lot_area, dtype=np.float64),
+            'far_lot_area': np.array(far_lot_area, dtype=np.float64),
+            'lot_width': np.array(lot_width, dtype=np.float64),
+            'building_height': np.array(building_height, dtype=np.float64),
+            'gross_floor_area': np.array(gross_floor_area, dtype=np.float64),
+            'parking_spaces': np.array(parking_spaces, dtype=np.float64),
+            'high_porches': np.array(high_porches, dtype=np.int64)
+        }
+        for setback_type, values in setback_columns.items():
+            columns[setback_type] = np.array(values, dtype=np.float64)
+        
+        # Per-project compiled thresholds; zone-scoped checks get NaN for unknown zones
+        for check in self.compiled_rules.for_zone(DEFAULT_ZONE):
+            fallback = np.nan if check in ZONE_SCOPED_CHECKS else self.compiled_rules.threshold(DEFAULT_ZONE, check)
+            lookup = np.array([self.compiled_rules.threshold(zone, check) for zone in zones] + [fallback], dtype=np.float64)
+            columns[f'{check}_threshold'] = lookup[columns['zone']]
+        
+        return columns
+    
+    def validate_batch(self, projects: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate many projects at once, evaluating each check as one array comparison
+        
+        Returns the same per-project summary as perform_comprehensive_validation,
+        without the individual result records or console output.
+        """
+        count = len(projects)
+        if count == 0:
+            return []
+        
+        columns = self.build_batch_columns(projects)
+        compliant = np.zeros(count, dtype=np.int64)
+        violations = np.zeros(count, dtype=np.int64)
+        critical = np.zeros(count, dtype=np.int64)
+        
+        def add_check(violated: np.ndarray, applies: np.ndarray, times: int, is_critical: bool, reports_compliant: bool = True):
+            violated = violated & applies
+            violations[:] += violated * times
+            if is_critical:
+                critical[:] += violated * times
+            if reports_compliant:
+                compliant[:] += (applies & ~violated) * times
+        
+        # Lot checks run once per matching lot rule, mirroring validate_lot_requirements
+        min_area_rules = max_area_rules = width_rules = 0
+        for rule in self.get_rules('lot'):
+            rule_title = rule.get('rule', '').lower()
+            if 'minimum' in rule_title and 'area' in rule_title:
+                min_area_rules += 1
+            elif 'maximum' in rule_title and 'area' in rule_title:
+                max_area_rules += 1
+            elif 'width' in rule_title:
+                width_rules += 1
+        
+        zone_known = columns['zone'] >= 0
+        add_check(columns['lot_area'] < columns['min_lot_area_threshold'], zone_known, min_area_rules, True)
+        add_check(columns['lot_area'] > columns['max_lot_area_threshold'], zone_known, max_area_rules, False, reports_compliant=False)
+        add_check(columns['lot_width'] < columns['min_lot_width_threshold'], zone_known, width_rules, True, reports_compliant=False)
+        
+        always = np.ones(count, dtype=bool)
+        for setback_type in self.setback_minimums:
+            add_check(columns[setback_type] < columns[f'{setback_type}_threshold'], always, 1, True)
+        
+        add_check(columns['building_height'] > columns['max_height_threshold'], always, 1, True)
+        
+        far_lot_area = columns['far_lot_area']
+        actual_far = np.divide(columns['gross_floor_area'], far_lot_area,
+                               out=np.zeros(count, dtype=np.float64), where=far_lot_area > 0)
+        add_check(actual_far > columns['max_far_threshold'], always, 1, True)
+        
+        add_check(columns['parking_spaces'] < columns['required_parking_spaces_threshold'], always, 1, True)
+        
+        warnings = columns['high_porches'] if self.keyword_index.get('porch') else np.zeros(count, dtype=np.int64)
+        total = compliant + violations + warnings
+        percentage = np.divide(compliant * 100, total, out=np.zeros(count, dtype=np.float64), where=total > 0)
+        
+        timestamp = datetime.now().isoformat()
+        summaries = []
+        for i, (n_compliant, n_violations, n_warnings, n_critical, n_total, pct) in enumerate(zip(
+                compliant.tolist(), violations.tolist(), warnings.tolist(),
+                critical.tolist(), total.tolist(), percentage.tolist())):
+            summaries.append({
+                'validation_timestamp': timestamp,
+                'project_name': projects[i].get('project_info', {}).get('project_name', 'Unnamed'),
+                'overall_status': 'COMPLIANT' if n_violations == 0 else 'NON_COMPLIANT',
+                'can_proceed': n_critical == 0,
+                'total_rules_checked': n_total,
+                'compliant_rules': n_compliant,
+                'violations': n_violations,
+                'warnings': n_warnings,
+                'critical_violations': n_critical,
+                'compliance_percentage': pct
+            })
+        
+        return summaries
+    
     def generate_violation_report(self, validation_results: Dict[str, Any], output_file: str = None):
         """Generate detailed violation report"""
-        violations = validation_results['violations']
-        warnings = validation_results['warnings']
+        violations = result_dicts(validation_results['violations'])
+        warnings = result_dicts(validation_results['warnings'])
         summary = validation_results['summary']
         
         report = {
@@ -587,7 +938,7 @@ def main():
                 'gross_floor_area': 4000,  # TOO LARGE
                 'setbacks': {
                     'front_setback': 15,  # TOO SMALL
-                    'rear_setback': 20,   # TOO SMALL
+                    'rear_setback': 15,   # TOO SMALL
                     'side_setback_left': 4,   # TOO SMALL
                     'side_setback_right': 5   # TOO SMALL
                 },
@@ -604,7 +955,7 @@ def main():
     ]
     
     # Initialize validator
-    validator = ReverseComplianceValidator()
+    validator = ReverseComplianceValidator(reporter=ConsoleReporter())
     
     # Test both projects
     for project in sample_projects:
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Rule Bundle
+Compiles a rule extraction directory into one versioned binary file that loaders memory-map
+"""
+
+import hashlib
+import marshal
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional
+
+from rule_catalog import stable_rule_id, catalog_version
+from rule_stream import iter_page_rules
+
+BUNDLE_FILENAME = "rules.bundle"
+BUNDLE_MAGIC = b'HCRULES\x00'
+BUNDLE_FORMAT_VERSION = 1
+
+# magic, format version, marshal version, rule count, file count, catalog version,
+# source file stat digest, source file content digest
+HEADER = struct.Struct('<8sIIII16s40s40s')
+
+def source_stat_digest(rule_files: List[Path]) -> str:
+    """Digest of rule file names, sizes and modification times; a stat call per file"""
+    digest = hashlib.sha1()
+    for rule_file in rule_files:
+        stat = rule_file.stat()
+        digest.update(f"{rule_file.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def source_content_digest(rule_files: List[Path]) -> str:
+    """Digest of rule file names and bytes; survives checkouts and copies that reset mtimes"""
+    digest = hashlib.sha1()
+    for rule_file in rule_files:
+        digest.update(rule_file.name.encode('utf-8') + b'\0')
+        digest.update(rule_file.read_bytes())
+    return digest.hexdigest()
+
+def rule_files_in(rules_directory: Path) -> List[Path]:
+    return sorted(Path(rules_directory).glob("*_rules.json"))
+
+def read_rule_files(rule_files: List[Path]) -> Iterator[Dict[str, Any]]:
+    """Yield every extracted rule from page files, tagged with its source file
+
+    Pages are read incrementally; page-level data such as raw_response is skipped, never decoded.
+    """
+    for rule_file in rule_files:
+        for rule in iter_page_rules(rule_file):
+            rule['source_file'] = rule_file.name
+            yield rule
+
+def intern_keys(value: Any) -> Any:
+    """Recursively intern dict keys so identical keys are one shared object"""
+    if isinstance(value, dict):
+        return {sys.intern(key) if isinstance(key, str) else key: intern_keys(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [intern_keys(item) for item in value]
+    return value
+
+def build_rule_bundle(rules_directory: str, bundle_path: Optional[str] = None) -> Path:
+    """Write the bundle: a fixed header followed by the rule list as one marshal payload
+
+    Keys are interned first so marshal stores each field name once for the whole corpus.
+    """
+    rules_directory = Path(rules_directory)
+    bundle_path = Path(bundle_path) if bundle_path else rules_directory / BUNDLE_FILENAME
+    rule_files = rule_files_in(rules_directory)
+
+    records = []
+    for record in read_rule_files(rule_files):
+        record['rule_id'] = stable_rule_id(record)
+        records.append(intern_keys(record))
+    payload = marshal.dumps(records)
+
+    header = HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, marshal.version, len(records), len(rule_files),
+                         catalog_version([record['rule_id'] for record in records]).encode('ascii'),
+                         source_stat_digest(rule_files).encode('ascii'),
+                         source_content_digest(rule_files).encode('ascii'))
+
+    # Write beside the target and rename so readers never see a partial bundle
+    tmp_path = bundle_path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(payload)
+    tmp_path.replace(bundle_path)
+    return bundle_path
+
+class RuleBundle:
+    """Read-only view of a bundle file; the header is read from the mapping without decoding any rules"""
+
+    def __init__(self, bundle_path: str):
+        self.path = Path(bundle_path)
+        with open(self.path, 'rb') as f:
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # The file is closed by now; a header that fails to check must not leave the mapping open
+        try:
+            self.read_header()
+        except Exception:
+            self.mapping.close()
+            raise
+
+    def read_header(self):
+        if len(self.mapping) < HEADER.size:
+            raise ValueError(f"Not a rule bundle: {self.path}")
+
+        (magic, format_version, marshal_version, rule_count, file_count,
+         version, stat_digest, content_digest) = HEADER.unpack_from(self.mapping, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"Not a rule bundle: {self.path}")
+        if format_version != BUNDLE_FORMAT_VERSION or marshal_version != marshal.version:
+            raise ValueError(f"Unsupported rule bundle format {format_version}/{marshal_version} in {self.path}")
+
+        self.rule_count = rule_count
+        self.file_count = file_count
+        self.catalog_version = version.decode('ascii')
+        self.stat_digest = stat_digest.decode('ascii')
+        self.content_digest = content_digest.decode('ascii')
+
+    def __len__(self) -> int:
+        return self.rule_count
+
+    def rules(self) -> List[Dict[str, Any]]:
+        """Decode every rule straight from the mapped pages"""
+        payload = memoryview(self.mapping)[HEADER.size:]
+        try:
+            return marshal.loads(payload)
+        except (EOFError, TypeError) as e:
+            raise ValueError(f"Corrupt rule bundle {self.path}: {e}")
+        finally:
+            payload.release()
+
+    def is_current(self, rules_directory: str) -> bool:
+        """True if the bundle was built from the rule files now in rules_directory
+
+        Unchanged file stats settle it cheaply; otherwise compare file contents.
+        """
+        rule_files = rule_files_in(Path(rules_directory))
+        if self.stat_digest == source_stat_digest(rule_files):
+            return True
+        return self.content_digest == source_content_digest(rule_files)
+
+    def close(self):
+        self.mapping.close()
+
+def load_bundled_rules(rules_directory: str) -> Optional[List[Dict[str, Any]]]:
+    """Rules from rules_directory's bundle, or None if there is no bundle or it is out of date"""
+    bundle_path = Path(rules_directory) / BUNDLE_FILENAME
+    if not bundle_path.exists():
+        return None
+
+    bundle = RuleBundle(bundle_path)
+    try:
+        if not bundle.is_current(rules_directory):
+            return None
+        return bundle.rules()
+    finally:
+        bundle.close()
+
+def main():
+    """Build the rule bundle for a rules directory"""
+    rules_directory = sys.argv[1] if len(sys.argv) > 1 else "rules_extraction_v3_20250916_161035"
+    bundle_path = build_rule_bundle(rules_directory)
+    bundle = RuleBundle(bundle_path)
+    source_bytes = sum(rule_file.stat().st_size for rule_file in rule_files_in(Path(rules_directory)))
+
+    print(f"📦 Rule bundle written: {bundle_path}")
+    print(f"   Rules: {len(bundle)} from {bundle.file_count} files")
+    print(f"   Catalog version: {bundle.catalog_version}")
+    print(f"   Size: {bundle_path.stat().st_size:,} bytes (sources: {source_bytes:,} bytes)")
+    bundle.close()
+
+if __name__ == "__main__":
+    main()
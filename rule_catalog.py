@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Rule Catalog
+Deterministic, content-addressed rule IDs and the persisted catalog that maps them to rules
+"""
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Iterable
+
+CATALOG_FILENAME = "rule_catalog.json"
+
+# Fields added at load time; they never contribute to a rule's identity
+LOAD_TIME_FIELDS = {'source_file', 'rule_id', 'numeric_constants'}
+
+def rule_content_hash(rule: Dict[str, Any]) -> str:
+    """SHA-1 of a rule's extracted content, independent of process, file and key order"""
+    content = {key: value for key, value in rule.items() if key not in LOAD_TIME_FIELDS}
+    canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+def stable_rule_id(rule: Dict[str, Any]) -> str:
+    """Readable title prefix plus a content hash, identical in every worker and across restarts"""
+    title = rule.get('rule', 'Unknown').replace(' ', '_').replace('&', 'and')
+    # Clean up title for ID
+    clean_title = re.sub(r'[^a-zA-Z0-9_]', '', title)
+    return f"RULE_{clean_title[:20]}_{rule_content_hash(rule)[:10]}"
+
+def catalog_version(rule_ids: List[str]) -> str:
+    """Version of a catalog: changes whenever any rule is added, removed or edited"""
+    return hashlib.sha1('\n'.join(sorted(rule_ids)).encode('utf-8')).hexdigest()[:16]
+
+def build_rule_catalog(rules: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Catalog entry per rule ID, listing every source file the rule appears in; rules are read once and not kept"""
+    entries = {}
+    for rule in rules:
+        rule_id = rule.get('rule_id') or stable_rule_id(rule)
+        entry = entries.setdefault(rule_id, {
+            'rule': rule.get('rule', ''),
+            'content_hash': rule_content_hash(rule),
+            'source_files': []
+        })
+        source_file = rule.get('source_file')
+        if source_file and source_file not in entry['source_files']:
+            entry['source_files'].append(source_file)
+
+    return {
+        'catalog_version': catalog_version(list(entries)),
+        'rule_count': len(entries),
+        'rules': dict(sorted(entries.items()))
+    }
+
+def write_rule_catalog(rules: Iterable[Dict[str, Any]], rules_directory: str) -> Path:
+    """Persist the catalog next to the rule files it describes"""
+    catalog = build_rule_catalog(rules)
+    catalog_path = Path(rules_directory) / CATALOG_FILENAME
+    with open(catalog_path, 'w') as f:
+        json.dump(catalog, f, indent=2)
+    return catalog_path
+
+def load_rule_catalog(rules_directory: str) -> Dict[str, Any]:
+    """Load a persisted catalog, or an empty one if none has been written"""
+    catalog_path = Path(rules_directory) / CATALOG_FILENAME
+    if not catalog_path.exists():
+        return {'catalog_version': None, 'rule_count': 0, 'rules': {}}
+    with open(catalog_path, 'r') as f:
+        return json.load(f)
+
+def main():
+    """Regenerate the rule catalog for a rules directory"""
+    from rule_bundle import read_rule_files, rule_files_in
+
+    rules_directory = sys.argv[1] if len(sys.argv) > 1 else "rules_extraction_v3_20250916_161035"
+    # Full rules, not the validator's trimmed copies, so content hashes cover every field;
+    # streamed straight into the catalog, which keeps only its entries
+    rules = read_rule_files(rule_files_in(Path(rules_directory)))
+    previous = load_rule_catalog(rules_directory)
+    catalog_path = write_rule_catalog(rules, rules_directory)
+    current = load_rule_catalog(rules_directory)
+
+    added = set(current['rules']) - set(previous['rules'])
+    removed = set(previous['rules']) - set(current['rules'])
+
+    print(f"📚 Rule catalog written: {catalog_path}")
+    print(f"   Version: {current['catalog_version']}")
+    print(f"   Rules: {current['rule_count']} ({len(added)} added, {len(removed)} removed)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Rule Compiler
+Turns the numeric constants scanned from rule Constants into cached, executable threshold predicates
+"""
+
+import hashlib
+import json
+import operator
+from typing import Dict, List, Any, Callable, Optional, Tuple
+
+from rule_constants import NumericConstant, scan_rule, find_constant
+
+# Zone used for zone-independent checks when a project names an unknown zone
+DEFAULT_ZONE = 'R-1'
+
+COMPARATORS = {
+    'min': operator.ge,
+    'max': operator.le
+}
+
+# Checks that only apply when the project's zone is known
+ZONE_SCOPED_CHECKS = {'min_lot_area', 'max_lot_area', 'min_lot_width'}
+
+def field_getter(path: Tuple[str, ...], default: float) -> Callable[[Dict[str, Any]], Any]:
+    """Build a closure that reads a nested project field"""
+    parents, leaf = path[:-1], path[-1]
+
+    def getter(project_data: Dict[str, Any]) -> Any:
+        data = project_data
+        for key in parents:
+            data = data.get(key, {})
+        return data.get(leaf, default)
+
+    return getter
+
+def floor_area_ratio(project_data: Dict[str, Any]) -> float:
+    """Gross floor area divided by lot area"""
+    lot_area = project_data.get('site_data', {}).get('lot_area', 1)
+    gross_floor_area = project_data.get('building_data', {}).get('gross_floor_area', 0)
+    return gross_floor_area / lot_area if lot_area > 0 else 0
+
+# Each spec names the rule (by title keyword) and constant that carries a threshold, and
+# the label of the scanned number to read from it (None for the constant's first number).
+# 'after' picks the number directly following the one with that label, as the Max that
+# follows each zone's Min. '{zone}' in a key or label is replaced with the zone being compiled.
+COMPILE_SPECS = [
+    {'check': 'min_lot_area', 'title': 'lot sizes', 'key': 'Numerical Values',
+     'label': '{zone}: min', 'comparator': 'min', 'unit': 'sf',
+     'getter': field_getter(('site_data', 'lot_area'), 0)},
+    {'check': 'max_lot_area', 'title': 'lot sizes', 'key': 'Numerical Values',
+     'label': 'max', 'after': '{zone}: min', 'comparator': 'max', 'unit': 'sf',
+     'getter': field_getter(('site_data', 'lot_area'), 0)},
+    {'check': 'min_lot_width', 'title': 'lot sizes', 'key': 'Numerical Values',
+     'label': 'minimum width', 'comparator': 'min', 'unit': 'ft',
+     'getter': field_getter(('site_data', 'lot_width'), 0)},
+    {'check': 'front_setback', 'title': 'setbacks by zone', 'key': '{zone}_Setbacks',
+     'label': 'front', 'comparator': 'min', 'unit': 'ft',
+     'getter': field_getter(('building_data', 'setbacks', 'front_setback'), 0)},
+    {'check': 'rear_setback', 'title': 'setbacks by zone', 'key': '{zone}_Setbacks',
+     'label': 'rear', 'comparator': 'min', 'unit': 'ft',
+     'getter': field_getter(('building_data', 'setbacks', 'rear_setback'), 0)},
+    {'check': 'side_setback_left', 'title': 'setbacks by zone', 'key': '{zone}_Setbacks',
+     'label': 'interior side', 'comparator': 'min', 'unit': 'ft',
+     'getter': field_getter(('building_data', 'setbacks', 'side_setback_left'), 0)},
+    {'check': 'side_setback_right', 'title': 'setbacks by zone', 'key': '{zone}_Setbacks',
+     'label': 'interior side', 'comparator': 'min', 'unit': 'ft',
+     'getter': field_getter(('building_data', 'setbacks', 'side_setback_right'), 0)},
+    {'check': 'max_height', 'title': 'maximum building height', 'key': 'height_limit_low_slope',
+     'label': None, 'comparator': 'max', 'unit': 'ft',
+     'getter': field_getter(('building_data', 'building_height'), 0)},
+    {'check': 'max_far', 'title': 'gross floor area', 'key': 'tier_1_gfa_ratio',
+     'label': None, 'comparator': 'max', 'unit': 'ratio',
+     'getter': floor_area_ratio},
+    {'check': 'required_parking_spaces', 'title': 'number of parking spaces', 'key': 'required_spaces_per_dwelling',
+     'label': None, 'comparator': 'min', 'unit': 'spaces',
+     'getter': field_getter(('parking_data', 'parking_spaces'), 0)},
+]
+
+_compiled_cache = {}
+
+class CompiledPredicate:
+    """A threshold check bound to a project field, compiled from one rule constant"""
+
+    def __init__(self, check: str, zone: str, comparator: str, threshold: float, unit: str,
+                 getter: Callable[[Dict[str, Any]], Any], rule: Optional[Dict[str, Any]] = None):
+        self.check = check
+        self.zone = zone
+        self.comparator = comparator
+        self.threshold = threshold
+        self.unit = unit
+        self.rule = rule
+        self.compiled = rule is not None
+
+        compare = COMPARATORS[comparator]
+
+        def evaluate(project_data: Dict[str, Any]) -> Tuple[bool, Any]:
+            actual = getter(project_data)
+            return compare(actual, threshold), actual
+
+        self.evaluate = evaluate
+
+    def __call__(self, project_data: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Return (passed, actual value) for a project"""
+        return self.evaluate(project_data)
+
+    def __repr__(self):
+        source = self.rule.get('rule') if self.rule else 'default'
+        return f"CompiledPredicate({self.check}, {self.zone}, {self.comparator} {self.threshold} {self.unit}, {source})"
+
+class CompiledRuleset:
+    """Predicates for every zone plus the compile-time report"""
+
+    def __init__(self, predicates: Dict[str, Dict[str, CompiledPredicate]], fallbacks: List[Dict[str, Any]],
+                 uncompiled_rules: List[Dict[str, Any]], fingerprint: str):
+        self.predicates = predicates
+        self.zones = list(predicates.keys())
+        self.fallbacks = fallbacks
+        self.uncompiled_rules = uncompiled_rules
+        self.fingerprint = fingerprint
+
+    def for_zone(self, zone: str) -> Dict[str, CompiledPredicate]:
+        """Predicates for a zone, falling back to the default zone for unknown zones"""
+        return self.predicates.get(zone) or self.predicates.get(DEFAULT_ZONE, {})
+
+    def threshold(self, zone: str, check: str) -> float:
+        """Compiled threshold for one check in one zone"""
+        return self.for_zone(zone)[check].threshold
+
+def spec_constant(constants: List[NumericConstant], key: str, label: Optional[str],
+                  after: Optional[str] = None) -> Optional[NumericConstant]:
+    """The scanned Constants number a spec reads from one rule, or None if the rule has none"""
+    if after is None:
+        return find_constant(constants, key=key, section='Constants', label=label)
+    anchor = find_constant(constants, key=key, section='Constants', label=after)
+    if anchor is None:
+        return None
+    position = constants.index(anchor) + 1
+    following = constants[position] if position < len(constants) else None
+    if following is None or following.key != key or following.label != label:
+        return None
+    return following
+
+def threshold_value(constant: NumericConstant) -> float:
+    """Threshold from a scanned constant; percentages become ratios"""
+    value = constant.value / 100 if constant.unit == '%' else constant.value
+    return int(value) if value.is_integer() else value
+
+def ruleset_fingerprint(rules: List[Dict[str, Any]], defaults: Dict[str, Dict[str, float]]) -> str:
+    """Stable hash of the rule content the compiler reads"""
+    digest = hashlib.sha1()
+    for rule in rules:
+        if 'rule_id' in rule:
+            # Content-addressed IDs already cover the title and Constants
+            digest.update(f"{rule.get('source_file', '')}\0{rule['rule_id']}\n".encode('utf-8'))
+        else:
+            digest.update(json.dumps([rule.get('source_file', ''), rule.get('rule', ''), rule.get('Constants', {})],
+                                     sort_keys=True, default=str).encode('utf-8'))
+    digest.update(json.dumps(defaults, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+def compile_ruleset(rules: List[Dict[str, Any]], defaults: Dict[str, Dict[str, float]]) -> CompiledRuleset:
+    """Compile rules into per-zone predicates, reusing the cached result for an identical ruleset
+
+    Thresholds come from each rule's load-time numeric_constants (scanned here for rules
+    loaded without them). defaults maps each zone to the threshold used for a check when
+    no rule compiles.
+    """
+    fingerprint = ruleset_fingerprint(rules, defaults)
+    if fingerprint in _compiled_cache:
+        return _compiled_cache[fingerprint]
+
+    predicates = {zone: {} for zone in defaults}
+    fallbacks = []
+    failures = {}
+    compiled_ids = set()
+
+    scanned = {}
+    for spec in COMPILE_SPECS:
+        candidates = [rule for rule in rules if spec['title'] in rule.get('rule', '').lower()]
+
+        for zone, zone_defaults in defaults.items():
+            key = spec['key'].replace('{zone}', zone)
+            label = spec['label'].replace('{zone}', zone).lower() if spec['label'] else None
+            after = spec['after'].replace('{zone}', zone).lower() if spec.get('after') else None
+
+            # The first rule in load order that yields a value supplies the threshold
+            source_rule = None
+            threshold = None
+            for rule in candidates:
+                constants = rule.get('Constants', {})
+                has_key = isinstance(constants, dict) and key in constants
+                constant = None
+                if has_key:
+                    if id(rule) not in scanned:
+                        scanned[id(rule)] = rule['numeric_constants'] if 'numeric_constants' in rule else scan_rule(rule)
+                    constant = spec_constant(scanned[id(rule)], key, label, after)
+                if constant is None:
+                    reason = f"no value for {spec['check']} in '{key}'" if has_key else f"missing constant '{key}'"
+                    failures.setdefault(id(rule), (rule, set()))[1].add(reason)
+                    continue
+                compiled_ids.add(id(rule))
+                if source_rule is None:
+                    source_rule, threshold = rule, threshold_value(constant)
+
+            if source_rule is None:
+                threshold = zone_defaults[spec['check']]
+                fallbacks.append({
+                    'check': spec['check'],
+                    'zone': zone,
+                    'default': threshold,
+                    'reason': 'no matching rule' if not candidates else 'no compilable constant'
+                })
+
+            predicates[zone][spec['check']] = CompiledPredicate(
+                spec['check'], zone, spec['comparator'], threshold, spec['unit'], spec['getter'], source_rule
+            )
+
+    # A rule is uncompiled only if it never supplied a value for any check
+    uncompiled_rules = [
+        {
+            'rule_id': rule.get('rule_id', ''),
+            'rule': rule.get('rule', ''),
+            'source_file': rule.get('source_file', ''),
+            'reasons': sorted(reasons)
+        }
+        for rule_key, (rule, reasons) in failures.items() if rule_key not in compiled_ids
+    ]
+
+    ruleset = CompiledRuleset(predicates, fallbacks, uncompiled_rules, fingerprint)
+    _compiled_cache[fingerprint] = ruleset
+    return ruleset
+
+def discard_compiled(fingerprint: str):
+    """Drop a cached ruleset so the rules its predicates reference can be freed"""
+    _compiled_cache.pop(fingerprint, None)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Rule Consolidation
+Merges duplicate rules across extraction runs and curated files into one canonical corpus with provenance
+"""
+
+import json
+import re
+import sys
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Tuple, Set
+
+import numpy as np
+
+from rule_bundle import read_rule_files, rule_files_in
+from rule_catalog import catalog_version
+from rule_reload import latest_rules_directory
+from rule_store import extracted_record, curated_record, read_curated_rules
+
+UNIFIED_FILENAME = "unified_rules.json"
+
+# Sources in priority order: the first source in a duplicate cluster supplies the canonical rule
+CURATED_SOURCES = ["structured_rules.json", "manual_rules.json", "manual_rules_option_a.json", "manual_rules_option_b.json"]
+REPROCESSED_DIRECTORY = "rules_reprocessed_consolidated"
+
+NUM_PERMUTATIONS = 64
+# 32 bands of 2 rows: pairs at the thresholds below become candidates with ~99% probability
+LSH_BANDS = 32
+SHINGLE_SIZE = 2
+TITLE_THRESHOLD = 0.65
+TEXT_THRESHOLD = 0.4
+# Largest prime below 2**32, so (a * hash + b) never overflows uint64
+MINHASH_PRIME = np.uint64(4294967291)
+
+STOPWORDS = {'a', 'an', 'the', 'of', 'for', 'to', 'in', 'on', 'and', 'or', 'by', 'be', 'is', 'are', 'with', 'at', 'as'}
+
+def normalize_title(title: str) -> str:
+    """Lowercase words only, '&' read as 'and', so cosmetic title differences compare equal"""
+    return ' '.join(re.findall(r'[a-z0-9]+', title.lower().replace('&', ' and ')))
+
+def title_words(title: str) -> Set[str]:
+    """Content words of a normalized title with a plural 's' dropped: 'Lot Sizes' ~ 'lot size'"""
+    words = set(normalize_title(title).split()) - STOPWORDS
+    return {word[:-1] if len(word) > 3 and word.endswith('s') else word for word in words}
+
+def jaccard(first: Set[str], second: Set[str]) -> float:
+    union = first | second
+    return len(first & second) / len(union) if union else 0.0
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Word n-grams of text with stopwords removed; short texts fall back to single words"""
+    words = [word for word in re.findall(r'[a-z0-9]+', text.lower()) if word not in STOPWORDS]
+    if len(words) < size:
+        return set(words)
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+def minhash_signatures(shingle_sets: List[Set[str]], num_perm: int = NUM_PERMUTATIONS, seed: int = 1) -> np.ndarray:
+    """One MinHash signature row per shingle set; rows agree in a fraction of slots close to their Jaccard"""
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, int(MINHASH_PRIME), size=num_perm, dtype=np.uint64)[:, None]
+    b = rng.randint(0, int(MINHASH_PRIME), size=num_perm, dtype=np.uint64)[:, None]
+
+    signatures = np.full((len(shingle_sets), num_perm), MINHASH_PRIME, dtype=np.uint64)
+    for row, shingle_set in enumerate(shingle_sets):
+        if shingle_set:
+            hashes = np.fromiter((zlib.crc32(shingle.encode('utf-8')) for shingle in shingle_set),
+                                 dtype=np.uint64, count=len(shingle_set))
+            signatures[row] = ((a * hashes[None, :] + b) % MINHASH_PRIME).min(axis=1)
+    return signatures
+
+def lsh_candidate_pairs(signatures: np.ndarray, bands: int = LSH_BANDS) -> Set[Tuple[int, int]]:
+    """Pairs of rows sharing every slot of at least one band; avoids comparing all pairs"""
+    rows_per_band = signatures.shape[1] // bands
+    pairs = set()
+    for band in range(bands):
+        buckets = {}
+        block = signatures[:, band * rows_per_band:(band + 1) * rows_per_band]
+        for row in range(len(signatures)):
+            buckets.setdefault(block[row].tobytes(), []).append(row)
+        for members in buckets.values():
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    pairs.add((first, second))
+    return pairs
+
+def load_source(name: str, path: Path) -> List[Dict[str, Any]]:
+    """Search-style records (title plus flattened qualifier/condition/exception text) for one source"""
+    if path.is_dir():
+        records = [extracted_record(rule) for rule in read_rule_files(rule_files_in(path))]
+    else:
+        records = [curated_record(rule, path.name) for rule in read_curated_rules(path)]
+    for record in records:
+        record['corpus'] = name
+    return records
+
+def default_sources(base_directory: str = ".") -> List[Tuple[str, Path]]:
+    """Latest v3 extraction, the reprocessed pages and the curated files, in priority order"""
+    base = Path(base_directory)
+    rules_directory = latest_rules_directory(base)
+    sources = [(rules_directory.name, rules_directory), (REPROCESSED_DIRECTORY, base / REPROCESSED_DIRECTORY)]
+    sources += [(name, base / name) for name in CURATED_SOURCES]
+    return [(name, path) for name, path in sources if path.exists()]
+
+def consolidate(records: List[Dict[str, Any]]) -> List[List[Tuple[int, float, str]]]:
+    """Cluster duplicate records; returns (record index, similarity, match) lists, canonical first
+
+    Candidate pairs have the same normalized title, or come out of MinHash LSH over
+    title words or requirement text; LSH candidates are kept only if their exact Jaccard
+    reaches TITLE_THRESHOLD or TEXT_THRESHOLD. Pairs are merged best first, and two
+    clusters are never merged if that would put two different rules from one source together.
+    """
+    titles = [normalize_title(record['title']) for record in records]
+    words = [title_words(record['title']) for record in records]
+    texts = [shingles(' '.join((record['title'], record['qualifiers'], record['conditions'], record['exceptions'])))
+             for record in records]
+
+    def match_kind(i: int, j: int) -> Tuple[float, str]:
+        if titles[i] == titles[j]:
+            return 1.0, 'exact' if texts[i] == texts[j] else 'title'
+        title_score, text_score = jaccard(words[i], words[j]), jaccard(texts[i], texts[j])
+        if title_score >= TITLE_THRESHOLD and title_score >= text_score:
+            return title_score, 'title_minhash'
+        if text_score >= TEXT_THRESHOLD:
+            return text_score, 'text_minhash'
+        return max(title_score, text_score), 'linked'
+
+    parent = list(range(len(records)))
+    corpora = [{record['corpus']} for record in records]
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    # Exact copies (re-extracted pages, identical curated variants) collapse up front, so
+    # only distinct rules go through MinHash and repeated runs add almost no pair work
+    exact_groups = {}
+    for index in range(len(records)):
+        exact_groups.setdefault((titles[index], frozenset(texts[index])), []).append(index)
+    distinct = []
+    for members in exact_groups.values():
+        distinct.append(members[0])
+        for index in members[1:]:
+            parent[index] = members[0]
+            corpora[members[0]] |= corpora[index]
+
+    pairs = set()
+    for signatures in (minhash_signatures([words[index] for index in distinct]),
+                       minhash_signatures([texts[index] for index in distinct])):
+        pairs.update((distinct[first], distinct[second]) for first, second in lsh_candidate_pairs(signatures))
+    by_title = {}
+    for index in distinct:
+        by_title.setdefault(titles[index], []).append(index)
+    for members in by_title.values():
+        pairs.update((i, j) for position, i in enumerate(members) for j in members[position + 1:])
+
+    candidates = []
+    for i, j in pairs:
+        score, kind = match_kind(i, j)
+        if kind != 'linked':
+            candidates.append((kind != 'title', -score, min(i, j), max(i, j)))
+
+    # Exact titles first, then by similarity; indexes break ties so runs are deterministic
+    for _, _, i, j in sorted(candidates):
+        root_i, root_j = find(i), find(j)
+        if root_i == root_j:
+            continue
+        # Distinct rules from one source never end up in the same cluster
+        if corpora[root_i] & corpora[root_j]:
+            continue
+        root, child = min(root_i, root_j), max(root_i, root_j)
+        parent[child] = root
+        corpora[root] |= corpora[child]
+
+    clusters = {}
+    for index in range(len(records)):
+        clusters.setdefault(find(index), []).append(index)
+
+    # Records arrive in source priority order, so the lowest index is the canonical rule
+    return [[(members[0], 1.0, 'canonical')] + [(index, *match_kind(members[0], index)) for index in members[1:]]
+            for members in sorted(clusters.values())]
+
+def build_unified_corpus(sources: List[Tuple[str, Path]]) -> Dict[str, Any]:
+    """Canonical rule per duplicate cluster, with provenance links to every merged copy"""
+    records = []
+    for name, path in sources:
+        records.extend(load_source(name, path))
+
+    rules = []
+    for cluster in consolidate(records):
+        canonical = records[cluster[0][0]]
+        rules.append({
+            'rule_id': canonical['rule_id'],
+            'title': canonical['title'],
+            'category': canonical['category'],
+            'corpus': canonical['corpus'],
+            'rule': canonical['body'],
+            'provenance': [{
+                'corpus': records[index]['corpus'],
+                'source': records[index]['source'],
+                'rule_id': records[index]['rule_id'],
+                'title': records[index]['title'],
+                'similarity': round(score, 3),
+                'match': kind
+            } for index, score, kind in cluster]
+        })
+
+    return {
+        'version': catalog_version([rule['rule_id'] for rule in rules]),
+        'generated': datetime.now().isoformat(),
+        'thresholds': {'title': TITLE_THRESHOLD, 'text': TEXT_THRESHOLD},
+        'sources': {name: {'path': str(path), 'rules': sum(1 for record in records if record['corpus'] == name)}
+                    for name, path in sources},
+        'input_rules': len(records),
+        'rule_count': len(rules),
+        'rules': rules
+    }
+
+def main():
+    """Rebuild unified_rules.json from every extraction source"""
+    output_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(UNIFIED_FILENAME)
+    start = time.perf_counter()
+    corpus = build_unified_corpus(default_sources())
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    with open(output_path, 'w') as f:
+        json.dump(corpus, f, indent=2)
+
+    merged = [rule for rule in corpus['rules'] if len(rule['provenance']) > 1]
+    print(f"🧬 Unified rule corpus written: {output_path}")
+    for name, source in corpus['sources'].items():
+        print(f"   {name}: {source['rules']} rules")
+    print(f"   {corpus['input_rules']} rules -> {corpus['rule_count']} canonical "
+          f"({len(merged)} merged clusters) in {elapsed_ms:.0f} ms")
+    print(f"   Version: {corpus['version']}")
+
+if __name__ == "__main__":
+    main()
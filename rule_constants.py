@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Rule Constants
+One compiled scanner that pulls typed numeric constants out of rule text at load time
+"""
+
+import re
+from typing import Dict, List, Any, NamedTuple, Optional
+
+# Rule sections that carry numbers, scanned in this order
+SCANNED_SECTIONS = ('Constants', 'Conditions', 'Variables')
+
+# The one regex run over rule text: a number, an optional roof pitch run ('4:12') and an
+# optional unit. Anchoring on digits keeps it to a single cheap pass; comparators are read
+# from the few words before each match with plain string operations.
+SCANNER = re.compile(r"""
+    (?P<number>\d[\d,]*(?:\.\d+)?)
+    (?P<pitch>\s*:\s*12\b)?
+    \s*(?P<unit>%|percent\b|sf\b|sq\.?\s*ft\b\.?|square\s+f(?:ee|oo)t\b|feet\b|foot\b|ft\b\.?|'|"
+        |inch(?:es)?\b|spaces?\b|stor(?:y|ies)\b)?
+""", re.IGNORECASE | re.VERBOSE)
+
+# A comparator may sit up to this many words before its number: 'Max building height: 17 ft'
+COMPARATOR_REACH = 3
+COMPARATOR_WINDOW = 48
+CLAUSE_BREAKS = ';,(\n'
+
+# A label is the text between the last of these and its number: 'Rear' in 'Front: 20 ft, Rear: 20 ft'.
+# Parentheses are not breaks here, so zone names like 'R-1(7000)' stay whole.
+LABEL_BREAKS = ';,\n'
+
+COMPARATOR_NAMES = {
+    '≥': 'min', '>=': 'min', 'minimum': 'min', 'min': 'min', 'at least': 'min', 'no less than': 'min',
+    '≤': 'max', '<=': 'max', 'maximum': 'max', 'max': 'max', 'at most': 'max', 'no more than': 'max',
+    'up to': 'max', 'not exceed': 'max',
+    '>': 'gt', '<': 'lt'
+}
+COMPARATOR_SYMBOLS = ('>=', '<=', '≥', '≤', '>', '<')
+COMPARATOR_HINTS = ('min', 'max', 'least', 'most', 'than', 'up to', 'exceed')
+
+UNIT_NAMES = {
+    '%': '%', 'percent': '%',
+    'sf': 'sf', 'sq ft': 'sf', 'sqft': 'sf', 'square feet': 'sf', 'square foot': 'sf',
+    'feet': 'ft', 'foot': 'ft', 'ft': 'ft', "'": 'ft',
+    'inch': 'in', 'inches': 'in', '"': 'in',
+    'space': 'spaces', 'spaces': 'spaces',
+    'story': 'stories', 'stories': 'stories'
+}
+
+class NumericConstant(NamedTuple):
+    """A number found in rule text, with its normalized unit, comparator and label when the text gives them"""
+    value: float
+    unit: Optional[str]
+    comparator: Optional[str]
+    section: str
+    key: str
+    label: str = ''
+
+def normalize_token(token: str) -> str:
+    return ' '.join(token.lower().rstrip('.').replace('.', ' ').split())
+
+def comparator_before(text: str, start: int) -> Optional[str]:
+    """Comparator governing the number at start: the nearest one within reach in the same clause"""
+    window = text[max(0, start - COMPARATOR_WINDOW):start]
+    cut = -1
+    for mark in CLAUSE_BREAKS:
+        position = window.rfind(mark)
+        if position > cut:
+            cut = position
+    window = window[cut + 1:].rstrip(' :').lower()
+
+    if window.endswith(COMPARATOR_SYMBOLS):
+        for symbol in COMPARATOR_SYMBOLS:
+            if window.endswith(symbol):
+                return COMPARATOR_NAMES[symbol]
+    # Most numbers have no comparator; skip the word walk unless one could be present
+    if not any(hint in window for hint in COMPARATOR_HINTS):
+        return None
+
+    words = [word.strip('.:') for word in window.split()]
+    for offset in range(1, min(len(words), COMPARATOR_REACH + 1) + 1):
+        position = len(words) - offset
+        for length in (1, 2, 3):
+            if position - length + 1 < 0:
+                break
+            phrase = ' '.join(words[position - length + 1:position + 1])
+            if phrase in COMPARATOR_NAMES:
+                return COMPARATOR_NAMES[phrase]
+    return None
+
+def label_before(text: str, start: int) -> str:
+    """Lowercased clause text leading up to the number at start, without list dashes or colons"""
+    cut = max(text.rfind(mark, 0, start) for mark in LABEL_BREAKS)
+    return ' '.join(text[cut + 1:start].lower().split()).strip(' -*:')
+
+def scan_text(text: str, section: str = '', key: str = '') -> List[NumericConstant]:
+    """Every numeric constant in text, in order, from a single pass of the scanner
+
+    Digits that belong to a zone name, like the 1 in 'R-1(7000)' or the 7000 inside
+    it, are not constants and are skipped.
+    """
+    constants = []
+    for match in SCANNER.finditer(text):
+        start = match.start()
+        if text[start - 2:start] in ('R-', 'r-') or text[start - 4:start] in ('R-1(', 'r-1('):
+            continue
+        try:
+            value = float(match.group('number').replace(',', ''))
+        except ValueError:
+            continue
+        unit = match.group('unit')
+        if match.group('pitch'):
+            value, unit = value / 12, 'pitch'
+        constants.append(NumericConstant(
+            value,
+            (UNIT_NAMES.get(unit.lower()) or UNIT_NAMES.get(normalize_token(unit), unit)) if unit else None,
+            comparator_before(text, start),
+            section,
+            key,
+            label_before(text, start)
+        ))
+    return constants
+
+def scan_rule(rule: Dict[str, Any]) -> List[NumericConstant]:
+    """Numeric constants from a rule's Constants, Conditions and Variables"""
+    constants = []
+    for section in SCANNED_SECTIONS:
+        values = rule.get(section)
+        if not isinstance(values, dict):
+            continue
+        for key, text in values.items():
+            if isinstance(text, (int, float)) and not isinstance(text, bool):
+                constants.append(NumericConstant(float(text), None, None, section, key))
+            elif isinstance(text, str) and text:
+                constants.extend(scan_text(text, section, key))
+    return constants
+
+def find_constant(constants: List[NumericConstant], unit: Optional[str] = None, comparator: Optional[str] = None,
+                  key: Optional[str] = None, section: Optional[str] = None,
+                  label: Optional[str] = None) -> Optional[NumericConstant]:
+    """First scanned constant matching every given filter"""
+    for constant in constants:
+        if ((unit is None or constant.unit == unit) and (comparator is None or constant.comparator == comparator)
+                and (key is None or constant.key == key) and (section is None or constant.section == section)
+                and (label is None or constant.label == label)):
+            return constant
+    return None
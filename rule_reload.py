@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Rule Reload
+Watches for a new or re-extracted rule corpus, rebuilds engines in the background and swaps them in atomically
+"""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional
+
+from rule_bundle import rule_files_in, source_stat_digest, source_content_digest
+from rule_compiler import discard_compiled
+
+DEFAULT_RULES_PATTERN = "rules_extraction_v3_*"
+
+def latest_rules_directory(base_directory: Path, pattern: str = DEFAULT_RULES_PATTERN) -> Path:
+    """Newest extraction directory; run directories end in a sortable timestamp"""
+    candidates = sorted(path for path in Path(base_directory).glob(pattern) if path.is_dir())
+    if not candidates:
+        raise FileNotFoundError(f"No rule directory matching {pattern} in {base_directory}")
+    return candidates[-1]
+
+class Ruleset:
+    """One immutable generation of rules and the engines built from it
+
+    Requests hold on to the Ruleset they started with, so a swap never changes
+    the rules underneath an in-flight request.
+    """
+
+    def __init__(self, rules_directory: Path, engines: Dict[str, Any], stat_digest: str, content_digest: str):
+        self.rules_directory = rules_directory
+        self.engines = engines
+        self.stat_digest = stat_digest
+        self.content_digest = content_digest
+        self.version = f"{rules_directory.name}@{content_digest[:12]}"
+        self.loaded_at = datetime.now().isoformat()
+
+    def __getitem__(self, name: str) -> Any:
+        return self.engines[name]
+
+    def compiled_fingerprints(self) -> set:
+        """Fingerprints of the compiled rulesets its engines hold, including every resident zone shard's"""
+        fingerprints = set()
+        for engine in self.engines.values():
+            if hasattr(engine, 'compiled_fingerprints'):
+                fingerprints |= engine.compiled_fingerprints()
+            elif getattr(engine, 'compiled_rules', None) is not None:
+                fingerprints.add(engine.compiled_rules.fingerprint)
+        return fingerprints
+
+class LiveRuleset:
+    """The active Ruleset plus a background watcher that replaces it when the corpus changes
+
+    builders maps an engine name to a callable taking a rules directory, e.g.
+    {'validator': ReverseComplianceValidator, 'checklist': ComplianceChecklistGenerator}.
+    The newest directory matching pattern under base_directory is used, so a fresh
+    extraction run is picked up as soon as it lands.
+    """
+
+    def __init__(self, builders: Dict[str, Callable[[str], Any]], base_directory: str = ".",
+                 pattern: str = DEFAULT_RULES_PATTERN, rules_directory: Optional[str] = None):
+        self.builders = builders
+        self.base_directory = Path(base_directory)
+        self.pattern = pattern
+        self.fixed_directory = Path(rules_directory) if rules_directory else None
+        self.ruleset = None
+        self.lock = threading.Lock()
+        self.reload_count = 0
+        self.last_error = None
+        self.watch_interval = 0
+        self.stop_event = threading.Event()
+        self.watcher = None
+
+    def target_directory(self) -> Path:
+        """Directory the live rules should come from: the fixed one, else the newest extraction"""
+        if self.fixed_directory:
+            return self.fixed_directory
+        return latest_rules_directory(self.base_directory, self.pattern)
+
+    def build(self, rules_directory: Path) -> Ruleset:
+        """Build every engine for a directory; nothing is shared with the live Ruleset"""
+        rule_files = rule_files_in(rules_directory)
+        stat_digest = source_stat_digest(rule_files)
+        content_digest = source_content_digest(rule_files)
+        engines = {name: builder(str(rules_directory)) for name, builder in self.builders.items()}
+        return Ruleset(rules_directory, engines, stat_digest, content_digest)
+
+    @property
+    def current(self) -> Ruleset:
+        """The active Ruleset, built on first use"""
+        ruleset = self.ruleset
+        if ruleset is None:
+            with self.lock:
+                if self.ruleset is None:
+                    self.ruleset = self.build(self.target_directory())
+                ruleset = self.ruleset
+        return ruleset
+
+    @property
+    def loaded(self) -> bool:
+        return self.ruleset is not None
+
+    def needs_reload(self, ruleset: Ruleset, rules_directory: Path) -> bool:
+        """True if rules_directory is a different corpus from the one ruleset was built on"""
+        if rules_directory != ruleset.rules_directory:
+            return True
+        rule_files = rule_files_in(rules_directory)
+        if source_stat_digest(rule_files) == ruleset.stat_digest:
+            return False
+        # Stats changed (touch, checkout); only a content change warrants a rebuild
+        return source_content_digest(rule_files) != ruleset.content_digest
+
+    def check_for_update(self) -> bool:
+        """Rebuild and swap in a new Ruleset if the corpus changed; returns True on a swap
+
+        The build runs without holding the lock, so requests keep using the old
+        Ruleset until the single assignment that publishes the new one.
+        """
+        ruleset = self.current
+        try:
+            rules_directory = self.target_directory()
+            if not self.needs_reload(ruleset, rules_directory):
+                return False
+            new_ruleset = self.build(rules_directory)
+        except Exception as e:
+            # Keep serving the old rules if the new corpus cannot be loaded
+            self.last_error = {'time': datetime.now().isoformat(), 'error': str(e)}
+            return False
+
+        with self.lock:
+            self.ruleset = new_ruleset
+            self.reload_count += 1
+            self.last_error = None
+        self.retire(ruleset, new_ruleset)
+        return True
+
+    def retire(self, old: Ruleset, new: Ruleset):
+        """Drop the old generation's compiled rules from the compile cache, unless the new one reuses them
+
+        In-flight requests keep their own references; the cache would otherwise hold
+        every generation, and its rules, for the life of the process.
+        """
+        for fingerprint in old.compiled_fingerprints() - new.compiled_fingerprints():
+            discard_compiled(fingerprint)
+
+    def watch(self):
+        while not self.stop_event.wait(self.watch_interval):
+            self.check_for_update()
+
+    def start_watching(self, interval: float):
+        """Poll for corpus changes every interval seconds on a daemon thread"""
+        self.watch_interval = interval
+        self.stop_event.clear()
+        self.watcher = threading.Thread(target=self.watch, name='rule-reload', daemon=True)
+        self.watcher.start()
+
+    def stop_watching(self):
+        self.stop_event.set()
+        if self.watcher is not None:
+            self.watcher.join()
+            self.watcher = None
+
+    def reset_after_fork(self):
+        """Fresh lock in a forked child, and restart the watcher thread the fork did not copy"""
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.watcher = None
+        if self.watch_interval > 0:
+            self.start_watching(self.watch_interval)
+
+    def status(self) -> Dict[str, Any]:
+        ruleset = self.ruleset
+        return {
+            'version': ruleset.version if ruleset else None,
+            'rules_directory': str(ruleset.rules_directory) if ruleset else None,
+            'loaded_at': ruleset.loaded_at if ruleset else None,
+            'reload_count': self.reload_count,
+            'watch_interval': self.watch_interval,
+            'last_error': self.last_error
+        }
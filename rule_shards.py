@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Rule Shards
+Partitions the rule corpus by jurisdiction and zone district so a worker only holds the zones it is serving
+"""
+
+import heapq
+import json
+import marshal
+import mmap
+import re
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Optional, Set, Tuple
+
+from rule_bundle import rule_files_in, source_stat_digest, source_content_digest, intern_keys
+from rule_compiler import DEFAULT_ZONE, discard_compiled
+from rule_constants import scan_rule
+from rule_stream import stream_rules, slim_rule
+from reverse_compliance_validator import ReverseComplianceValidator, RULE_FIELDS
+
+SHARDS_FILENAME = "rules.shards"
+SHARDS_MAGIC = b'HCSHARDS'
+SHARDS_FORMAT_VERSION = 2
+DEFAULT_JURISDICTION = 'palo_alto'
+
+# magic, format version, marshal version, table of contents size,
+# source file stat digest, source file content digest
+HEADER = struct.Struct('<8sIII40s40s')
+
+# Zone districts as rule text names them: 'R-1', 'R-1(7000)', 'RM-20'
+ZONE_NAME = re.compile(r'\b([A-Z]{1,3}-\d{1,2})(?:\s*\(\s*(\d{3,5})\s*\))?')
+# Where a rule names the zones it applies to; Constants keys count too ('R-1_Setbacks')
+ZONE_FIELDS = ('rule', 'Qualifiers', 'Constants', 'Conditions')
+
+# A shard's rules as (load position, rule) pairs; positions merge a zone's rules back
+# into the common rules in corpus order, which threshold compilation depends on
+PositionedRules = List[Tuple[int, Dict[str, Any]]]
+
+def normalize_zone(zone: str) -> str:
+    """Canonical zone name: 'r-1 (7000)' -> 'R-1(7000)'"""
+    match = ZONE_NAME.match(zone.strip().upper())
+    if not match:
+        return zone.strip().upper()
+    return f"{match.group(1)}({match.group(2)})" if match.group(2) else match.group(1)
+
+def base_zone(zone: str) -> str:
+    """Zone family a sub-district belongs to: 'R-1(7000)' -> 'R-1'"""
+    return zone.split('(', 1)[0]
+
+def rule_zones(rule: Dict[str, Any]) -> Set[str]:
+    """Zone districts a rule names; an empty set means the rule applies in every zone"""
+    text = json.dumps([rule.get(field) for field in ZONE_FIELDS], default=str)
+    return {f"{family}({size})" if size else family for family, size in ZONE_NAME.findall(text)}
+
+def zone_applies(named_zones: Set[str], zone: str) -> bool:
+    """A rule applies in zone if it names no zone, names zone itself, or names zone's family"""
+    return not named_zones or zone in named_zones or base_zone(zone) in named_zones
+
+def build_rule_shards(rules_directory: str, shards_path: Optional[str] = None) -> Path:
+    """Write the common rules once, then one payload per zone holding only the rules that name it
+
+    Rules that name no zone go in the common payload, which every zone shares; a zone's
+    payload holds just the zone-specific rules that apply in it. Rules are trimmed to
+    the validator's RULE_FIELDS after zones are detected.
+    """
+    rules_directory = Path(rules_directory)
+    shards_path = Path(shards_path) if shards_path else rules_directory / SHARDS_FILENAME
+    rule_files = rule_files_in(rules_directory)
+
+    common, zoned = [], []
+    zones = {DEFAULT_ZONE}
+    for position, rule in enumerate(stream_rules(rule_files)):
+        named_zones = rule_zones(rule)
+        rule = intern_keys(slim_rule(rule, RULE_FIELDS))
+        if named_zones:
+            zones |= named_zones
+            zoned.append((position, named_zones, rule))
+        else:
+            common.append((position, rule))
+
+    payloads = {'common': marshal.dumps(common)}
+    for zone in sorted(zones):
+        payloads[zone] = marshal.dumps([(position, rule) for position, named_zones, rule in zoned
+                                        if zone_applies(named_zones, zone)])
+    contents, offset = {'common': None, 'zones': {}}, 0
+    for name, payload in payloads.items():
+        if name == 'common':
+            contents['common'] = (offset, len(payload))
+        else:
+            contents['zones'][name] = (offset, len(payload))
+        offset += len(payload)
+    table = marshal.dumps(contents)
+
+    header = HEADER.pack(SHARDS_MAGIC, SHARDS_FORMAT_VERSION, marshal.version, len(table),
+                         source_stat_digest(rule_files).encode('ascii'),
+                         source_content_digest(rule_files).encode('ascii'))
+
+    # Write beside the target and rename so readers never see a partial file
+    tmp_path = shards_path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(table)
+        for payload in payloads.values():
+            f.write(payload)
+    tmp_path.replace(shards_path)
+    return shards_path
+
+class RuleShards:
+    """Read-only view of a shards file; the common rules and each zone's rules are decoded only when asked for"""
+
+    def __init__(self, shards_path: str):
+        self.path = Path(shards_path)
+        with open(self.path, 'rb') as f:
+            self.mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mapping) < HEADER.size:
+            self.mapping.close()
+            raise ValueError(f"Not a rule shards file: {self.path}")
+
+        magic, format_version, marshal_version, table_size, stat_digest, content_digest = \
+            HEADER.unpack_from(self.mapping, 0)
+        if magic != SHARDS_MAGIC:
+            self.mapping.close()
+            raise ValueError(f"Not a rule shards file: {self.path}")
+        if format_version != SHARDS_FORMAT_VERSION or marshal_version != marshal.version:
+            self.mapping.close()
+            raise ValueError(f"Unsupported rule shards format {format_version}/{marshal_version} in {self.path}")
+
+        self.stat_digest = stat_digest.decode('ascii')
+        self.content_digest = content_digest.decode('ascii')
+        self.contents = marshal.loads(self.mapping[HEADER.size:HEADER.size + table_size])
+        self.data_offset = HEADER.size + table_size
+
+    @property
+    def zones(self) -> List[str]:
+        return list(self.contents['zones'])
+
+    def shard_zone(self, zone: str) -> str:
+        """Shard that serves zone: its own, else its family's, else the default zone's"""
+        zone = normalize_zone(zone) if zone and isinstance(zone, str) else DEFAULT_ZONE
+        for candidate in (zone, base_zone(zone)):
+            if candidate in self.contents['zones']:
+                return candidate
+        return DEFAULT_ZONE
+
+    def decode(self, offset: int, length: int) -> PositionedRules:
+        """Decode one payload straight from the mapped pages"""
+        start = self.data_offset + offset
+        payload = memoryview(self.mapping)[start:start + length]
+        try:
+            return marshal.loads(payload)
+        except (EOFError, TypeError) as e:
+            raise ValueError(f"Corrupt rule shards file {self.path}: {e}")
+        finally:
+            payload.release()
+
+    def common_rules(self) -> PositionedRules:
+        """Rules that name no zone and so apply in every zone"""
+        return self.decode(*self.contents['common'])
+
+    def rules(self, zone: str) -> PositionedRules:
+        """Zone-specific rules that apply in zone, without the common rules"""
+        return self.decode(*self.contents['zones'][zone])
+
+    def is_current(self, rules_directory: str) -> bool:
+        """True if the shards were built from the rule files now in rules_directory"""
+        rule_files = rule_files_in(Path(rules_directory))
+        if self.stat_digest == source_stat_digest(rule_files):
+            return True
+        return self.content_digest == source_content_digest(rule_files)
+
+    def close(self):
+        self.mapping.close()
+
+def open_rule_shards(rules_directory: str) -> RuleShards:
+    """The shards for rules_directory, rebuilt if missing or built from different rule files"""
+    shards_path = Path(rules_directory) / SHARDS_FILENAME
+    if shards_path.exists():
+        try:
+            shards = RuleShards(shards_path)
+            if shards.is_current(rules_directory):
+                return shards
+            shards.close()
+        except ValueError:
+            pass
+    build_rule_shards(rules_directory, shards_path)
+    return RuleShards(shards_path)
+
+def merge_rules(common: PositionedRules, zone_rules: PositionedRules) -> List[Dict[str, Any]]:
+    """Common and zone rules interleaved back into corpus load order"""
+    return [rule for _, rule in heapq.merge(common, zone_rules, key=itemgetter(0))]
+
+class ShardedValidator:
+    """Validators over one jurisdiction/zone shard each, loaded on demand with an LRU bound on residency
+
+    jurisdictions maps a jurisdiction name to its rules directory. A project picks its
+    shard by project_info.jurisdiction (default: the first jurisdiction) and
+    site_data.zone_district. Each jurisdiction's common rules are decoded and scanned
+    once and shared by all of its shard validators; a shard adds only its zone-specific
+    rules. At most max_shards validators stay resident; the least recently used one is
+    dropped when another shard is loaded.
+    """
+
+    def __init__(self, jurisdictions: Dict[str, str], max_shards: int = 4,
+                 factory: Optional[Callable[[str, List[Dict[str, Any]]], Any]] = None):
+        if not jurisdictions:
+            raise ValueError("At least one jurisdiction is required")
+        self.jurisdictions = dict(jurisdictions)
+        self.default_jurisdiction = next(iter(self.jurisdictions))
+        self.max_shards = max_shards
+        self.factory = factory or (lambda rules_directory, rules: ReverseComplianceValidator(rules_directory, rules=rules))
+        self.shard_files = {}
+        self.common = {}
+        self.resident = OrderedDict()
+        self.lock = threading.Lock()
+        self.files_lock = threading.Lock()
+        self.loading = {}
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'load_ms': 0.0}
+
+    def shards_for(self, jurisdiction: str) -> RuleShards:
+        if jurisdiction not in self.jurisdictions:
+            raise ValueError(f"Unknown jurisdiction: {jurisdiction}")
+        with self.files_lock:
+            shards = self.shard_files.get(jurisdiction)
+            if shards is None:
+                shards = self.shard_files[jurisdiction] = open_rule_shards(self.jurisdictions[jurisdiction])
+            return shards
+
+    def common_rules(self, jurisdiction: str) -> PositionedRules:
+        """A jurisdiction's common rules, decoded and scanned for constants on first use"""
+        shards = self.shards_for(jurisdiction)
+        with self.files_lock:
+            common = self.common.get(jurisdiction)
+            if common is None:
+                common = shards.common_rules()
+                for _, rule in common:
+                    rule['numeric_constants'] = scan_rule(rule)
+                self.common[jurisdiction] = common
+            return common
+
+    def shard_key(self, zone: str, jurisdiction: Optional[str] = None) -> Tuple[str, str]:
+        """(jurisdiction, shard zone) serving zone"""
+        jurisdiction = jurisdiction or self.default_jurisdiction
+        return jurisdiction, self.shards_for(jurisdiction).shard_zone(zone)
+
+    def validator_for(self, project_data: Dict[str, Any]) -> Any:
+        """The validator for a project's shard"""
+        jurisdiction = project_data.get('project_info', {}).get('jurisdiction')
+        return self.zone_validator(project_data.get('site_data', {}).get('zone_district', ''), jurisdiction)
+
+    def zone_validator(self, zone: str, jurisdiction: Optional[str] = None) -> Any:
+        """The validator for zone's shard, loading it (and evicting the coldest) if not resident"""
+        key = self.shard_key(zone, jurisdiction)
+        with self.lock:
+            validator = self.resident.get(key)
+            if validator is not None:
+                self.resident.move_to_end(key)
+                self.stats['hits'] += 1
+                return validator
+            # One thread builds a given shard; others asking for it wait on the same event
+            event = self.loading.get(key)
+            building = event is None
+            if building:
+                event = self.loading[key] = threading.Event()
+                self.stats['misses'] += 1
+
+        if not building:
+            event.wait()
+            return self.zone_validator(zone, jurisdiction)
+
+        try:
+            start = time.perf_counter()
+            jurisdiction, shard_zone = key
+            rules = merge_rules(self.common_rules(jurisdiction), self.shards_for(jurisdiction).rules(shard_zone))
+            validator = self.factory(self.jurisdictions[jurisdiction], rules)
+            load_ms = (time.perf_counter() - start) * 1000
+            with self.lock:
+                self.resident[key] = validator
+                self.stats['load_ms'] += load_ms
+                while len(self.resident) > self.max_shards:
+                    _, evicted = self.resident.popitem(last=False)
+                    self.stats['evictions'] += 1
+                    compiled = getattr(evicted, 'compiled_rules', None)
+                    if compiled is not None:
+                        discard_compiled(compiled.fingerprint)
+        finally:
+            with self.lock:
+                self.loading.pop(key).set()
+        return validator
+
+    def perform_comprehensive_validation(self, project_data: Dict[str, Any], fail_fast: bool = False) -> Dict[str, Any]:
+        return self.validator_for(project_data).perform_comprehensive_validation(project_data, fail_fast=fail_fast)
+
+    def validators(self) -> List[Any]:
+        """Shard validators now resident"""
+        with self.lock:
+            return list(self.resident.values())
+
+    def compiled_fingerprints(self) -> Set[str]:
+        """Fingerprints of the compiled rulesets its resident shards hold"""
+        return {validator.compiled_rules.fingerprint for validator in self.validators()
+                if getattr(validator, 'compiled_rules', None) is not None}
+
+    def reset_after_fork(self):
+        """Fresh locks in a forked child; a shard another thread was loading at fork time is loaded again on demand"""
+        self.lock = threading.Lock()
+        self.files_lock = threading.Lock()
+        self.loading = {}
+
+    def status(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'resident': [f"{jurisdiction}:{zone}" for jurisdiction, zone in self.resident],
+                'max_shards': self.max_shards,
+                **self.stats
+            }
+
+def main():
+    """Build the zone shards for a rules directory"""
+    rules_directory = sys.argv[1] if len(sys.argv) > 1 else "rules_extraction_v3_20250916_161035"
+    shards_path = build_rule_shards(rules_directory)
+    shards = RuleShards(shards_path)
+
+    print(f"🧩 Rule shards written: {shards_path}")
+    print(f"   common: {len(shards.common_rules())} rules")
+    for zone in shards.zones:
+        print(f"   {zone}: {len(shards.rules(zone))} zone rules")
+    print(f"   Size: {shards_path.stat().st_size:,} bytes")
+    shards.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Rule Store
+SQLite rule store with an FTS5 index over extracted and curated rules, for ranked search
+"""
+
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Iterator, Optional
+
+from rule_bundle import rule_files_in, read_rule_files, source_content_digest
+from rule_catalog import stable_rule_id
+
+STORE_FILENAME = "rules_search.sqlite"
+CURATED_RULE_FILES = ["manual_rules.json", "structured_rules.json"]
+MAX_PER_PAGE = 100
+
+# bm25 weights per indexed column: a title hit outranks a match buried in the conditions
+COLUMN_WEIGHTS = {'title': 10.0, 'category': 4.0, 'qualifiers': 2.0, 'conditions': 2.0, 'exceptions': 1.0}
+
+def flatten_text(value: Any) -> str:
+    """All string content of a nested rule field, one value per line"""
+    if isinstance(value, dict):
+        return '\n'.join(filter(None, (flatten_text(item) for item in value.values())))
+    if isinstance(value, list):
+        return '\n'.join(filter(None, (flatten_text(item) for item in value)))
+    return str(value).strip() if value is not None else ''
+
+def extracted_record(rule: Dict[str, Any]) -> Dict[str, Any]:
+    """Search record for a rule extracted from a manual page"""
+    relationships = rule.get('Relationships')
+    hierarchy = str(relationships.get('Hierarchical') or '') if isinstance(relationships, dict) else ''
+    category = hierarchy.split('Parent Category:', 1)[1].strip() if 'Parent Category:' in hierarchy else ''
+    return {
+        'rule_id': rule.get('rule_id') or stable_rule_id(rule),
+        'source': rule.get('source_file', 'extracted'),
+        'title': rule.get('rule', ''),
+        'category': category,
+        'qualifiers': flatten_text(rule.get('Qualifiers')),
+        'conditions': flatten_text(rule.get('Conditions')),
+        'exceptions': flatten_text(rule.get('Exceptions')),
+        'body': rule
+    }
+
+def curated_record(rule: Dict[str, Any], source: str) -> Dict[str, Any]:
+    """Search record for a hand-curated rule (manual_rules.json or structured_rules.json layout)"""
+    return {
+        'rule_id': f"{Path(source).stem}:{rule.get('id', '')}",
+        'source': source,
+        'title': rule.get('title', ''),
+        'category': rule.get('category', ''),
+        'qualifiers': flatten_text([rule.get('short_summary'), rule.get('summary'),
+                                    rule.get('includes'), rule.get('inclusions')]),
+        'conditions': flatten_text(rule.get('requirements')),
+        'exceptions': flatten_text([rule.get('excludes'), rule.get('exclusions'), rule.get('notes')]),
+        'body': rule
+    }
+
+def read_curated_rules(curated_file: Path) -> List[Dict[str, Any]]:
+    """Rules from a curated file: a bare list, or a {'rules': [...]} document"""
+    with open(curated_file, 'r') as f:
+        data = json.load(f)
+    rules = data.get('rules', []) if isinstance(data, dict) else data
+    return [rule for rule in rules if isinstance(rule, dict)]
+
+def search_records(rules_directory: str, curated_files: List[Path]) -> Iterator[Dict[str, Any]]:
+    """Every extracted and curated rule as a search record"""
+    for rule in read_rule_files(rule_files_in(Path(rules_directory))):
+        yield extracted_record(rule)
+    for curated_file in curated_files:
+        for rule in read_curated_rules(curated_file):
+            yield curated_record(rule, curated_file.name)
+
+def store_sources(rules_directory: str, curated_files: List[Path]) -> List[Path]:
+    return rule_files_in(Path(rules_directory)) + [path for path in curated_files if path.exists()]
+
+def build_rule_store(records: Iterator[Dict[str, Any]], store_path: str, source_digest: str = '') -> Path:
+    """Write a fresh store file and rename it into place so readers never see a partial index"""
+    store_path = Path(store_path)
+    tmp_path = store_path.with_suffix(f'.{os.getpid()}.tmp')
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        with conn:
+            conn.execute("""
+                CREATE TABLE rules (
+                    doc_id INTEGER PRIMARY KEY,
+                    rule_id TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    body TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE VIRTUAL TABLE rules_fts USING fts5(
+                    title, category, qualifiers, conditions, exceptions, source UNINDEXED,
+                    tokenize = 'porter unicode61'
+                )
+            """)
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+            count = 0
+            for doc_id, record in enumerate(records, 1):
+                conn.execute("INSERT INTO rules VALUES (?, ?, ?, ?, ?, ?)",
+                             (doc_id, record['rule_id'], record['source'], record['title'], record['category'],
+                              json.dumps(record['body'])))
+                conn.execute("INSERT INTO rules_fts (rowid, title, category, qualifiers, conditions, exceptions, source) "
+                             "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             (doc_id, record['title'], record['category'], record['qualifiers'],
+                              record['conditions'], record['exceptions'], record['source']))
+                count = doc_id
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ('source_digest', source_digest), ('rule_count', str(count)), ('built', str(time.time()))
+            ])
+        # Merge the index segments once; the store is read-only from here on
+        conn.execute("INSERT INTO rules_fts (rules_fts) VALUES ('optimize')")
+        conn.commit()
+    finally:
+        conn.close()
+
+    tmp_path.replace(store_path)
+    return store_path
+
+def fts_query(text: str) -> str:
+    """FTS5 MATCH expression for free text: every word required, the last one as a prefix
+
+    Words are quoted, so operators and punctuation in user input are never parsed as syntax.
+    """
+    words = re.findall(r'\w+', text.lower())
+    if not words:
+        raise ValueError("Search query must contain at least one word")
+    terms = [f'"{word}"' for word in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+class RuleStore:
+    """Read-only search over a built store file; safe to share across threads and forked workers"""
+
+    def __init__(self, store_path: str):
+        self.path = Path(store_path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Rule store not found: {self.path}")
+        self.local = threading.local()
+        self.source_digest = self.meta('source_digest')
+        self.rule_count = int(self.meta('rule_count') or 0)
+
+    def connection(self) -> sqlite3.Connection:
+        """One read-only connection per thread, reopened after a fork"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or getattr(self.local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def meta(self, key: str) -> Optional[str]:
+        row = self.connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def __len__(self) -> int:
+        return self.rule_count
+
+    def search(self, text: str, page: int = 1, per_page: int = 20, source: Optional[str] = None) -> Dict[str, Any]:
+        """Rules matching text, best first by BM25, one page at a time"""
+        page = max(1, int(page))
+        per_page = min(max(1, int(per_page)), MAX_PER_PAGE)
+        match = fts_query(text)
+
+        where = "rules_fts MATCH ?"
+        params = [match]
+        if source:
+            where += " AND rules_fts.source = ?"
+            params.append(source)
+
+        conn = self.connection()
+        total = conn.execute(f"SELECT count(*) FROM rules_fts WHERE {where}", params).fetchone()[0]
+        weights = ', '.join(str(weight) for weight in COLUMN_WEIGHTS.values())
+        rows = conn.execute(f"""
+            SELECT rules.rule_id, rules.source, rules.title, rules.category, rules.body,
+                   bm25(rules_fts, {weights}) AS rank,
+                   snippet(rules_fts, -1, '[', ']', '…', 12)
+            FROM rules_fts JOIN rules ON rules.doc_id = rules_fts.rowid
+            WHERE {where}
+            ORDER BY rank
+            LIMIT ? OFFSET ?
+        """, params + [per_page, (page - 1) * per_page]).fetchall()
+
+        return {
+            'query': text,
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'pages': (total + per_page - 1) // per_page,
+            'results': [{
+                'rule_id': rule_id,
+                'source': source,
+                'title': title,
+                'category': category,
+                # bm25() is lower-is-better; flip it so higher scores rank first
+                'score': round(-rank, 4),
+                'snippet': snippet,
+                'rule': json.loads(body)
+            } for rule_id, source, title, category, body, rank, snippet in rows]
+        }
+
+def open_rule_store(rules_directory: str, curated_files: Optional[List[str]] = None,
+                    store_path: Optional[str] = None) -> RuleStore:
+    """The store for rules_directory plus the curated files, rebuilt if any source changed"""
+    if curated_files is None:
+        curated_files = [Path(__file__).parent / name for name in CURATED_RULE_FILES]
+    curated_files = [Path(path) for path in curated_files]
+    store_path = Path(store_path) if store_path else Path(rules_directory) / STORE_FILENAME
+
+    sources = store_sources(rules_directory, curated_files)
+    source_digest = source_content_digest(sources)
+    if store_path.exists():
+        try:
+            store = RuleStore(store_path)
+            if store.source_digest == source_digest:
+                return store
+        except sqlite3.DatabaseError:
+            pass
+
+    existing = [path for path in curated_files if path.exists()]
+    build_rule_store(search_records(rules_directory, existing), store_path, source_digest)
+    return RuleStore(store_path)
+
+def main():
+    """Build (if needed) and query the rule store: python rule_store.py [query]"""
+    rules_directory = "rules_extraction_v3_20250916_161035"
+    store = open_rule_store(rules_directory)
+    print(f"🔎 Rule store: {store.path} ({len(store)} rules)")
+
+    if len(sys.argv) > 1:
+        results = store.search(' '.join(sys.argv[1:]), per_page=10)
+        print(f"   {results['total']} matches for {results['query']!r}")
+        for result in results['results']:
+            print(f"   {result['score']:>7.2f}  {result['title']}  ({result['source']})")
+
+if __name__ == "__main__":
+    main()
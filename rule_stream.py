@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Rule Stream
+Incremental page reader: yields extracted rules one at a time without ever holding a whole page file in memory
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Iterator, Optional
+
+from rule_catalog import stable_rule_id
+
+# Characters read per refill; the only per-file buffer the reader holds
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+NUMBER_CHARS = '0123456789.eE+-'
+# Everything up to a string's closing quote; stops short of a backslash with nothing after it
+STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+
+DECODER = json.JSONDecoder()
+
+class JsonReader:
+    """Pull parser over a JSON text file, just enough of one to walk objects and arrays
+
+    Containers are walked key by key and element by element; the caller decodes the
+    values it wants and skips the rest. Skipped strings (a page's raw_response) are
+    scanned across chunk boundaries and never built.
+    """
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Drop what has been consumed and append the next chunk; False at end of file"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next significant character, without consuming it"""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found!r}")
+        self.pos += 1
+
+    def decode(self) -> Any:
+        """Decode the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number cut off by the end of the buffer ('12' of '12.5') may continue in the next chunk
+            if (end == len(self.buffer) or self.buffer[end] in NUMBER_CHARS) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+    def skip_string(self):
+        """Consume a string by matching past its body; nothing is decoded"""
+        self.expect('"')
+        while True:
+            self.pos = STRING_BODY.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) and self.buffer[self.pos] == '"':
+                self.pos += 1
+                return
+            # The body ran to the end of the buffer, possibly stopping before a split escape
+            if not self.fill():
+                raise ValueError("Unterminated string in JSON input")
+
+    def skip_value(self):
+        if self.peek() == '"':
+            self.skip_string()
+        else:
+            self.decode()
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield each key of the next object; the caller must consume its value before resuming"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect('}')
+                return
+
+    def iter_array(self) -> Iterator[None]:
+        """Yield once per element of the next array; the caller must consume each element"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(']')
+                return
+
+def iter_page_rules(rule_file: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Extracted rules of one page file, decoded one at a time
+
+    Rules are held back until the page's success flag has been read, so a failed or
+    malformed page yields nothing. At most one page's rules are buffered.
+    """
+    rules = []
+    success = False
+    with open(rule_file, 'r', encoding='utf-8') as f:
+        reader = JsonReader(f, chunk_size)
+        for key in reader.iter_object():
+            if key == 'analysis' and reader.peek() == '{':
+                for analysis_key in reader.iter_object():
+                    if analysis_key == 'extracted_rules' and reader.peek() == '[':
+                        for _ in reader.iter_array():
+                            rule = reader.decode()
+                            if isinstance(rule, dict) and 'rule' in rule:
+                                rules.append(rule)
+                    else:
+                        reader.skip_value()
+            elif key == 'success':
+                success = bool(reader.decode())
+            else:
+                reader.skip_value()
+    if success:
+        yield from rules
+
+def slim_rule(rule: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+    """Copy of rule keeping only fields; sys.intern shares the key strings across rules"""
+    return {sys.intern(key): rule[key] for key in fields if key in rule}
+
+def stream_rules(rule_files: List[Path], fields: Optional[tuple] = None,
+                 on_error: Optional[Callable[[str, Exception], None]] = None) -> Iterator[Dict[str, Any]]:
+    """Every rule in rule_files tagged with source_file and rule_id, trimmed to fields as it is read
+
+    The rule ID is computed from the full rule before trimming, so it matches the ID
+    every other loader assigns; list 'source_file' and 'rule_id' in fields to keep them.
+    A file that fails to parse is reported to on_error and skipped; without on_error the
+    exception propagates. Only the reader's memory is bounded: a caller that keeps every
+    rule, as the validator does, still grows with the corpus.
+    """
+    for rule_file in rule_files:
+        try:
+            page_rules = list(iter_page_rules(rule_file))
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(rule_file.name, e)
+            continue
+        for rule in page_rules:
+            rule['source_file'] = rule_file.name
+            rule['rule_id'] = stable_rule_id(rule)
+            yield slim_rule(rule, fields) if fields else rule
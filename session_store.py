@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Session Store
+Server-side Flask sessions: the cookie carries only an opaque session ID, the data lives in a pluggable local backend
+"""
+
+import json
+import os
+import re
+import secrets
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from flask.sessions import SessionInterface, SessionMixin
+from werkzeug.datastructures import CallbackDict
+
+DEFAULT_SESSION_PATHS = {
+    'sqlite': os.path.join(tempfile.gettempdir(), 'housing_compliance_sessions.sqlite'),
+    'filesystem': os.path.join(tempfile.gettempdir(), 'housing_compliance_sessions')
+}
+DEFAULT_HANDLE_PATHS = {
+    'sqlite': os.path.join(tempfile.gettempdir(), 'housing_compliance_handles.sqlite'),
+    'filesystem': os.path.join(tempfile.gettempdir(), 'housing_compliance_handles')
+}
+
+# secrets.token_urlsafe(32); anything else in the cookie is ignored without a lookup
+SESSION_ID = re.compile(r'^[A-Za-z0-9_-]{43}$')
+
+# Expiry timestamp written ahead of each session file's payload
+FILE_HEADER = struct.Struct('<d')
+
+def encode_session(data: Dict[str, Any]) -> bytes:
+    """Compact JSON, zlib-compressed; project and result blobs shrink several times over"""
+    return zlib.compress(json.dumps(data, separators=(',', ':'), default=str).encode('utf-8'))
+
+def decode_session(payload: bytes) -> Dict[str, Any]:
+    return json.loads(zlib.decompress(payload))
+
+class SessionBackend:
+    """Stores encoded session payloads by session ID until an absolute expiry time"""
+
+    def load(self, sid: str) -> Optional[bytes]:
+        """Payload for sid, or None if there is none or it has expired"""
+        raise NotImplementedError
+
+    def save(self, sid: str, payload: bytes, expires: float):
+        raise NotImplementedError
+
+    def delete(self, sid: str):
+        raise NotImplementedError
+
+    def purge_expired(self) -> int:
+        """Drop every expired session; returns how many were dropped"""
+        raise NotImplementedError
+
+    def reset_after_fork(self):
+        """Drop per-process state a forked child must not share"""
+
+class SQLiteSessionBackend(SessionBackend):
+    """Sessions in one SQLite table, shared by every worker process on the host"""
+
+    def __init__(self, path: str = DEFAULT_SESSION_PATHS['sqlite']):
+        self.path = path
+        self.local = threading.local()
+        with self.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    sid TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    expires REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS sessions_expires ON sessions (expires)")
+
+    def connection(self) -> sqlite3.Connection:
+        """One connection per thread; WAL lets worker processes read while another writes"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or getattr(self.local, 'pid', None) != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+
+    def load(self, sid: str) -> Optional[bytes]:
+        row = self.connection().execute("SELECT payload FROM sessions WHERE sid = ? AND expires > ?",
+                                        (sid, time.time())).fetchone()
+        return row[0] if row else None
+
+    def save(self, sid: str, payload: bytes, expires: float):
+        with self.connection() as conn:
+            conn.execute("INSERT OR REPLACE INTO sessions (sid, payload, expires) VALUES (?, ?, ?)",
+                         (sid, payload, expires))
+
+    def delete(self, sid: str):
+        with self.connection() as conn:
+            conn.execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+    def purge_expired(self) -> int:
+        with self.connection() as conn:
+            return conn.execute("DELETE FROM sessions WHERE expires <= ?", (time.time(),)).rowcount
+
+    def reset_after_fork(self):
+        self.local = threading.local()
+
+class FileSessionBackend(SessionBackend):
+    """One file per session, named by its ID; for hosts where a shared SQLite file is unwelcome"""
+
+    def __init__(self, directory: str = DEFAULT_SESSION_PATHS['filesystem']):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def session_path(self, sid: str) -> Path:
+        return self.directory / f"{sid}.session"
+
+    def read(self, path: Path) -> Optional[tuple]:
+        """(expires, payload) from a session file, None if it is missing or truncated"""
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if len(data) < FILE_HEADER.size:
+            return None
+        return FILE_HEADER.unpack_from(data)[0], data[FILE_HEADER.size:]
+
+    def load(self, sid: str) -> Optional[bytes]:
+        entry = self.read(self.session_path(sid))
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+    def save(self, sid: str, payload: bytes, expires: float):
+        # Write beside the target and rename so readers never see a partial file
+        path = self.session_path(sid)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp_path.write_bytes(FILE_HEADER.pack(expires) + payload)
+        tmp_path.replace(path)
+
+    def delete(self, sid: str):
+        self.session_path(sid).unlink(missing_ok=True)
+
+    def purge_expired(self) -> int:
+        now = time.time()
+        purged = 0
+        for path in self.directory.glob('*.session'):
+            entry = self.read(path)
+            if entry is None or entry[0] <= now:
+                path.unlink(missing_ok=True)
+                purged += 1
+        return purged
+
+SESSION_BACKENDS = {
+    'sqlite': SQLiteSessionBackend,
+    'filesystem': FileSessionBackend
+}
+
+def make_session_backend(kind: str = 'sqlite', location: Optional[str] = None,
+                         defaults: Dict[str, str] = DEFAULT_SESSION_PATHS) -> SessionBackend:
+    """Backend by name; location is the SQLite file or the directory, else the kind's entry in defaults"""
+    if kind not in SESSION_BACKENDS:
+        raise ValueError(f"Unknown session backend: {kind} (choose from {', '.join(SESSION_BACKENDS)})")
+    return SESSION_BACKENDS[kind](location or defaults[kind])
+
+class HandleStore:
+    """Records stored under opaque handles in a SessionBackend, so every worker process can find them
+
+    A bounded in-process LRU sits in front of the backend: the worker that stored a
+    record (or already loaded it) skips the decode. Records expire ttl_seconds after
+    they are stored, whichever worker asks. Callers must not mutate returned records.
+    """
+
+    def __init__(self, backend: SessionBackend, ttl_seconds: float = 3600, max_cached: int = 256,
+                 purge_interval: float = 300):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.max_cached = max_cached
+        self.purge_interval = purge_interval
+        self.cached = OrderedDict()
+        self.lock = threading.Lock()
+        self.last_purge = 0.0
+
+    def put(self, record: Dict[str, Any]) -> str:
+        """Store record under a new handle and return the handle"""
+        handle = secrets.token_urlsafe(32)
+        now = time.time()
+        self.backend.save(handle, encode_session(record), now + self.ttl_seconds)
+        self.remember(handle, (now + self.ttl_seconds, record))
+        if now - self.last_purge >= self.purge_interval:
+            self.last_purge = now
+            self.backend.purge_expired()
+        return handle
+
+    def get(self, handle: Optional[str]) -> Optional[Dict[str, Any]]:
+        """The record stored under handle, or None if it is unknown or expired"""
+        if not isinstance(handle, str) or not SESSION_ID.match(handle):
+            return None
+        with self.lock:
+            entry = self.cached.get(handle)
+            if entry is not None:
+                self.cached.move_to_end(handle)
+        if entry is not None and entry[0] > time.time():
+            return entry[1]
+
+        payload = self.backend.load(handle)
+        if payload is None:
+            return None
+        try:
+            record = decode_session(payload)
+        except (zlib.error, ValueError):
+            return None
+        # Expiry is only known to the backend here; cache briefly so it is re-checked soon
+        self.remember(handle, (time.time() + min(self.ttl_seconds, self.purge_interval), record))
+        return record
+
+    def remember(self, handle: str, entry: tuple):
+        with self.lock:
+            self.cached[handle] = entry
+            self.cached.move_to_end(handle)
+            while len(self.cached) > self.max_cached:
+                self.cached.popitem(last=False)
+
+    def reset_after_fork(self):
+        self.cached = OrderedDict()
+        self.lock = threading.Lock()
+        self.last_purge = 0.0
+        self.backend.reset_after_fork()
+
+class ServerSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its ID and whether it was read or changed"""
+
+    def __init__(self, initial: Optional[Dict[str, Any]] = None, sid: Optional[str] = None, new: bool = False):
+        def on_update(session):
+            session.modified = True
+            session.accessed = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.accessed = False
+
+    def __getitem__(self, key):
+        self.accessed = True
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.accessed = True
+        return super().get(key, default)
+
+    def setdefault(self, key, default=None):
+        self.accessed = True
+        return super().setdefault(key, default)
+
+class ServerSessionInterface(SessionInterface):
+    """Flask session interface over a SessionBackend
+
+    A session is stored only once something is written to it, and expires ttl_seconds
+    after its last write. Expired sessions are purged at most every purge_interval
+    seconds, by whichever request writes a session next.
+    """
+
+    def __init__(self, backend: SessionBackend, ttl_seconds: float = 86400, purge_interval: float = 300):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.purge_interval = purge_interval
+        self.last_purge = 0.0
+
+    def open_session(self, app, request) -> ServerSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid and SESSION_ID.match(sid):
+            payload = self.backend.load(sid)
+            if payload is not None:
+                try:
+                    return ServerSession(decode_session(payload), sid=sid)
+                except (zlib.error, ValueError):
+                    pass
+        return ServerSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session: ServerSession, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        # An emptied session is deleted along with its cookie; an untouched new one is never stored
+        if not session:
+            if session.modified and not session.new:
+                self.backend.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if session.modified:
+            now = time.time()
+            self.backend.save(session.sid, encode_session(dict(session)), now + self.ttl_seconds)
+            if now - self.last_purge >= self.purge_interval:
+                self.last_purge = now
+                self.backend.purge_expired()
+        elif not self.should_set_cookie(app, session):
+            return
+
+        response.set_cookie(
+            name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+    def reset_after_fork(self):
+        self.last_purge = 0.0
+        self.backend.reset_after_fork()
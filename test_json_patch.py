@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+JSON Patch Tests
+Patch application and the 400 the revalidation endpoint returns for malformed patches
+"""
+
+import pytest
+
+from json_patch import apply_patch, PatchError
+
+PROJECT = {
+    'site_data': {'zone_district': 'R-1', 'lot_area': 7500},
+    'building_data': {'building_height': 28, 'setbacks': {'front_setback': 25}},
+    'parking_data': {'parking_spaces': 2}
+}
+
+def test_replace_reports_changed_field():
+    patched, changed_fields = apply_patch(PROJECT, [
+        {'op': 'replace', 'path': '/building_data/setbacks/front_setback', 'value': 30}
+    ])
+    assert patched['building_data']['setbacks']['front_setback'] == 30
+    assert PROJECT['building_data']['setbacks']['front_setback'] == 25
+    assert changed_fields == ['building_data.setbacks.front_setback']
+
+@pytest.mark.parametrize('patch', [
+    ['bogus'],
+    [None],
+    [{'path': '/site_data/lot_area', 'value': 1}],
+    [{'op': 'replace', 'value': 1}],
+    [{'op': 'replace', 'path': 7, 'value': 1}],
+    [{'op': 'add', 'path': '/site_data/lot_area'}],
+    [{'op': 'replace', 'path': '/site_data/lot_area'}],
+    [{'op': 'test', 'path': '/site_data/lot_area'}],
+    {'op': 'replace', 'path': '/site_data/lot_area', 'value': 1}
+])
+def test_malformed_operation_raises_patch_error(patch):
+    with pytest.raises(PatchError):
+        apply_patch(PROJECT, patch)
+
+@pytest.mark.parametrize('patch', [['bogus'], [{'op': 'add', 'path': '/site_data/lot_area'}]])
+def test_revalidate_rejects_malformed_operation(patch):
+    import app as webapp
+
+    client = webapp.app.test_client()
+    handle = client.post('/api/validate-project', json=PROJECT).get_json()['validation_handle']
+    response = client.post('/api/revalidate-project', json={'validation_handle': handle, 'patch': patch})
+    assert response.status_code == 400
+    assert response.get_json()['error'].startswith('Invalid patch')
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Request Body Tests
+Bodies that are not JSON objects get a 400 with an error message, never a 500
+"""
+
+import json
+
+import pytest
+
+import app as webapp
+
+NOT_OBJECTS = ['null', '[1, 2]', '"project"', '7', '{not json']
+
+PROJECT = {
+    'project_info': {'project_name': 'Body Check'},
+    'site_data': {'zone_district': 'R-1', 'lot_area': 7500, 'lot_width': 75, 'lot_depth': 100},
+    'building_data': {'building_height': 25, 'setbacks': {'front_setback': 25, 'rear_setback': 25,
+                                                          'side_setback_left': 8, 'side_setback_right': 8}},
+    'parking_data': {'parking_spaces': 2}
+}
+
+@pytest.mark.parametrize('endpoint', ['/api/validate-project', '/api/plan-project', '/api/revalidate-project'])
+@pytest.mark.parametrize('body', NOT_OBJECTS)
+def test_non_object_body_is_rejected(endpoint, body):
+    response = webapp.app.test_client().post(endpoint, data=body, content_type='application/json')
+    assert response.status_code == 400
+    assert 'JSON object' in response.get_json()['error']
+
+@pytest.mark.parametrize('endpoint', ['/api/validate-project', '/api/plan-project'])
+def test_non_object_section_is_rejected(endpoint):
+    response = webapp.app.test_client().post(endpoint, json=dict(PROJECT, site_data=5))
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Field must be a JSON object: site_data'
+
+def test_patch_that_breaks_a_section_is_rejected():
+    client = webapp.app.test_client()
+    handle = client.post('/api/validate-project', json=PROJECT).get_json()['validation_handle']
+    response = client.post('/api/revalidate-project', json={
+        'validation_handle': handle,
+        'patch': [{'op': 'replace', 'path': '/site_data', 'value': None}]
+    })
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Invalid patch: Field must be a JSON object: site_data'
+
+def test_batch_reports_non_object_lines():
+    lines = ['null', '[1]', json.dumps(PROJECT)]
+    response = webapp.app.test_client().post('/api/validate-batch', data='\n'.join(lines) + '\n',
+                                             content_type='application/x-ndjson')
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [record.get('error') for record in records[:2]] == ['Project must be a JSON object'] * 2
+    assert 'error' not in records[2]
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Response Layer Tests
+JSON bodies orjson writes differently or cannot write at all
+"""
+
+import json
+
+import pytest
+
+import app as webapp
+from response_layer import orjson
+
+SITE_DATA = {'zone_district': 'R-1', 'lot_area': 7500, 'lot_width': 75, 'lot_depth': 100}
+
+def test_integer_wider_than_64_bits_falls_back_to_default_provider():
+    big = 10 ** 20
+    response = webapp.app.test_client().post('/api/plan-project', json={
+        'site_data': dict(SITE_DATA, lot_area=big),
+        'project_info': {'project_id': 'big-lot'}
+    })
+    assert response.status_code == 200
+    assert response.get_json()['guidance']['site_requirements'][0]['current_values']['lot_area'] == big
+
+def test_non_ascii_text_round_trips():
+    name = 'Café Résidence – 東京'
+    response = webapp.app.test_client().post('/api/plan-project', json={
+        'site_data': SITE_DATA,
+        'project_info': {'project_id': 'non-ascii', 'project_name': name}
+    })
+    assert response.status_code == 200
+    assert response.get_json()['project_name'] == name
+    assert json.loads(response.get_data())['project_name'] == name
+
+@pytest.mark.skipif(orjson is None, reason='orjson not installed')
+def test_orjson_writes_non_ascii_as_utf8():
+    with webapp.app.app_context():
+        body = webapp.app.json.response({'name': 'Café'}).get_data()
+    assert 'Café'.encode('utf-8') in body
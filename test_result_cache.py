@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Result Cache Tests
+Cache keys carry the code version, and cached plans are stamped per response
+"""
+
+import time
+
+from result_cache import ResultCache
+
+def test_code_version_separates_entries(tmp_path):
+    path = str(tmp_path / 'results.sqlite')
+    old_code = ResultCache(path, code_version='old')
+    old_code.put('validate', 'ruleset', {'lot_area': 7500}, {'status': 'stale'})
+    assert old_code.get('validate', 'ruleset', {'lot_area': 7500}) == {'status': 'stale'}
+    assert ResultCache(path, code_version='new').get('validate', 'ruleset', {'lot_area': 7500}) is None
+
+def test_cached_plan_gets_a_fresh_timestamp():
+    import app as webapp
+
+    project = {
+        'site_data': {'zone_district': 'R-1', 'lot_area': 7321, 'lot_width': 73, 'lot_depth': 100},
+        'project_info': {'project_id': 'timestamp-check'}
+    }
+    client = webapp.app.test_client()
+    first = client.post('/api/plan-project', json=project).get_json()
+    hits = webapp.result_cache.stats()['namespaces']['plan']['hits']
+    time.sleep(0.01)
+    second = client.post('/api/plan-project', json=project).get_json()
+    assert webapp.result_cache.stats()['namespaces']['plan']['hits'] == hits + 1
+    assert second['planning_timestamp'] > first['planning_timestamp']
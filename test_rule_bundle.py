@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Rule Bundle Tests
+A bundle whose header fails to check is rejected without leaving its file mapped
+"""
+
+import marshal
+import mmap
+
+import pytest
+
+import rule_bundle
+from rule_bundle import RuleBundle, HEADER, BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION
+
+REAL_MMAP = mmap.mmap
+
+def header(magic=BUNDLE_MAGIC, format_version=BUNDLE_FORMAT_VERSION):
+    return HEADER.pack(magic, format_version, marshal.version, 0, 0, b'0' * 16, b'0' * 40, b'0' * 40)
+
+@pytest.mark.parametrize('contents', [
+    b'HCRULES',
+    header(magic=b'NOTRULES'),
+    header(format_version=BUNDLE_FORMAT_VERSION + 1),
+    header()[:-40] + b'\xff' * 40
+])
+def test_bad_header_closes_mapping(tmp_path, monkeypatch, contents):
+    mappings = []
+
+    def tracked_mmap(*args, **kwargs):
+        mappings.append(REAL_MMAP(*args, **kwargs))
+        return mappings[-1]
+
+    monkeypatch.setattr(rule_bundle.mmap, 'mmap', tracked_mmap)
+    bundle_path = tmp_path / rule_bundle.BUNDLE_FILENAME
+    bundle_path.write_bytes(contents)
+
+    with pytest.raises(ValueError):
+        RuleBundle(bundle_path)
+    assert [mapping.closed for mapping in mappings] == [True]
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Rule Compiler Tests
+Thresholds read from the numeric constants scanned out of rule text
+"""
+
+from rule_compiler import compile_ruleset, discard_compiled
+from rule_constants import scan_rule
+
+ZONES = ('R-1', 'R-1(7000)')
+CHECK_DEFAULTS = {
+    'min_lot_area': 1, 'max_lot_area': 1, 'min_lot_width': 1, 'front_setback': 1, 'rear_setback': 1,
+    'side_setback_left': 1, 'side_setback_right': 1, 'max_height': 1, 'max_far': 1, 'required_parking_spaces': 1
+}
+
+RULES = [
+    {'rule': 'Minimum lot sizes', 'Constants': {
+        'Numerical Values': 'Minimum width: 60 ft\nLot Area Ranges (sf):\n- R-1: Min 6,000; Max 9,999\n'
+                            '- R-1(7000): Min 7,000; Max 13,999'}},
+    {'rule': 'Setbacks by zone', 'Constants': {
+        'R-1_Setbacks': 'Front: 20 ft (or Contextual), Rear: 20 ft, Interior Side: 6 ft, Street Side: 12 ft',
+        'R-1(7000)_Setbacks': 'Front: 20 ft, Rear: 20 ft, Interior Side: 8 ft, Street Side: 16 ft'}},
+    {'rule': 'Gross floor area', 'Constants': {'tier_1_gfa_ratio': '45%'}}
+]
+
+def compile_rules(rules):
+    ruleset = compile_ruleset(rules, {zone: dict(CHECK_DEFAULTS) for zone in ZONES})
+    discard_compiled(ruleset.fingerprint)
+    return ruleset
+
+def test_thresholds_come_from_labelled_constants():
+    ruleset = compile_rules(RULES)
+    assert [ruleset.threshold('R-1(7000)', check) for check in ('min_lot_area', 'max_lot_area', 'min_lot_width')] == \
+        [7000, 13999, 60]
+    assert ruleset.threshold('R-1', 'max_lot_area') == 9999
+    assert [ruleset.threshold('R-1', check) for check in ('front_setback', 'rear_setback', 'side_setback_left')] == \
+        [20, 20, 6]
+    assert ruleset.threshold('R-1(7000)', 'side_setback_right') == 8
+    assert ruleset.threshold('R-1', 'max_far') == 0.45
+
+def test_load_time_constants_are_used_when_present():
+    rules = [dict(rule, numeric_constants=scan_rule(rule)) for rule in RULES]
+    rules[1]['numeric_constants'] = [constant._replace(value=constant.value + 1) for constant in rules[1]['numeric_constants']]
+    assert compile_rules(rules).threshold('R-1', 'rear_setback') == 21
+
+def test_missing_label_falls_back_to_default():
+    rules = [{'rule': 'Setbacks by zone', 'Constants': {'R-1_Setbacks': 'Front: 20 ft'}}]
+    ruleset = compile_rules(rules)
+    assert ruleset.threshold('R-1', 'front_setback') == 20
+    assert ruleset.threshold('R-1', 'rear_setback') == CHECK_DEFAULTS['rear_setback']
+    assert {'check': 'rear_setback', 'zone': 'R-1', 'default': 1, 'reason': 'no compilable constant'} in ruleset.fallbacks
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Rule Reload Tests
+Swapping in a new corpus releases the old generation's compiled rules
+"""
+
+import json
+
+import rule_compiler
+from reverse_compliance_validator import ReverseComplianceValidator
+from rule_reload import LiveRuleset
+
+def write_page(rules_directory, rear_setback):
+    page = {'success': True, 'analysis': {'extracted_rules': [{
+        'rule': 'Standard Setbacks by Zone',
+        'Constants': {'R-1_Setbacks': f'Front: 20 ft, Rear: {rear_setback} ft, Interior Side: 6 ft'}
+    }]}}
+    (rules_directory / 'Page_01_rules.json').write_text(json.dumps(page))
+
+def test_reloads_do_not_grow_the_compile_cache(tmp_path):
+    write_page(tmp_path, 20)
+    live_rules = LiveRuleset({'validator': ReverseComplianceValidator}, rules_directory=str(tmp_path))
+    assert live_rules.current['validator'].compiled_rules.threshold('R-1', 'rear_setback') == 20
+    baseline = len(rule_compiler._compiled_cache)
+
+    for rear_setback in range(21, 27):
+        write_page(tmp_path, rear_setback)
+        assert live_rules.check_for_update()
+        assert live_rules.current['validator'].compiled_rules.threshold('R-1', 'rear_setback') == rear_setback
+        assert len(rule_compiler._compiled_cache) == baseline
+    assert live_rules.reload_count == 6
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Rule Shard Tests
+Zone shards share the common rules and validate exactly as the unsharded validator does
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+import app as webapp
+import rule_compiler
+from rule_reload import LiveRuleset
+from rule_shards import RuleShards, ShardedValidator, build_rule_shards
+from validation_result import result_dicts
+
+RULES = [
+    {'rule': 'Maximum Building Height', 'Constants': {'Height': '30 ft'}},
+    {'rule': 'Standard Setbacks by Zone',
+     'Constants': {'R-1_Setbacks': 'Front: 20 ft, Rear: 20 ft, Interior Side: 6 ft'}},
+    {'rule': 'Accessory Structure Height', 'Constants': {'Height': '12 ft'}},
+    {'rule': 'Large Lot Setbacks', 'Qualifiers': {'Applicability': 'R-1(20000) district only'},
+     'Constants': {'Rear': '30 ft'}}
+]
+
+def write_page(rules_directory, rules):
+    page = {'success': True, 'analysis': {'extracted_rules': rules}}
+    (rules_directory / 'Page_01_rules.json').write_text(json.dumps(page))
+
+def rule_titles(rules):
+    return [rule['rule'] for rule in rules]
+
+def test_zone_shards_hold_only_zone_rules(tmp_path):
+    write_page(tmp_path, RULES)
+    shards = RuleShards(build_rule_shards(str(tmp_path)))
+    try:
+        assert rule_titles(rule for _, rule in shards.common_rules()) == ['Maximum Building Height', 'Accessory Structure Height']
+        assert rule_titles(rule for _, rule in shards.rules('R-1')) == ['Standard Setbacks by Zone']
+        assert rule_titles(rule for _, rule in shards.rules('R-1(20000)')) == ['Standard Setbacks by Zone', 'Large Lot Setbacks']
+        assert shards.shard_zone('r-1 (20000)') == 'R-1(20000)'
+        assert shards.shard_zone('R-1(7000)') == 'R-1'
+        assert shards.shard_zone('') == 'R-1'
+    finally:
+        shards.close()
+
+def test_shard_validators_share_common_rules_in_load_order(tmp_path):
+    write_page(tmp_path, RULES)
+    sharded = ShardedValidator({'test': str(tmp_path)})
+    large_lot = sharded.zone_validator('R-1(20000)')
+    standard = sharded.zone_validator('R-1')
+
+    assert rule_titles(large_lot.all_rules) == rule_titles(RULES)
+    assert rule_titles(standard.all_rules) == rule_titles(RULES[:3])
+    assert large_lot.all_rules[0] is standard.all_rules[0]
+
+@pytest.fixture(scope='module')
+def rules_directory():
+    return str(webapp.live_rules.current.rules_directory)
+
+@pytest.fixture(scope='module')
+def unsharded_validator(rules_directory):
+    return webapp.build_rules_validator(rules_directory)
+
+@pytest.fixture(scope='module')
+def sharded_validator(rules_directory):
+    return ShardedValidator({'test': rules_directory}, max_shards=len(webapp.ZONE_CONFIG))
+
+@pytest.mark.parametrize('zone', list(webapp.ZONE_CONFIG))
+def test_sharded_validation_matches_unsharded(zone, sharded_validator, unsharded_validator):
+    unsharded = unsharded_validator
+    shard = sharded_validator.zone_validator(zone)
+    assert webapp.zone_setbacks(shard.compiled_rules, zone) == webapp.zone_setbacks(unsharded.compiled_rules, zone)
+
+    project = webapp.build_project_template(zone, datetime.now().strftime("%Y-%m-%d"),
+                                            webapp.zone_setbacks(unsharded.compiled_rules, zone))
+    project['building_data']['height'] = 40
+    sharded_results = sharded_validator.perform_comprehensive_validation(project)['results_by_validator']
+    unsharded_results = unsharded.perform_comprehensive_validation(project)['results_by_validator']
+    assert {name: result_dicts(results) for name, results in sharded_results.items()} == \
+        {name: result_dicts(results) for name, results in unsharded_results.items()}
+
+def test_app_builds_sharded_validator(monkeypatch, rules_directory, unsharded_validator):
+    monkeypatch.setattr(webapp, 'rule_shards', 2)
+    validator = webapp.build_validator(rules_directory)
+    assert isinstance(validator, ShardedValidator)
+    shard = webapp.zone_validator(validator, 'R-1(7000)')
+    assert shard.compiled_rules.threshold('R-1(7000)', 'rear_setback') == \
+        unsharded_validator.compiled_rules.threshold('R-1(7000)', 'rear_setback')
+
+def test_reloads_release_shard_compiled_rules(tmp_path):
+    write_page(tmp_path, RULES)
+    live_rules = LiveRuleset({'validator': lambda rules_directory: ShardedValidator({'test': rules_directory})},
+                             rules_directory=str(tmp_path))
+    live_rules.current['validator'].zone_validator('R-1')
+    baseline = len(rule_compiler._compiled_cache)
+
+    for height in range(31, 36):
+        write_page(tmp_path, [{'rule': 'Maximum Building Height', 'Constants': {'Height': f'{height} ft'}}] + RULES[1:])
+        assert live_rules.check_for_update()
+        live_rules.current['validator'].zone_validator('R-1')
+        assert len(rule_compiler._compiled_cache) == baseline
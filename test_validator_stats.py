@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Validator Stats Tests
+Fail-fast counters stay exact when request threads record concurrently
+"""
+
+import threading
+
+from reverse_compliance_validator import ValidatorStats, VALIDATOR_ORDER
+
+def test_concurrent_records_are_all_counted():
+    stats = ValidatorStats()
+    threads, records = 8, 5000
+
+    def work():
+        for i in range(records):
+            for name in VALIDATOR_ORDER:
+                stats.record(name, 1.0, i % 2 == 0)
+            stats.fail_fast_order()
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    summary = stats.summary()
+    for name in VALIDATOR_ORDER:
+        assert stats.runs[name] == threads * records
+        assert stats.total_ms[name] == threads * records
+        assert stats.critical_runs[name] == threads * records // 2
+        assert summary[name]['mean_ms'] == 1.0
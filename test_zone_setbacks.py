@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Zone Setback Tests
+Templates and planning guidance use the setbacks validation enforces, and template ETags change with them
+"""
+
+import pytest
+
+import app as webapp
+from rule_reload import Ruleset
+
+@pytest.mark.parametrize('zone', list(webapp.ZONE_CONFIG))
+def test_project_template_passes_setback_checks(zone):
+    client = webapp.app.test_client()
+    template = client.get(f'/api/project-template/{zone}').get_json()
+    result = client.post('/api/validate-project', json=template).get_json()
+    assert [v for v in result['all_violations'] if 'setback' in str(v).lower()] == []
+
+@pytest.mark.parametrize('zone', list(webapp.ZONE_CONFIG))
+def test_planning_guidance_quotes_compiled_setbacks(zone):
+    compiled_rules = webapp.zone_validator(webapp.live_rules.current['validator'], zone).compiled_rules
+    setbacks = webapp.zone_setbacks(compiled_rules, zone)
+    site_data = {'zone_district': zone, 'lot_area': 8000, 'lot_width': 80, 'lot_depth': 100}
+    guidance = webapp.generate_planning_guidance({'site_data': site_data, 'project_info': {}}, compiled_rules)
+    envelope = guidance['guidance']['site_requirements'][1]
+    assert f"Rear {setbacks['rear_setback']}'" in envelope['requirements'][-1]
+    assert envelope['buildable_area']['width'] == 80 - setbacks['side_setback_left'] - setbacks['side_setback_right']
+
+def test_template_etag_follows_ruleset_version():
+    ruleset = webapp.live_rules.current
+    reloaded = Ruleset(ruleset.rules_directory, ruleset.engines, ruleset.stat_digest, 'f' * 40)
+    body, etag = webapp.project_template_response('R-1', ruleset)
+    reloaded_body, reloaded_etag = webapp.project_template_response('R-1', reloaded)
+    assert reloaded_body == body
+    assert reloaded_etag != etag
+
+def test_template_is_revalidated_on_every_use():
+    client = webapp.app.test_client()
+    response = client.get('/api/project-template/R-1')
+    assert response.headers['Cache-Control'] == 'public, no-cache'
+    revalidated = client.get('/api/project-template/R-1', headers={'If-None-Match': response.headers['ETag']})
+    assert revalidated.status_code == 304
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Validation Result
+Compact check result records with shared enums and messages formatted only on access
+"""
+
+from enum import Enum
+from typing import Dict, List, Any, Optional, Tuple
+
+class Status(Enum):
+    COMPLIANT = 'COMPLIANT'
+    VIOLATION = 'VIOLATION'
+    WARNING = 'WARNING'
+
+class Criticality(Enum):
+    CRITICAL = 'CRITICAL'
+    HIGH = 'HIGH'
+    MEDIUM = 'MEDIUM'
+
+class MessageTemplate:
+    """Format strings for a check's message, expected and actual text, shared by every result"""
+
+    __slots__ = ('fields', 'message', 'expected', 'actual')
+
+    def __init__(self, fields: Tuple[str, ...], message: str, expected: str, actual: str):
+        self.fields = fields
+        self.message = message
+        self.expected = expected
+        self.actual = actual
+
+    def render(self, part: str, values: Tuple[Any, ...]) -> str:
+        return getattr(self, part).format(**dict(zip(self.fields, values)))
+
+class CheckResult:
+    """One check outcome; reads like the result dicts it replaces but stores only raw values
+
+    Supports result['key'] and result.get('key'); message, expected and actual are
+    formatted from the template each time they are read. to_dict() gives the JSON form.
+    """
+
+    __slots__ = ('rule_id', 'rule_title', 'status', 'criticality', 'template', 'values',
+                 'violation_type', 'source_rule', 'stop_condition')
+
+    def __init__(self, rule_id: str, rule_title: str, status: Status, criticality: Criticality,
+                 template: MessageTemplate, values: Tuple[Any, ...], source_rule: str,
+                 violation_type: Optional[str] = None, stop_condition: bool = False):
+        self.rule_id = rule_id
+        self.rule_title = rule_title
+        self.status = status
+        self.criticality = criticality
+        self.template = template
+        self.values = values
+        self.source_rule = source_rule
+        self.violation_type = violation_type
+        self.stop_condition = stop_condition
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'status':
+            return self.status.value
+        if key == 'criticality':
+            return self.criticality.value
+        if key in ('message', 'expected', 'actual'):
+            return self.template.render(key, self.values)
+        if key in ('rule_id', 'rule_title', 'source_rule'):
+            return getattr(self, key)
+        if key == 'violation_type' and self.violation_type is not None:
+            return self.violation_type
+        if key == 'stop_condition' and self.stop_condition:
+            return True
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with the same keys, in the same order, as the original result dicts"""
+        result = {
+            'rule_id': self.rule_id,
+            'rule_title': self.rule_title,
+            'status': self.status.value,
+            'criticality': self.criticality.value,
+            'message': self.template.render('message', self.values),
+            'expected': self.template.render('expected', self.values),
+            'actual': self.template.render('actual', self.values)
+        }
+        if self.violation_type is not None:
+            result['violation_type'] = self.violation_type
+        result['source_rule'] = self.source_rule
+        if self.stop_condition:
+            result['stop_condition'] = True
+        return result
+
+    def __repr__(self):
+        return f"CheckResult({self.rule_id}, {self.status.value}, {self['message']!r})"
+
+def result_dicts(results: List[Any]) -> List[Dict[str, Any]]:
+    """Serialize a list that may mix CheckResult records and plain result dicts"""
+    return [result.to_dict() if isinstance(result, CheckResult) else result for result in results]
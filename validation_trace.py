@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Validation Trace
+Pluggable reporters for validator events: silent, console, and timing spans
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, Any
+
+class ValidationReporter:
+    """Reporter interface; every hook is a no-op so serving paths pay nothing"""
+
+    # When False the validator skips timing entirely
+    records_spans = False
+
+    def on_rules_loaded(self, rule_count: int):
+        pass
+
+    def on_load_error(self, rule_file: str, error: Exception):
+        pass
+
+    def on_rules_compiled(self, compiled_rules):
+        pass
+
+    def on_span(self, name: str, duration_ms: float):
+        pass
+
+    def on_validation_complete(self, validation_results: Dict[str, Any]):
+        pass
+
+class ConsoleReporter(ValidationReporter):
+    """Prints load status, summaries and every result to stdout (for CLI and demos)"""
+
+    def on_rules_loaded(self, rule_count: int):
+        print(f"🔍 Reverse Validator initialized with {rule_count} rules")
+
+    def on_load_error(self, rule_file: str, error: Exception):
+        print(f"❌ Error loading {rule_file}: {error}")
+
+    def on_rules_compiled(self, compiled_rules):
+        fallback_checks = sorted({fallback['check'] for fallback in compiled_rules.fallbacks})
+        if fallback_checks:
+            print(f"⚠️  No compilable rule for {', '.join(fallback_checks)}; using default thresholds")
+        if compiled_rules.uncompiled_rules:
+            print(f"⚠️  {len(compiled_rules.uncompiled_rules)} candidate rules could not be compiled")
+
+    def on_validation_complete(self, validation_results: Dict[str, Any]):
+        summary = validation_results['summary']
+        violations = validation_results['violations']
+        warnings = validation_results['warnings']
+        compliant = validation_results['compliant']
+
+        print(f"🔍 REVERSE COMPLIANCE VALIDATION")
+        print(f"Project: {summary['project_name']}")
+        print("=" * 60)
+
+        # Print summary
+        print(f"📊 VALIDATION SUMMARY:")
+        print(f"   Overall Status: {'✅ COMPLIANT' if summary['overall_status'] == 'COMPLIANT' else '❌ NON-COMPLIANT'}")
+        print(f"   Can Proceed: {'✅ YES' if summary['can_proceed'] else '❌ NO'}")
+        print(f"   Rules Checked: {summary['total_rules_checked']}")
+        print(f"   Compliant: {len(compliant)}")
+        print(f"   Violations: {len(violations)}")
+        print(f"   Warnings: {len(warnings)}")
+        print(f"   Critical Violations: {summary['critical_violations']}")
+        print(f"   Compliance Rate: {summary['compliance_percentage']:.1f}%")
+
+        # Print detailed results
+        if violations:
+            print(f"\n🚨 VIOLATIONS:")
+            for violation in violations:
+                critical_flag = " [CRITICAL]" if violation['criticality'] == 'CRITICAL' else ""
+                print(f"   ❌ {violation['rule_title']}: {violation['message']}{critical_flag}")
+
+        if warnings:
+            print(f"\n⚠️  WARNINGS:")
+            for warning in warnings:
+                print(f"   ⚠️  {warning['rule_title']}: {warning['message']}")
+
+        if compliant and len(compliant) <= 10:  # Show compliant items if not too many
+            print(f"\n✅ COMPLIANT ITEMS:")
+            for comp in compliant[:5]:  # Show first 5
+                print(f"   ✅ {comp['rule_title']}: {comp['message']}")
+            if len(compliant) > 5:
+                print(f"   ... and {len(compliant) - 5} more compliant items")
+
+class SpanRecorder(ValidationReporter):
+    """Records a timing span per validator family in a bounded, thread-safe buffer"""
+
+    records_spans = True
+
+    def __init__(self, max_spans: int = 10000):
+        self.spans = deque(maxlen=max_spans)
+        self.lock = threading.Lock()
+
+    def on_span(self, name: str, duration_ms: float):
+        with self.lock:
+            self.spans.append((name, duration_ms))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, total, mean and max milliseconds per span name"""
+        with self.lock:
+            spans = list(self.spans)
+
+        stats = {}
+        for name, duration_ms in spans:
+            entry = stats.setdefault(name, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] += duration_ms
+            entry['max_ms'] = max(entry['max_ms'], duration_ms)
+
+        for entry in stats.values():
+            entry['mean_ms'] = entry['total_ms'] / entry['count']
+        return stats
+
+    def clear(self):
+        with self.lock:
+            self.spans.clear()
+
+    def reset_after_fork(self):
+        """Fresh lock and buffer in a forked child; the parent's spans are not the child's"""
+        self.lock = threading.Lock()
+        self.spans = deque(maxlen=self.spans.maxlen)
+
+class MultiReporter(ValidationReporter):
+    """Fans every event out to several reporters"""
+
+    def __init__(self, *reporters: ValidationReporter):
+        self.reporters: List[ValidationReporter] = list(reporters)
+        self.records_spans = any(reporter.records_spans for reporter in self.reporters)
+
+    def on_rules_loaded(self, rule_count: int):
+        for reporter in self.reporters:
+            reporter.on_rules_loaded(rule_count)
+
+    def on_load_error(self, rule_file: str, error: Exception):
+        for reporter in self.reporters:
+            reporter.on_load_error(rule_file, error)
+
+    def on_rules_compiled(self, compiled_rules):
+        for reporter in self.reporters:
+            reporter.on_rules_compiled(compiled_rules)
+
+    def on_span(self, name: str, duration_ms: float):
+        for reporter in self.reporters:
+            reporter.on_span(name, duration_ms)
+
+    def on_validation_complete(self, validation_results: Dict[str, Any]):
+        for reporter in self.reporters:
+            reporter.on_validation_complete(validation_results)